@@ -0,0 +1,6 @@
+"""Standalone performance benchmarks.
+
+Run from the backend directory, e.g. ``uv run python -m benchmarks.db_read_locks``.
+Benchmarks use temporary databases and fake LLM/embedding clients, so they
+need no API key and never touch ``interview.db``.
+"""
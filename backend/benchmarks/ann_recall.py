@@ -0,0 +1,91 @@
+"""Recall@k and latency of the IVF-flat index against exact top-k search.
+
+Vectors are synthetic clustered embeddings (topic centre + noise), which is
+closer to real summary embeddings than uniform noise; queries are noisy
+copies of stored vectors.
+
+Usage: uv run python -m benchmarks.ann_recall [--counts 10000 20000] [--nprobe 4 8 16 32]
+"""
+
+import argparse
+import statistics
+import time
+
+import numpy as np
+
+from src.shared.ivf import IvfFlatIndex, default_nlist, train_centroids
+from src.shared.similarity import normalize_rows, top_k_normalized
+
+
+def _corpus(count: int, dims: int, rng: np.random.Generator) -> np.ndarray:
+    topics = rng.normal(size=(max(1, count // 20), dims))
+    labels = rng.integers(len(topics), size=count)
+    return normalize_rows(topics[labels] + rng.normal(scale=1.5, size=(count, dims)))
+
+
+def _ivf_search(ann, rows, ids, query, k, nprobe):
+    cand = ann.candidates(query, nprobe)
+    return top_k_normalized(query, [ids[i] for i in cand], rows[cand], k)
+
+
+def _measure(search, queries, exact, k):
+    recalls, latencies = [], []
+    for query, truth in zip(queries, exact, strict=True):
+        start = time.perf_counter()
+        found = search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len({i for i, _ in found} & truth) / k)
+    return statistics.mean(recalls), statistics.median(latencies)
+
+
+def _queries(rows: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    """Noisy copies of random stored rows."""
+    picks = rng.integers(len(rows), size=count)
+    noise = rng.normal(scale=0.5 / np.sqrt(rows.shape[1]), size=(count, rows.shape[1]))
+    return (rows[picks] + noise).astype(np.float32)
+
+
+def _bench(count: int, args, rng: np.random.Generator) -> None:
+    rows = _corpus(count, args.dims, rng)
+    ids = [str(i) for i in range(count)]
+    queries = _queries(rows, args.queries, rng)
+
+    def exact_search(q):
+        return top_k_normalized(q, ids, rows, args.k)
+
+    exact = [{i for i, _ in exact_search(q)} for q in queries]
+    start = time.perf_counter()
+    ann = IvfFlatIndex(train_centroids(rows, default_nlist(count)), count)
+    ann.add(rows)
+    build_s = time.perf_counter() - start
+
+    _, exact_ms = _measure(exact_search, queries, exact, args.k)
+    print(f"\n{count} vectors, {args.dims} dims, nlist={len(ann.centroids)}")
+    print(f"build {build_s:.1f}s; exact median {exact_ms:.2f}ms")
+    print(f"{'nprobe':>8}{'recall@' + str(args.k):>12}{'median ms':>12}")
+    for nprobe in args.nprobe:
+        recall, ms = _measure(
+            lambda q, n=nprobe: _ivf_search(ann, rows, ids, q, args.k, n),
+            queries,
+            exact,
+            args.k,
+        )
+        print(f"{nprobe:>8}{recall:>12.3f}{ms:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 20_000])
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for count in args.counts:
+        _bench(count, args, rng)
+
+
+if __name__ == "__main__":
+    main()
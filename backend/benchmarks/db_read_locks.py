@@ -0,0 +1,87 @@
+"""Concurrent read throughput per DB_LOCK_MODE as worker processes scale.
+
+Each worker is a separate process (like the MCP server, graph and extract
+workers sharing one interview.db) issuing primary-key reads through the ORM.
+
+Usage: uv run python -m benchmarks.db_read_locks [--reads 300] [--workers 1 2 4 8]
+"""
+
+import argparse
+import asyncio
+import importlib
+import multiprocessing as mp
+import os
+import tempfile
+import time
+import uuid
+
+MODES = ("exclusive", "shared", "none")
+
+
+async def _seed(user_ids: list[uuid.UUID]) -> None:
+    from src.infrastructure.db import close_pools
+    from src.infrastructure.db import managers as db
+
+    for user_id in user_ids:
+        await db.UsersManager.create(
+            user_id, db.User(id=user_id, name="bench", mode="auto")
+        )
+    await close_pools()
+
+
+async def _read_loop(user_ids: list[uuid.UUID], reads: int) -> None:
+    from src.infrastructure.db import close_pools
+    from src.infrastructure.db import managers as db
+
+    for i in range(reads):
+        await db.UsersManager.get_by_id(user_ids[i % len(user_ids)])
+    await close_pools()
+
+
+def _worker(db_path: str, mode: str, user_ids, reads: int, barrier) -> None:
+    os.environ["INTERVIEW_DB_PATH"] = db_path
+    os.environ["DB_LOCK_MODE"] = mode
+    # Import before the barrier so interpreter start-up is not timed
+    importlib.import_module("src.infrastructure.db.managers")
+    barrier.wait()
+    asyncio.run(_read_loop(user_ids, reads))
+
+
+def _run(db_path: str, mode: str, workers: int, user_ids, reads: int) -> float:
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers + 1)
+    procs = [
+        ctx.Process(target=_worker, args=(db_path, mode, user_ids, reads, barrier))
+        for _ in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - start
+    return workers * reads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=300, help="Reads per worker")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        os.environ["INTERVIEW_DB_PATH"] = db_path
+        user_ids = [uuid.uuid4() for _ in range(100)]
+        asyncio.run(_seed(user_ids))
+
+        print(f"{'mode':<10}" + "".join(f"{w:>10}w" for w in args.workers))
+        for mode in MODES:
+            rates = [_run(db_path, mode, w, user_ids, args.reads) for w in args.workers]
+            print(f"{mode:<10}" + "".join(f"{r:>11.0f}" for r in rates))
+        print("(reads/second, all workers combined)")
+
+
+if __name__ == "__main__":
+    main()
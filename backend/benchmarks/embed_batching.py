@@ -0,0 +1,61 @@
+"""Embedding API calls and wall time for a burst of summaries, batched vs not.
+
+A fake aembed_documents call costs a fixed round trip plus a small per-text
+time, roughly like a remote embedding API, and at most --max-inflight calls
+run at once (connection pool / provider concurrency limit). Every summary is
+embedded by its own concurrent caller, as extract workers do.
+
+Usage: uv run python -m benchmarks.embed_batching [--summaries 64] [--rtt-ms 150]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.shared.batching import MicroBatcher
+
+
+class _FakeEmbeddings:
+    def __init__(self, rtt: float, per_text: float, max_inflight: int) -> None:
+        self.rtt = rtt
+        self.per_text = per_text
+        self.calls = 0
+        self._slots = asyncio.Semaphore(max_inflight)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        async with self._slots:
+            await asyncio.sleep(self.rtt + self.per_text * len(texts))
+        return [[0.0] for _ in texts]
+
+
+async def _run(args, batch_size: int) -> tuple[int, float]:
+    client = _FakeEmbeddings(
+        args.rtt_ms / 1000, args.per_text_ms / 1000, args.max_inflight
+    )
+    batcher = MicroBatcher(client.aembed_documents, batch_size, args.wait_ms / 1000)
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(batcher.submit(f"summary {i}") for i in range(args.summaries))
+    )
+    return client.calls, (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--summaries", type=int, default=64)
+    parser.add_argument("--rtt-ms", type=float, default=150.0)
+    parser.add_argument("--per-text-ms", type=float, default=2.0)
+    parser.add_argument("--max-inflight", type=int, default=4)
+    parser.add_argument("--wait-ms", type=float, default=50.0)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    print(f"{'batch size':>10}{'API calls':>11}{'wall ms':>10}")
+    for batch_size in args.batch_sizes:
+        calls, wall_ms = asyncio.run(_run(args, batch_size))
+        print(f"{batch_size:>10}{calls:>11}{wall_ms:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
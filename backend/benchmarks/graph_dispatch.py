@@ -0,0 +1,88 @@
+"""Graph worker dispatch: shared FIFO queue vs per-user KeyedChannel.
+
+A burst of messages arrives at once: one chatty user sends --chatty messages
+and --users other users send --per-user each. Every message costs a fake
+graph call of --graph-ms. For each pool size the benchmark reports
+throughput, how often one user's messages overlapped (the race the keyed
+channel removes) and p95 latency of the light users' messages (fairness).
+
+Usage: uv run python -m benchmarks.graph_dispatch [--workers 1 2 4 8]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.runtime.queues import BoundedChannel, KeyedChannel
+
+
+def _messages(args) -> list[tuple[str, int]]:
+    """Interleave arrivals as a flood would: the chatty user arrives first."""
+    burst = [("chatty", i) for i in range(args.chatty)]
+    for i in range(args.per_user):
+        burst += [(f"user{u}", i) for u in range(args.users)]
+    return burst
+
+
+class _Run:
+    """One burst through one channel type with a given number of workers."""
+
+    def __init__(self, args, keyed: bool) -> None:
+        self.args = args
+        self.keyed = keyed
+        self.channel = KeyedChannel(lambda m: m[0]) if keyed else BoundedChannel()
+        self.running: set[str] = set()
+        self.overlaps = 0
+        self.light_latencies: list[float] = []
+        self.start = 0.0
+
+    async def worker(self) -> None:
+        while True:
+            item = await self.channel.get()
+            user = item[0]
+            self.overlaps += user in self.running
+            self.running.add(user)
+            await asyncio.sleep(self.args.graph_ms / 1000)
+            self.running.discard(user)
+            if user != "chatty":
+                self.light_latencies.append(time.perf_counter() - self.start)
+            if self.keyed:
+                self.channel.task_done(item)
+            else:
+                self.channel.task_done()
+
+    async def run(self, workers: int) -> tuple[float, int, float]:
+        self.start = time.perf_counter()
+        for message in _messages(self.args):
+            self.channel.admit(message)
+        tasks = [asyncio.create_task(self.worker()) for _ in range(workers)]
+        await self.channel.join()
+        elapsed = time.perf_counter() - self.start
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        total = self.args.chatty + self.args.users * self.args.per_user
+        p95 = statistics.quantiles(self.light_latencies, n=20)[-1] * 1000
+        return total / elapsed, self.overlaps, p95
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--users", type=int, default=8)
+    parser.add_argument("--per-user", type=int, default=3)
+    parser.add_argument("--chatty", type=int, default=40)
+    parser.add_argument("--graph-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'mode':>8}{'msg/s':>9}{'overlaps':>10}{'light p95 ms':>14}")
+    for workers in args.workers:
+        for keyed in (False, True):
+            rate, overlaps, p95 = asyncio.run(_Run(args, keyed).run(workers))
+            mode = "keyed" if keyed else "fifo"
+            print(f"{workers:>8}{mode:>8}{rate:>9.0f}{overlaps:>10}{p95:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
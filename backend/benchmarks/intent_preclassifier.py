@@ -0,0 +1,88 @@
+"""Intent pre-classifier hit rate and estimated extract_target savings.
+
+Runs the rules of INTENT_PRECLASSIFIER over a labelled sample of user
+messages. "hit rate" is the share of each target's messages routed without
+the LLM, "precision" the share of those hits that were correct, and "saved"
+the LLM time avoided per 100 messages at --llm-ms per classifier call.
+Rules take microseconds, so their own cost is reported separately.
+
+Usage: uv run python -m benchmarks.intent_preclassifier [--llm-ms 600]
+"""
+
+import argparse
+import time
+
+from src.processes.interview import Target
+from src.workflows.nodes.input.intent_preclassifier import match_rules
+
+SAMPLE: dict[Target, tuple[str, ...]] = {
+    Target.conduct_interview: (
+        "I have been working as a data engineer for three years",
+        "My main goal this year is to run a marathon",
+        "We moved to Berlin when I was twelve",
+        "I usually read before bed, mostly history books",
+        "Mostly Python and some Go",
+        "Not really, I prefer working alone",
+        "It was hard at first but I got used to it",
+        "I'm learning Spanish with a tutor twice a week",
+        "Я работаю дизайнером уже пять лет",
+        "Yes",
+    ),
+    Target.manage_areas: (
+        "Create area for Career",
+        "Add sub-areas Sleep and Nutrition under Health",
+        "Delete the travel area",
+        "List my areas",
+        "Rename topic Hobbies to Leisure",
+        "Can you add a topic about my family?",
+        "I want to create an area for fitness",
+        "Создай область Здоровье",
+        "what are my areas",
+        "Move Python under Skills",
+    ),
+    Target.small_talk: (
+        "Hello!",
+        "Hi",
+        "What can you do?",
+        "How does this work?",
+        "Thanks!",
+        "Who are you?",
+        "Привет",
+        "Good morning",
+        "Is my data private?",
+        "lol",
+    ),
+}
+
+
+def _route(target: Target, messages: tuple[str, ...]) -> tuple[int, float]:
+    """Print one target's row; returns (local hits, seconds spent in rules)."""
+    start = time.perf_counter()
+    local = [guess for guess in map(match_rules, messages) if guess is not None]
+    seconds = time.perf_counter() - start
+    correct = sum(guess == target for guess in local)
+    precision = correct / len(local) if local else 0.0
+    rate = len(local) / len(messages)
+    print(f"{target.value:>18}{len(messages):>10}{rate:>10.0%}{precision:>11.0%}")
+    return len(local), seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--llm-ms", type=float, default=600.0)
+    args = parser.parse_args()
+
+    print(f"{'target':>18}{'messages':>10}{'hit rate':>10}{'precision':>11}")
+    rows = [_route(target, messages) for target, messages in SAMPLE.items()]
+    total = sum(len(messages) for messages in SAMPLE.values())
+    hits = sum(local for local, _ in rows)
+    rule_seconds = sum(seconds for _, seconds in rows)
+
+    saved = hits / total * 100 * args.llm_ms / 1000
+    print(f"\noverall hit rate {hits / total:.0%}")
+    print(f"saved per 100 messages: {saved:.1f} s at {args.llm_ms:.0f} ms per call")
+    print(f"rule cost per message: {rule_seconds / total * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
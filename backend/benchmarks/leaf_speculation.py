@@ -0,0 +1,112 @@
+"""Leaf interview turn latency, sequential vs speculative replies.
+
+Runs the leaf_interview subgraph for an answered question against a fake LLM
+where every call takes --llm-ms. Sequential turns wait for the summary, the
+evaluation and then the reply; speculative turns (LEAF_SPECULATIVE_RESPONSE)
+generate the follow-up and next-leaf replies during the first two and keep
+the one matching the evaluation. "calls" counts LLM calls per turn.
+
+Usage: uv run python -m benchmarks.leaf_speculation [--llm-ms 300] [--turns 10]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+
+class _FakeLLM:
+    def __init__(self, delay: float, status: str) -> None:
+        self.delay = delay
+        self.status = status
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return AIMessage(content="Tell me more about it.")
+
+    def with_structured_output(self, schema):
+        llm = self
+
+        class _Structured:
+            async def ainvoke(self, messages):
+                llm.calls += 1
+                await asyncio.sleep(llm.delay)
+                return schema(status=llm.status, reason="Needs more detail")
+
+        return _Structured()
+
+
+async def _seed() -> uuid.UUID:
+    from src.infrastructure.db import managers as db
+
+    user_id, area_id = uuid.uuid4(), uuid.uuid4()
+    await db.LifeAreasManager.create(
+        area_id,
+        db.LifeArea(id=area_id, title="Career", parent_id=None, user_id=user_id),
+    )
+    for title in ("Skills", "Goals"):
+        leaf_id = uuid.uuid4()
+        await db.LifeAreasManager.create(
+            leaf_id,
+            db.LifeArea(id=leaf_id, title=title, parent_id=area_id, user_id=user_id),
+        )
+    return area_id
+
+
+async def _turns(args, area_id, speculative: bool, status: str) -> tuple:
+    from src.domain import InputMode, User
+    from src.workflows.subgraphs.leaf_interview.graph import (
+        build_leaf_interview_graph,
+    )
+    from src.workflows.subgraphs.leaf_interview.state import LeafInterviewState
+
+    llm = _FakeLLM(args.llm_ms / 1000, status)
+    graph = build_leaf_interview_graph(llm, llm, speculative=speculative)
+    user = User(id=uuid.uuid4(), mode=InputMode.auto)
+    timings = []
+    for _ in range(args.turns):
+        state = LeafInterviewState(
+            user=user,
+            area_id=area_id,
+            messages=[HumanMessage(content="I write Python every day")],
+            messages_to_save={},
+        )
+        start = time.perf_counter()
+        await graph.ainvoke(state)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), llm.calls / args.turns
+
+
+async def _bench(args) -> None:
+    from src.infrastructure.db import close_pools
+
+    area_id = await _seed()
+    print(f"{'evaluation':>11}{'mode':>13}{'median ms':>11}{'calls':>7}")
+    for status in ("partial", "complete"):
+        for speculative in (False, True):
+            median, calls = await _turns(args, area_id, speculative, status)
+            mode = "speculative" if speculative else "sequential"
+            print(f"{status:>11}{mode:>13}{median:>11.0f}{calls:>7.1f}")
+    await close_pools()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--llm-ms", type=float, default=300.0)
+    parser.add_argument("--turns", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["INTERVIEW_DB_PATH"] = os.path.join(tmp, "bench.db")
+        asyncio.run(_bench(args))
+
+
+if __name__ == "__main__":
+    main()
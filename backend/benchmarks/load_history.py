@@ -0,0 +1,94 @@
+"""Latency of loading the history tail for a user with a long conversation.
+
+Compares the full-scan path (list_by_user + sort + slice) with the indexed
+tail query (list_recent_by_user) that load_history uses.
+
+Usage: uv run python -m benchmarks.load_history [--messages 100000] [--runs 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+import uuid
+
+HISTORY_LIMIT = 15
+
+
+async def _seed(user_id: uuid.UUID, messages: int) -> None:
+    from src.infrastructure.db import transaction
+
+    rows = [
+        (
+            str(uuid.uuid4()),
+            json.dumps({"role": "user" if i % 2 else "ai", "content": f"msg {i}"}),
+            str(user_id),
+            float(i),
+        )
+        for i in range(messages)
+    ]
+    async with transaction() as conn:
+        await conn.executemany(
+            "INSERT INTO histories (id, message_data, user_id, created_ts)"
+            " VALUES (?, ?, ?, ?)",
+            rows,
+        )
+
+
+async def _full_scan(user_id: uuid.UUID) -> list:
+    from src.infrastructure.db import managers as db
+
+    entries = sorted(
+        await db.HistoriesManager.list_by_user(user_id), key=lambda x: x.created_ts
+    )
+    return entries[-HISTORY_LIMIT:]
+
+
+async def _tail(user_id: uuid.UUID) -> list:
+    from src.infrastructure.db import managers as db
+
+    return await db.HistoriesManager.list_recent_by_user(user_id, HISTORY_LIMIT)
+
+
+async def _time(fn, user_id: uuid.UUID, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = await fn(user_id)
+        timings.append((time.perf_counter() - start) * 1000)
+        assert len(result) == HISTORY_LIMIT
+    return timings
+
+
+async def _bench(messages: int, runs: int) -> None:
+    from src.infrastructure.db import close_pools
+
+    user_id = uuid.uuid4()
+    await _seed(user_id, messages)
+    await _seed(uuid.uuid4(), messages // 10)  # unrelated user's rows
+
+    print(f"{messages} messages, tail of {HISTORY_LIMIT}, {runs} runs")
+    print(f"{'path':<22}{'median ms':>12}{'p95 ms':>12}")
+    for name, fn in (("list_by_user+sort", _full_scan), ("list_recent_by_user", _tail)):
+        timings = sorted(await _time(fn, user_id, runs))
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f"{name:<22}{statistics.median(timings):>12.2f}{p95:>12.2f}")
+    await close_pools()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["INTERVIEW_DB_PATH"] = os.path.join(tmp, "bench.db")
+        asyncio.run(_bench(args.messages, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Per-turn CPU of the LLM call sites, derived per call vs PreparedLLM.
+
+Runs extract_target_from_messages, the leaf evaluation call and area_chat
+against real (offline) ChatOpenAI clients with invoke_with_retry replaced by
+a canned result, so the measured time is what a node spends preparing the
+request: structured-output / tool-bound runnables, prompts, message lists.
+"per call" passes the plain LLM and rebuilds the extract_target prompt each
+turn (the behaviour before PreparedLLM); "prepared" passes the wrappers the
+main graph builds at construction.
+
+Usage: uv run python -m benchmarks.prepared_runnables [--turns 500]
+"""
+
+import argparse
+import asyncio
+import importlib
+import time
+import uuid
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_openai import ChatOpenAI
+
+from src.domain import InputMode, User
+from src.infrastructure.llms import PreparedLLM
+from src.shared.interview_models import LeafEvaluation
+from src.workflows.subgraphs.area_loop import nodes as area_nodes
+from src.workflows.subgraphs.area_loop.state import AreaState
+from src.workflows.subgraphs.area_loop.tools import AREA_TOOLS
+from src.workflows.subgraphs.leaf_interview import nodes as leaf_nodes
+
+# The input package re-exports the node under the module's name
+extract_module = importlib.import_module("src.workflows.nodes.input.extract_target")
+
+
+def _canned(result):
+    async def invoke(call):
+        return result
+
+    return invoke
+
+
+def _call_sites(state: AreaState, messages: list) -> dict:
+    """Site name → (schema or tools for PreparedLLM, per-turn coroutine)."""
+    return {
+        "extract_target": (
+            {"schemas": [extract_module.IntentClassification]},
+            lambda llm: extract_module.extract_target_from_messages(messages, llm),
+        ),
+        "quick_evaluate": (
+            {"schemas": [LeafEvaluation]},
+            lambda llm: leaf_nodes._llm_evaluate(llm, "Career > Skills", ["Python"]),
+        ),
+        "area_chat": (
+            {"tools": AREA_TOOLS},
+            lambda llm: area_nodes.area_chat(state, llm),
+        ),
+    }
+
+
+async def _cpu_per_turn(turn, llm, turns: int, clear_prompt: bool) -> float:
+    start = time.process_time()
+    for _ in range(turns):
+        if clear_prompt:
+            extract_module._system_prompt.cache_clear()
+        await turn(llm)
+    return (time.process_time() - start) / turns * 1e6
+
+
+async def _bench(turns: int) -> None:
+    extract_module.invoke_with_retry = _canned(
+        extract_module.IntentClassification(target="conduct_interview")
+    )
+    leaf_nodes.invoke_with_retry = _canned(
+        LeafEvaluation(status="partial", reason="More detail")
+    )
+    area_nodes.invoke_with_retry = _canned(AIMessage(content="Done"))
+    messages = [HumanMessage(content="I write Python every day")]
+    state = AreaState(
+        user=User(id=uuid.uuid4(), mode=InputMode.auto),
+        messages=messages,
+        messages_to_save={},
+    )
+
+    print(f"{'call site':>16}{'per call us':>13}{'prepared us':>13}")
+    for name, (prepare, turn) in _call_sites(state, messages).items():
+        llm = ChatOpenAI(model="gpt-4o-mini", api_key="sk-benchmark")
+        clear = name == "extract_target"
+        before = await _cpu_per_turn(turn, llm, turns, clear)
+        after = await _cpu_per_turn(turn, PreparedLLM(llm, **prepare), turns, False)
+        print(f"{name:>16}{before:>13.0f}{after:>13.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(_bench(args.turns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Request/response round trip: reply future vs shared responses queue.
+
+--clients concurrent senders each send --requests messages one after the
+other through channels.requests to --workers echo workers that do no work,
+so the numbers are pure routing overhead. "future" is the current design
+(the worker resolves ChannelRequest.response_future); "queue" reproduces the
+previous one, where workers put responses on one queue that a dispatcher task
+matched against a pending dict by correlation_id.
+
+Usage: uv run python -m benchmarks.request_roundtrip [--clients 1 16 64]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from src.domain import ClientMessage
+from src.processes.interview.interfaces import ChannelRequest
+from src.runtime.queues import KeyedChannel
+from src.shared.ids import new_id
+
+
+class _Run:
+    """Echo workers plus, in queue mode, the old dispatcher task."""
+
+    def __init__(self, via_queue: bool) -> None:
+        self.via_queue = via_queue
+        self.requests = KeyedChannel(lambda r: r.user_id)
+        self.responses: asyncio.Queue[tuple] = asyncio.Queue()
+        self.pending: dict = {}
+        self.latencies: list[float] = []
+
+    async def worker(self) -> None:
+        while True:
+            request = await self.requests.get()
+            if self.via_queue:
+                await self.responses.put((request.correlation_id, "ok"))
+            else:
+                request.reply("ok")
+            self.requests.task_done(request)
+
+    async def dispatcher(self) -> None:
+        while True:
+            correlation_id, text = await self.responses.get()
+            if future := self.pending.pop(correlation_id, None):
+                future.set_result(text)
+
+    async def client(self, count: int) -> None:
+        user_id = new_id()
+        for _ in range(count):
+            start = time.perf_counter()
+            future = asyncio.get_running_loop().create_future()
+            request = ChannelRequest(
+                new_id(), user_id, ClientMessage(data="hi"), future
+            )
+            if self.via_queue:
+                self.pending[request.correlation_id] = future
+            self.requests.admit(request)
+            await future
+            self.latencies.append(time.perf_counter() - start)
+
+    async def run(self, args, clients: int) -> tuple[float, float, float]:
+        tasks = [asyncio.create_task(self.worker()) for _ in range(args.workers)]
+        tasks.append(asyncio.create_task(self.dispatcher()))
+        start = time.perf_counter()
+        await asyncio.gather(*(self.client(args.requests) for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        quantiles = statistics.quantiles(self.latencies, n=100)
+        return len(self.latencies) / elapsed, quantiles[49] * 1e6, quantiles[98] * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'clients':>8}{'mode':>8}{'req/s':>10}{'p50 us':>9}{'p99 us':>9}")
+    for clients in args.clients:
+        for via_queue in (True, False):
+            rate, p50, p99 = asyncio.run(_Run(via_queue).run(args, clients))
+            mode = "queue" if via_queue else "future"
+            print(f"{clients:>8}{mode:>8}{rate:>10.0f}{p50:>9.0f}{p99:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""find_top_k latency: NumPy batch scorer vs the pure-Python fallback.
+
+Candidates are packed float32 blobs decoded the same way
+SummariesManager.list_vectors_by_user returns them.
+
+Usage: uv run python -m benchmarks.similarity_top_k [--dims 1536] [--counts 100 1000 5000]
+"""
+
+import argparse
+import random
+import time
+
+from src.shared import similarity
+from src.shared.vectors import pack_vector, unpack_vector
+
+
+def _candidates(count: int, dims: int) -> list[tuple[str, memoryview]]:
+    return [
+        (str(i), unpack_vector(pack_vector([random.gauss(0, 1) for _ in range(dims)])))
+        for i in range(count)
+    ]
+
+
+def _time_ms(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--k", type=int, default=5)
+    args = parser.parse_args()
+
+    query = [random.gauss(0, 1) for _ in range(args.dims)]
+    print(f"{'candidates':>10}{'python ms':>12}{'numpy ms':>12}{'speedup':>10}")
+    for count in args.counts:
+        candidates = _candidates(count, args.dims)
+        py_ms = _time_ms(similarity._find_top_k_python, query, candidates, args.k)
+        np_ms = _time_ms(similarity.find_top_k, query, candidates, args.k)
+        print(f"{count:>10}{py_ms:>12.1f}{np_ms:>12.1f}{py_ms / np_ms:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
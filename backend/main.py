@@ -4,9 +4,12 @@ import logging
 import uuid
 
 from src.config.logging import configure_logging
+from src.config.settings import WORKER_PROCESSES_GRAPH
+from src.infrastructure.db import close_pools
+from src.infrastructure.http_clients import close_http_clients
 from src.processes.auth import run_auth_pool
 from src.processes.extract import run_extract_pool
-from src.processes.interview import run_graph_pool
+from src.processes.interview import run_graph_pool, run_graph_process_pool
 from src.processes.transport import parse_user_id, run_cli, run_telegram
 from src.runtime import Channels
 from src.workflows.subgraphs.transcribe.nodes.extract_audio import (
@@ -14,12 +17,20 @@ from src.workflows.subgraphs.transcribe.nodes.extract_audio import (
 )
 
 
+async def _close_resources() -> None:
+    """Release process-wide HTTP and database connections."""
+    await close_http_clients()
+    await close_pools()
+
+
 async def run_application(transport: str, user_id: uuid.UUID) -> None:
     """Start transport and worker pools."""
     channels = Channels()
 
     tasks = [
-        run_graph_pool(channels),
+        run_graph_process_pool(channels)
+        if WORKER_PROCESSES_GRAPH
+        else run_graph_pool(channels),
         run_extract_pool(channels),
     ]
 
@@ -33,6 +44,8 @@ async def run_application(transport: str, user_id: uuid.UUID) -> None:
         await asyncio.gather(*tasks)
     except asyncio.CancelledError:
         channels.shutdown.set()
+    finally:
+        await _close_resources()
 
 
 def main() -> None:
@@ -17,6 +17,14 @@ def _parse_int(value_str: str, name: str) -> int:
         raise RuntimeError(f"{name} must be a valid integer, got: {value_str}") from e
 
 
+def _parse_choice(value_str: str, name: str, choices: tuple[str, ...]) -> str:
+    """Parse one of a fixed set of string options from env var."""
+    value = value_str.strip().lower()
+    if value not in choices:
+        raise RuntimeError(f"{name} must be one of {choices}, got: {value_str}")
+    return value
+
+
 # API Configuration
 API_KEY_ENV = "OPENROUTER_API_KEY"
 API_KEY_PREFIX = "sk-or-v1-"
@@ -25,10 +33,46 @@ MIN_API_KEY_LENGTH = 20
 # Database Configuration
 DB_PATH_ENV = "INTERVIEW_DB_PATH"
 DEFAULT_DB_PATH = "interview.db"
+DB_POOL_READERS_ENV = "DB_POOL_READERS"
+DB_POOL_HEALTH_CHECK_INTERVAL_ENV = "DB_POOL_HEALTH_CHECK_INTERVAL"
+DB_LOCK_MODE_ENV = "DB_LOCK_MODE"
+VECTOR_INDEX_CACHE_MAX_MB_ENV = "VECTOR_INDEX_CACHE_MAX_MB"
+VECTOR_INDEX_MODE_ENV = "VECTOR_INDEX_MODE"
+VECTOR_INDEX_ANN_MIN_VECTORS_ENV = "VECTOR_INDEX_ANN_MIN_VECTORS"
+VECTOR_INDEX_ANN_NPROBE_ENV = "VECTOR_INDEX_ANN_NPROBE"
+EMBEDDING_CACHE_SIZE_ENV = "EMBEDDING_CACHE_SIZE"
+EMBEDDING_CACHE_BACKEND_ENV = "EMBEDDING_CACHE_BACKEND"
+EMBEDDING_CACHE_MAX_ROWS_ENV = "EMBEDDING_CACHE_MAX_ROWS"
+EMBEDDING_CACHE_TTL_DAYS_ENV = "EMBEDDING_CACHE_TTL_DAYS"
+KNOWLEDGE_EXTRACTION_MODE_ENV = "KNOWLEDGE_EXTRACTION_MODE"
+KNOWLEDGE_BATCH_SIZE_ENV = "KNOWLEDGE_BATCH_SIZE"
+KNOWLEDGE_BATCH_MAX_WAIT_ENV = "KNOWLEDGE_BATCH_MAX_WAIT"
+EXTRACT_EMBED_BATCH_SIZE_ENV = "EXTRACT_EMBED_BATCH_SIZE"
+EXTRACT_EMBED_BATCH_MAX_WAIT_ENV = "EXTRACT_EMBED_BATCH_MAX_WAIT"
+HTTP_MAX_CONNECTIONS_ENV = "HTTP_MAX_CONNECTIONS"
+HTTP_MAX_KEEPALIVE_CONNECTIONS_ENV = "HTTP_MAX_KEEPALIVE_CONNECTIONS"
+HTTP_KEEPALIVE_EXPIRY_ENV = "HTTP_KEEPALIVE_EXPIRY"
+HTTP_HTTP2_ENV = "HTTP_HTTP2"
 
 # Configuration Override Environment Variables
-WORKER_POLL_TIMEOUT_ENV = "WORKER_POLL_TIMEOUT"
-WORKER_SHUTDOWN_CHECK_INTERVAL_ENV = "WORKER_SHUTDOWN_CHECK_INTERVAL"
+WORKER_POOL_GRAPH_MAX_ENV = "WORKER_POOL_GRAPH_MAX"
+WORKER_PROCESSES_GRAPH_ENV = "WORKER_PROCESSES_GRAPH"
+WORKER_POOL_EXTRACT_MAX_ENV = "WORKER_POOL_EXTRACT_MAX"
+WORKER_POOL_AUTH_MAX_ENV = "WORKER_POOL_AUTH_MAX"
+WORKER_POOL_SCALE_INTERVAL_ENV = "WORKER_POOL_SCALE_INTERVAL"
+WORKER_POOL_SCALE_DOWN_DELAY_ENV = "WORKER_POOL_SCALE_DOWN_DELAY"
+WORKER_RESTART_BACKOFF_ENV = "WORKER_RESTART_BACKOFF"
+WORKER_RESTART_BACKOFF_MAX_ENV = "WORKER_RESTART_BACKOFF_MAX"
+CHANNEL_REQUESTS_MAXSIZE_ENV = "CHANNEL_REQUESTS_MAXSIZE"
+CHANNEL_AUTH_MAXSIZE_ENV = "CHANNEL_AUTH_MAXSIZE"
+CHANNEL_ADMISSION_POLICY_ENV = "CHANNEL_ADMISSION_POLICY"
+RESPONSE_STREAMING_ENV = "RESPONSE_STREAMING"
+LEAF_SPECULATIVE_RESPONSE_ENV = "LEAF_SPECULATIVE_RESPONSE"
+INTENT_PRECLASSIFIER_ENV = "INTENT_PRECLASSIFIER"
+INTENT_SIMILARITY_MIN_ENV = "INTENT_SIMILARITY_MIN"
+INTENT_SIMILARITY_MARGIN_ENV = "INTENT_SIMILARITY_MARGIN"
+STICKY_ROUTING_TURNS_ENV = "STICKY_ROUTING_TURNS"
+STICKY_ROUTING_TTL_ENV = "STICKY_ROUTING_TTL"
 RETRY_MAX_ATTEMPTS_ENV = "RETRY_MAX_ATTEMPTS"
 RETRY_INITIAL_WAIT_ENV = "RETRY_INITIAL_WAIT"
 RETRY_MAX_WAIT_ENV = "RETRY_MAX_WAIT"
@@ -55,6 +99,7 @@ MAX_TOKENS_STRUCTURED = 1024  # For structured output (classification, analysis)
 MAX_TOKENS_CHAT = 4096  # For conversational responses
 MAX_TOKENS_TRANSCRIPTION = 8192  # For audio transcription
 MAX_TOKENS_KNOWLEDGE = 4096  # For knowledge extraction (needs reasoning tokens)
+MAX_TOKENS_KNOWLEDGE_BATCH = 8192  # Batched extraction (several summaries per call)
 
 # Temperature Configuration
 TEMPERATURE_DETERMINISTIC = 0.0  # Classification, transcription
@@ -78,6 +123,44 @@ MAX_TURNS_PER_LEAF = 3  # Force-complete a leaf after this many turns
 MAX_TOKENS_QUICK_EVALUATE = 1024  # Reasoning model needs headroom beyond output
 MAX_TOKENS_LEAF_RESPONSE = 1024  # Short focused questions/responses
 MAX_TOKENS_LEAF_SUMMARY = 512  # Brief summary extraction
+# "on": generate the follow-up and next-leaf replies while the turn is still
+# being summarized and evaluated, keep the one matching the evaluation (one
+# extra reply LLM call per turn, and follow-ups lack the evaluator's reason)
+LEAF_SPECULATIVE_RESPONSE = _parse_choice(
+    os.getenv(LEAF_SPECULATIVE_RESPONSE_ENV, "off"),
+    LEAF_SPECULATIVE_RESPONSE_ENV,
+    ("off", "on"),
+)
+
+# Intent Routing (extract_target in auto mode)
+# Local pre-classifier tried before the extract_target LLM call:
+# - "off": always ask the LLM
+# - "rules": keyword/regex rules for unambiguous messages
+# - "embeddings": rules, then similarity to labelled example messages; a
+#   match needs INTENT_SIMILARITY_MIN and a lead of INTENT_SIMILARITY_MARGIN
+#   over the best example of any other target (one embedding call per message)
+INTENT_PRECLASSIFIER_MODES = ("off", "rules", "embeddings")
+INTENT_PRECLASSIFIER = _parse_choice(
+    os.getenv(INTENT_PRECLASSIFIER_ENV, "rules"),
+    INTENT_PRECLASSIFIER_ENV,
+    INTENT_PRECLASSIFIER_MODES,
+)
+INTENT_SIMILARITY_MIN = _parse_float(
+    os.getenv(INTENT_SIMILARITY_MIN_ENV, "0.85"), INTENT_SIMILARITY_MIN_ENV
+)
+INTENT_SIMILARITY_MARGIN = _parse_float(
+    os.getenv(INTENT_SIMILARITY_MARGIN_ENV, "0.05"), INTENT_SIMILARITY_MARGIN_ENV
+)
+# Sticky routing: after a classified conduct_interview turn, reuse that
+# target for the user's next STICKY_ROUTING_TURNS turns (0 disables) while
+# each arrives within STICKY_ROUTING_TTL seconds of the previous one; then
+# the classifier runs again. Pre-classifier rules still take precedence.
+STICKY_ROUTING_TURNS = _parse_int(
+    os.getenv(STICKY_ROUTING_TURNS_ENV, "3"), STICKY_ROUTING_TURNS_ENV
+)
+STICKY_ROUTING_TTL = _parse_float(
+    os.getenv(STICKY_ROUTING_TTL_ENV, "300.0"), STICKY_ROUTING_TTL_ENV
+)
 
 # Retry Configuration
 RETRY_MAX_ATTEMPTS = _parse_int(
@@ -91,25 +174,184 @@ RETRY_MAX_WAIT = _parse_float(os.getenv(RETRY_MAX_WAIT_ENV, "10.0"), RETRY_MAX_W
 # Embedding Configuration
 EMBEDDING_MODEL = "openai/text-embedding-3-small"  # Via OpenRouter
 EMBEDDING_DIMENSIONS = 1536
+# Embeddings keyed by hash(model, dimensions, text), so repeated search queries
+# and re-vectorized summaries skip the API call:
+# - EMBEDDING_CACHE_SIZE: in-process LRU entries (0 disables the memory layer)
+# - EMBEDDING_CACHE_BACKEND: "memory", or "sqlite" to also persist entries in
+#   the embedding_cache table (shared across processes and restarts)
+EMBEDDING_CACHE_SIZE = _parse_int(
+    os.getenv(EMBEDDING_CACHE_SIZE_ENV, "1024"), EMBEDDING_CACHE_SIZE_ENV
+)
+EMBEDDING_CACHE_BACKENDS = ("memory", "sqlite")
+EMBEDDING_CACHE_BACKEND = _parse_choice(
+    os.getenv(EMBEDDING_CACHE_BACKEND_ENV, "memory"),
+    EMBEDDING_CACHE_BACKEND_ENV,
+    EMBEDDING_CACHE_BACKENDS,
+)
+# Bounds of the SQLite layer, enforced by a prune every few hundred inserts:
+# - EMBEDDING_CACHE_MAX_ROWS: rows kept, oldest dropped first (0 = unbounded)
+# - EMBEDDING_CACHE_TTL_DAYS: rows older than this are dropped (0 = no TTL)
+EMBEDDING_CACHE_MAX_ROWS = _parse_int(
+    os.getenv(EMBEDDING_CACHE_MAX_ROWS_ENV, "100000"), EMBEDDING_CACHE_MAX_ROWS_ENV
+)
+EMBEDDING_CACHE_TTL_DAYS = _parse_float(
+    os.getenv(EMBEDDING_CACHE_TTL_DAYS_ENV, "30"), EMBEDDING_CACHE_TTL_DAYS_ENV
+)
+# Memory budget for per-user in-memory vector indexes (MCP search_summaries);
+# least recently used users are evicted beyond it. 1536 dims = 6 KB per vector.
+VECTOR_INDEX_CACHE_MAX_MB = _parse_float(
+    os.getenv(VECTOR_INDEX_CACHE_MAX_MB_ENV, "256"), VECTOR_INDEX_CACHE_MAX_MB_ENV
+)
+# Search strategy for per-user vector indexes:
+# - "exact": brute-force cosine over every vector
+# - "ivf": in-process IVF-flat ANN (needs NumPy) for users with at least
+#   VECTOR_INDEX_ANN_MIN_VECTORS vectors, persisted to {db_path}.vectors/
+VECTOR_INDEX_MODES = ("exact", "ivf")
+VECTOR_INDEX_MODE = _parse_choice(
+    os.getenv(VECTOR_INDEX_MODE_ENV, "exact"), VECTOR_INDEX_MODE_ENV, VECTOR_INDEX_MODES
+)
+VECTOR_INDEX_ANN_MIN_VECTORS = _parse_int(
+    os.getenv(VECTOR_INDEX_ANN_MIN_VECTORS_ENV, "5000"),
+    VECTOR_INDEX_ANN_MIN_VECTORS_ENV,
+)
+# Inverted lists probed per query: higher raises recall and latency
+VECTOR_INDEX_ANN_NPROBE = _parse_int(
+    os.getenv(VECTOR_INDEX_ANN_NPROBE_ENV, "8"), VECTOR_INDEX_ANN_NPROBE_ENV
+)
+# Extract pool: summaries are embedded with batched aembed_documents calls of
+# up to EXTRACT_EMBED_BATCH_SIZE texts, flushed at the latest
+# EXTRACT_EMBED_BATCH_MAX_WAIT seconds after the first text arrives. Each
+# worker (KNOWLEDGE_EXTRACTION_MODE=single) claims as many tasks at a time.
+EXTRACT_EMBED_BATCH_SIZE = _parse_int(
+    os.getenv(EXTRACT_EMBED_BATCH_SIZE_ENV, "16"), EXTRACT_EMBED_BATCH_SIZE_ENV
+)
+EXTRACT_EMBED_BATCH_MAX_WAIT = _parse_float(
+    os.getenv(EXTRACT_EMBED_BATCH_MAX_WAIT_ENV, "0.05"),
+    EXTRACT_EMBED_BATCH_MAX_WAIT_ENV,
+)
+# Knowledge extraction strategy for the extract pool:
+# - "single": one structured LLM call per summary
+# - "batched": a worker collects up to KNOWLEDGE_BATCH_SIZE queued summaries,
+#   waiting at most KNOWLEDGE_BATCH_MAX_WAIT seconds for more, makes one call
+#   per user in the batch and persists the whole batch in one transaction
+KNOWLEDGE_EXTRACTION_MODES = ("single", "batched")
+KNOWLEDGE_EXTRACTION_MODE = _parse_choice(
+    os.getenv(KNOWLEDGE_EXTRACTION_MODE_ENV, "single"),
+    KNOWLEDGE_EXTRACTION_MODE_ENV,
+    KNOWLEDGE_EXTRACTION_MODES,
+)
+KNOWLEDGE_BATCH_SIZE = _parse_int(
+    os.getenv(KNOWLEDGE_BATCH_SIZE_ENV, "5"), KNOWLEDGE_BATCH_SIZE_ENV
+)
+KNOWLEDGE_BATCH_MAX_WAIT = _parse_float(
+    os.getenv(KNOWLEDGE_BATCH_MAX_WAIT_ENV, "2.0"), KNOWLEDGE_BATCH_MAX_WAIT_ENV
+)
+
+# Shared HTTP connection pool for all LLM and embedding clients (per process)
+HTTP_MAX_CONNECTIONS = _parse_int(
+    os.getenv(HTTP_MAX_CONNECTIONS_ENV, "32"), HTTP_MAX_CONNECTIONS_ENV
+)
+HTTP_MAX_KEEPALIVE_CONNECTIONS = _parse_int(
+    os.getenv(HTTP_MAX_KEEPALIVE_CONNECTIONS_ENV, "16"),
+    HTTP_MAX_KEEPALIVE_CONNECTIONS_ENV,
+)
+# Idle keep-alive connections are closed after this many seconds
+HTTP_KEEPALIVE_EXPIRY = _parse_float(
+    os.getenv(HTTP_KEEPALIVE_EXPIRY_ENV, "60.0"), HTTP_KEEPALIVE_EXPIRY_ENV
+)
+# "on" multiplexes requests over HTTP/2 (needs the h2 package, else HTTP/1.1)
+HTTP_HTTP2 = _parse_choice(
+    os.getenv(HTTP_HTTP2_ENV, "off"), HTTP_HTTP2_ENV, ("off", "on")
+)
 
-# Worker Pool Configuration
+# Worker Pool Configuration (autoscaling, see runtime/pool.py)
+# Pools keep at least WORKER_POOL_* workers and grow up to WORKER_POOL_*_MAX
+# while work is queued; graph and auth workers mostly await I/O
 WORKER_POOL_GRAPH = 2  # Concurrent graph workers
+WORKER_POOL_GRAPH_MAX = _parse_int(
+    os.getenv(WORKER_POOL_GRAPH_MAX_ENV, "16"), WORKER_POOL_GRAPH_MAX_ENV
+)
+# Graph worker processes; 0 runs the graph in the main process. With N > 0
+# the main process routes each user's messages to one of N child processes
+WORKER_PROCESSES_GRAPH = _parse_int(
+    os.getenv(WORKER_PROCESSES_GRAPH_ENV, "0"), WORKER_PROCESSES_GRAPH_ENV
+)
 WORKER_POOL_EXTRACT = 2  # Concurrent extract workers
+WORKER_POOL_EXTRACT_MAX = _parse_int(
+    os.getenv(WORKER_POOL_EXTRACT_MAX_ENV, "8"), WORKER_POOL_EXTRACT_MAX_ENV
+)
+WORKER_POOL_AUTH = 1  # Concurrent auth workers
+WORKER_POOL_AUTH_MAX = _parse_int(
+    os.getenv(WORKER_POOL_AUTH_MAX_ENV, "4"), WORKER_POOL_AUTH_MAX_ENV
+)
 WORKER_POOL_LEAF_EXTRACT = 2  # Concurrent leaf extraction workers
-WORKER_POLL_TIMEOUT = _parse_float(
-    os.getenv(WORKER_POLL_TIMEOUT_ENV, "0.5"), WORKER_POLL_TIMEOUT_ENV
+# How often a pool compares its size with queued work
+WORKER_POOL_SCALE_INTERVAL = _parse_float(
+    os.getenv(WORKER_POOL_SCALE_INTERVAL_ENV, "0.5"), WORKER_POOL_SCALE_INTERVAL_ENV
+)
+# Surplus workers are stopped only after the pool was oversized this long
+WORKER_POOL_SCALE_DOWN_DELAY = _parse_float(
+    os.getenv(WORKER_POOL_SCALE_DOWN_DELAY_ENV, "30.0"),
+    WORKER_POOL_SCALE_DOWN_DELAY_ENV,
 )
-WORKER_SHUTDOWN_CHECK_INTERVAL = _parse_float(
-    os.getenv(WORKER_SHUTDOWN_CHECK_INTERVAL_ENV, "0.5"),
-    WORKER_SHUTDOWN_CHECK_INTERVAL_ENV,
+# A crashed worker restarts after WORKER_RESTART_BACKOFF * 2**(n-1) seconds
+# for its n-th consecutive crash, capped at WORKER_RESTART_BACKOFF_MAX
+WORKER_RESTART_BACKOFF = _parse_float(
+    os.getenv(WORKER_RESTART_BACKOFF_ENV, "0.5"), WORKER_RESTART_BACKOFF_ENV
+)
+WORKER_RESTART_BACKOFF_MAX = _parse_float(
+    os.getenv(WORKER_RESTART_BACKOFF_MAX_ENV, "30.0"), WORKER_RESTART_BACKOFF_MAX_ENV
+)
+
+# Channel Configuration (bounded in-process queues, see runtime/queues.py)
+# Maximum queued items per channel; 0 means unbounded
+CHANNEL_REQUESTS_MAXSIZE = _parse_int(
+    os.getenv(CHANNEL_REQUESTS_MAXSIZE_ENV, "100"), CHANNEL_REQUESTS_MAXSIZE_ENV
+)
+CHANNEL_AUTH_MAXSIZE = _parse_int(
+    os.getenv(CHANNEL_AUTH_MAXSIZE_ENV, "100"), CHANNEL_AUTH_MAXSIZE_ENV
+)
+# What a full requests channel does with a new message:
+# - "reject": the new message is answered with a busy reply
+# - "shed": the oldest queued message is answered with a busy reply instead,
+#   favouring fresh messages over ones whose sender has waited longest
+CHANNEL_ADMISSION_POLICY = _parse_choice(
+    os.getenv(CHANNEL_ADMISSION_POLICY_ENV, "reject"),
+    CHANNEL_ADMISSION_POLICY_ENV,
+    ("reject", "shed"),
+)
+# "on": transports show reply text while the LLM generates it (Telegram edits
+# a placeholder message, the CLI prints deltas); "off": whole replies only
+RESPONSE_STREAMING = _parse_choice(
+    os.getenv(RESPONSE_STREAMING_ENV, "on"), RESPONSE_STREAMING_ENV, ("off", "on")
+)
+
+# Database Connection Pool Configuration
+# Long-lived connections: DB_POOL_READERS read-only connections plus one writer.
+DB_POOL_READERS = _parse_int(os.getenv(DB_POOL_READERS_ENV, "4"), DB_POOL_READERS_ENV)
+# Idle connections older than this are probed with SELECT 1 before reuse
+DB_POOL_HEALTH_CHECK_INTERVAL = _parse_float(
+    os.getenv(DB_POOL_HEALTH_CHECK_INTERVAL_ENV, "30.0"),
+    DB_POOL_HEALTH_CHECK_INTERVAL_ENV,
+)
+
+# Cross-process file lock taken by readers (writers always take LOCK_EX):
+# - "exclusive": readers take LOCK_EX too (fully serialized access)
+# - "shared": readers take LOCK_SH, so they only wait for writers
+# - "none": readers take no file lock and rely on WAL snapshot isolation
+DB_LOCK_MODES = ("exclusive", "shared", "none")
+DB_LOCK_MODE = _parse_choice(
+    os.getenv(DB_LOCK_MODE_ENV, "shared"), DB_LOCK_MODE_ENV, DB_LOCK_MODES
 )
 
-# Leaf Extraction Configuration
+# Leaf Extraction Configuration (durable extract_queue table, see extract/queue.py)
+# Idle workers re-check the queue this often (other processes cannot wake them)
 LEAF_EXTRACT_POLL_INTERVAL = 1.0  # Seconds between queue polls
 LEAF_EXTRACT_MAX_RETRIES = 3  # Max retries for failed extractions
-# Batch size balances throughput (fewer DB queries) vs. memory (loading tasks into memory).
-# 5 is conservative; can increase for high-throughput scenarios.
-LEAF_EXTRACT_BATCH_SIZE = 5
+# Visibility timeout: a claimed task is handed out again if not acked by then
+LEAF_EXTRACT_LEASE_TIMEOUT = 300.0
+# Retry n waits LEAF_EXTRACT_RETRY_BACKOFF * 2**(n-1) seconds
+LEAF_EXTRACT_RETRY_BACKOFF = 5.0
 
 
 def load_api_key() -> str:
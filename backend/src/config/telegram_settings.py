@@ -11,6 +11,19 @@ TELEGRAM_WEBHOOK_URL = os.getenv("TELEGRAM_WEBHOOK_URL", "")
 TELEGRAM_WEBHOOK_SECRET = os.getenv("TELEGRAM_WEBHOOK_SECRET", "")
 
 TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+# Minimum seconds between edits of a streamed reply (Telegram rate-limits edits)
+TELEGRAM_STREAM_EDIT_INTERVAL_STR = os.getenv("TELEGRAM_STREAM_EDIT_INTERVAL", "1.0")
+
+
+def get_stream_edit_interval() -> float:
+    """Parse and return the streamed reply edit interval."""
+    try:
+        return float(TELEGRAM_STREAM_EDIT_INTERVAL_STR)
+    except ValueError as e:
+        raise RuntimeError(
+            "TELEGRAM_STREAM_EDIT_INTERVAL must be a number, "
+            f"got: {TELEGRAM_STREAM_EDIT_INTERVAL_STR}"
+        ) from e
 
 
 def get_webhook_port() -> int:
@@ -29,6 +42,7 @@ def validate_telegram_config() -> None:
         raise RuntimeError(
             "TELEGRAM_BOT_TOKEN not set. Get token from @BotFather on Telegram."
         )
+    get_stream_edit_interval()  # Validate interval is a number
     if TELEGRAM_MODE == "webhook":
         if not TELEGRAM_WEBHOOK_URL:
             raise RuntimeError(
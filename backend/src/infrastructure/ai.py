@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from langchain_openai import ChatOpenAI
 
 from src.config.settings import load_api_key
+from src.infrastructure.http_clients import get_async_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -41,5 +42,6 @@ class LLMClientBuilder:
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             api_key=api_key,
+            http_async_client=get_async_http_client(),
             **kwargs,
         )
@@ -1,6 +1,13 @@
 # Database infrastructure module
 
-from .connection import execute_with_retry, get_connection, transaction
+from .connection import (
+    close_pools,
+    execute_with_retry,
+    get_connection,
+    get_lock_stats,
+    get_pool_stats,
+    transaction,
+)
 from .managers import (
     HistoriesManager,
     History,
@@ -13,8 +20,11 @@ from .managers import (
 from .schema import init_schema_async
 
 __all__ = [
+    "close_pools",
     "execute_with_retry",
     "get_connection",
+    "get_lock_stats",
+    "get_pool_stats",
     "transaction",
     "User",
     "UsersManager",
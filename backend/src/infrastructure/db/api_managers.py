@@ -48,7 +48,7 @@ class ApiKeysManager(ORMBase[ApiKey]):
     ) -> ApiKey | None:
         """Look up an API key by its raw key string (hashed for lookup)."""
         query = f"SELECT {', '.join(cls._columns)} FROM {cls._table} WHERE key_hash = ?"
-        async with _with_conn(conn) as c:
+        async with _with_conn(conn, read_only=True) as c:
             cursor = await c.execute(query, (hash_key(key),))
             row = await cursor.fetchone()
         if row is None:
@@ -11,14 +11,14 @@ T = TypeVar("T")
 
 
 @asynccontextmanager
-async def _with_conn(conn: aiosqlite.Connection | None):
-    """Context manager that uses provided conn or creates a new one."""
+async def _with_conn(conn: aiosqlite.Connection | None, read_only: bool = False):
+    """Context manager that uses provided conn or checks out a pooled one."""
     from src.infrastructure.db.connection import get_connection
 
     if conn is not None:
         yield conn
     else:
-        async with get_connection() as local_conn:
+        async with get_connection(read_only=read_only) as local_conn:
             yield local_conn
 
 
@@ -55,7 +55,7 @@ class ORMBase(Generic[T]):
         if order_by is not None:
             query = f"{query} ORDER BY {order_by}"
         if conn is None:
-            async with get_connection() as local_conn:
+            async with get_connection(read_only=True) as local_conn:
                 cursor = await local_conn.execute(query, (value,))
                 rows = await cursor.fetchall()
         else:
@@ -90,7 +90,7 @@ class ORMBase(Generic[T]):
 
         query = f"SELECT {', '.join(cls._columns)} FROM {cls._table} WHERE id = ?"
         if conn is None:
-            async with get_connection() as local_conn:
+            async with get_connection(read_only=True) as local_conn:
                 cursor = await local_conn.execute(query, (str(id),))
                 row = await cursor.fetchone()
         else:
@@ -127,7 +127,7 @@ class ORMBase(Generic[T]):
         )
 
         if conn is None:
-            async with get_connection() as local_conn:
+            async with get_connection(read_only=True) as local_conn:
                 cursor = await local_conn.execute(query, id_strs)
                 rows = await cursor.fetchall()
         else:
@@ -145,7 +145,7 @@ class ORMBase(Generic[T]):
 
         query = f"SELECT {', '.join(cls._columns)} FROM {cls._table}"
         if conn is None:
-            async with get_connection() as local_conn:
+            async with get_connection(read_only=True) as local_conn:
                 cursor = await local_conn.execute(query)
                 rows = await cursor.fetchall()
         else:
@@ -153,6 +153,16 @@ class ORMBase(Generic[T]):
             rows = await cursor.fetchall()
         return [cls._row_to_obj(row) for row in rows]
 
+    @classmethod
+    def _upsert_query(cls, columns: tuple[str, ...]) -> str:
+        """INSERT of columns that updates them in place when the id exists."""
+        placeholders = ", ".join(["?"] * len(columns))
+        updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col != "id")
+        return (
+            f"INSERT INTO {cls._table} ({', '.join(columns)}) VALUES ({placeholders})"
+            f" ON CONFLICT(id) DO UPDATE SET {updates}"
+        )
+
     @classmethod
     async def create(
         cls,
@@ -161,7 +171,11 @@ class ORMBase(Generic[T]):
         conn: aiosqlite.Connection | None = None,
         auto_commit: bool = True,
     ):
-        """Create or replace an object in the database.
+        """Create an object, or update the columns it maps to if the id exists.
+
+        An upsert rather than INSERT OR REPLACE: the existing row is updated in
+        place, so columns the model does not map (e.g. summaries.vector_seq)
+        are kept and UPDATE triggers see the old values.
 
         Args:
             id: Unique identifier for the object
@@ -174,11 +188,7 @@ class ORMBase(Generic[T]):
         values = cls._obj_to_row(data)
         if "id" not in values:
             values["id"] = str(id)
-        columns = ", ".join(values.keys())
-        placeholders = ", ".join(["?"] * len(values))
-        query = (
-            f"INSERT OR REPLACE INTO {cls._table} ({columns}) VALUES ({placeholders})"
-        )
+        query = cls._upsert_query(tuple(values))
         if conn is None:
             async with get_connection() as local_conn:
                 await local_conn.execute(query, tuple(values.values()))
@@ -16,6 +16,15 @@ from tenacity import (
     wait_exponential_jitter,
 )
 
+from src.config.settings import (
+    DB_LOCK_MODE,
+    DB_POOL_HEALTH_CHECK_INTERVAL,
+    DB_POOL_READERS,
+)
+
+from .file_lock import FileLockStats, file_lock, get_file_lock_stats
+from .pool import ConnectionPool, PoolStats
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
@@ -25,32 +34,23 @@ SQLITE_MAX_RETRIES = 5
 SQLITE_INITIAL_WAIT = 0.1  # 100ms
 SQLITE_MAX_WAIT = 2.0  # 2 seconds
 
-# Process-level lock to serialize write transactions (in-process)
-_transaction_lock = asyncio.Lock()
+# One pool per database path; rebuilt if the running event loop changes
+_pools: dict[str, ConnectionPool] = {}
 
 
-def _release_file_lock(lock_file: object, lock_path: str) -> None:
-    """Release file lock, close file, and delete lock file."""
-    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
-    lock_file.close()
-    try:
-        os.unlink(lock_path)
-    except OSError:
-        pass  # File may already be deleted by another process
-    logger.debug("Released file lock", extra={"lock_path": lock_path})
+# flock operation taken by readers for each DB_LOCK_MODE (None = no file lock)
+_READ_LOCK_OPERATIONS: dict[str, int | None] = {
+    "exclusive": fcntl.LOCK_EX,
+    "shared": fcntl.LOCK_SH,
+    "none": None,
+}
 
 
-@asynccontextmanager
-async def _file_lock(lock_path: str) -> AsyncGenerator[None, None]:
-    """Cross-process file lock using flock. Waits until lock is available."""
-    loop = asyncio.get_event_loop()
-    lock_file = open(lock_path, "w")  # noqa: ASYNC230
-    try:
-        await loop.run_in_executor(None, fcntl.flock, lock_file.fileno(), fcntl.LOCK_EX)
-        logger.debug("Acquired file lock", extra={"lock_path": lock_path})
-        yield
-    finally:
-        _release_file_lock(lock_file, lock_path)
+def _lock_operation(read_only: bool) -> int | None:
+    """flock operation for a checkout: readers follow DB_LOCK_MODE."""
+    if not read_only:
+        return fcntl.LOCK_EX
+    return _READ_LOCK_OPERATIONS[DB_LOCK_MODE]
 
 
 def get_db_path() -> str:
@@ -58,8 +58,12 @@ def get_db_path() -> str:
     return os.environ.get("INTERVIEW_DB_PATH", "interview.db")
 
 
-async def _setup_connection(db_path: str) -> aiosqlite.Connection:
-    """Create and configure a database connection with WAL mode."""
+async def _setup_connection(db_path: str, read_only: bool) -> aiosqlite.Connection:
+    """Create and configure a database connection with WAL mode.
+
+    Read-only connections get ``PRAGMA query_only`` after schema init so an
+    accidental write through a reader fails loudly instead of racing the writer.
+    """
     from src.infrastructure.db.schema import init_schema_async
 
     conn = await aiosqlite.connect(db_path, timeout=30.0)
@@ -68,14 +72,44 @@ async def _setup_connection(db_path: str) -> aiosqlite.Connection:
     await conn.execute("PRAGMA busy_timeout = 30000")
     await conn.execute("PRAGMA foreign_keys = ON")
     await init_schema_async(conn, db_path)
+    if read_only:
+        await conn.execute("PRAGMA query_only = ON")
     return conn
 
 
-async def _close_connection(conn: aiosqlite.Connection | None, db_path: str) -> None:
-    """Close connection and log."""
-    if conn is not None:
-        await conn.close()
-        logger.debug("Closed database connection", extra={"db_path": db_path})
+async def _get_pool(db_path: str) -> ConnectionPool:
+    """Return the pool for db_path, creating it on first use."""
+    pool = _pools.get(db_path)
+    if pool is not None and pool.loop is not asyncio.get_running_loop():
+        await pool.close()
+        pool = None
+    if pool is None:
+        pool = ConnectionPool(
+            db_path,
+            _setup_connection,
+            max_readers=DB_POOL_READERS,
+            health_check_interval=DB_POOL_HEALTH_CHECK_INTERVAL,
+        )
+        _pools[db_path] = pool
+    return pool
+
+
+def get_pool_stats(db_path: str | None = None) -> PoolStats | None:
+    """Return usage counters for the pool of db_path (default: current DB)."""
+    pool = _pools.get(db_path or get_db_path())
+    return pool.stats if pool is not None else None
+
+
+def get_lock_stats(db_path: str | None = None) -> FileLockStats | None:
+    """Return file-lock wait counters for db_path (default: current DB)."""
+    return get_file_lock_stats(f"{db_path or get_db_path()}.lock")
+
+
+async def close_pools() -> None:
+    """Close all pooled connections. Call on shutdown so worker threads exit."""
+    while _pools:
+        _, pool = _pools.popitem()
+        await pool.close()
 
 
 def _is_sqlite_busy_error(exc: BaseException) -> bool:
@@ -132,30 +166,38 @@ async def execute_with_retry(
 
 
 @asynccontextmanager
-async def _get_connection_inner(
-    db_path: str,
+async def _checkout(
+    db_path: str, read_only: bool
 ) -> AsyncGenerator[aiosqlite.Connection, None]:
-    """Inner connection logic without locking."""
-    conn: aiosqlite.Connection | None = None
+    """Check a pooled connection out for the block, logging failures."""
+    pool = await _get_pool(db_path)
+    checkout = pool.reader() if read_only else pool.writer()
     try:
-        conn = await _setup_connection(db_path)
-        logger.debug("Opened database connection", extra={"db_path": db_path})
-        yield conn
+        async with checkout as conn:
+            yield conn
     except Exception:
         logger.exception("Database connection failed", extra={"db_path": db_path})
         raise
-    finally:
-        await _close_connection(conn, db_path)
 
 
 @asynccontextmanager
-async def get_connection() -> AsyncGenerator[aiosqlite.Connection, None]:
-    """Async context manager for database connections with cross-process locking."""
+async def get_connection(
+    read_only: bool = False,
+) -> AsyncGenerator[aiosqlite.Connection, None]:
+    """Async context manager for pooled database connections.
+
+    Args:
+        read_only: Use one of the pooled reader connections (SELECT only),
+            taking the file lock selected by DB_LOCK_MODE. Otherwise the
+            single writer connection is checked out; callers that write must
+            commit before the block exits, anything left uncommitted is
+            rolled back when the connection returns to the pool.
+    """
     db_path = get_db_path()
     lock_path = f"{db_path}.lock"
 
-    async with _file_lock(lock_path):
-        async with _get_connection_inner(db_path) as conn:
+    async with file_lock(lock_path, _lock_operation(read_only)):
+        async with _checkout(db_path, read_only) as conn:
             yield conn
 
 
@@ -172,19 +214,16 @@ async def _handle_transaction_error(conn: aiosqlite.Connection, db_path: str) ->
 async def _transaction_inner(
     db_path: str,
 ) -> AsyncGenerator[aiosqlite.Connection, None]:
-    """Inner transaction logic - setup, yield, commit/rollback, cleanup."""
-    conn: aiosqlite.Connection | None = None
-    try:
-        conn = await _setup_connection(db_path)
-        await conn.execute("BEGIN")
-        yield conn
-        await execute_with_retry(conn.commit)
-    except Exception:
-        if conn is not None:
+    """Inner transaction logic - checkout writer, yield, commit/rollback."""
+    pool = await _get_pool(db_path)
+    async with pool.writer() as conn:
+        try:
+            await conn.execute("BEGIN")
+            yield conn
+            await execute_with_retry(conn.commit)
+        except Exception:
             await _handle_transaction_error(conn, db_path)
-        raise
-    finally:
-        await _close_connection(conn, db_path)
+            raise
 
 
 @asynccontextmanager
@@ -192,14 +231,13 @@ async def transaction() -> AsyncGenerator[aiosqlite.Connection, None]:
     """Async context manager for database transactions with automatic rollback.
 
     Uses two-level locking for safety:
-    1. File lock (fcntl.flock) - serializes across processes
-    2. asyncio.Lock - serializes within same process (faster, no syscall)
+    1. File lock (fcntl.flock, polled with LOCK_NB) - serializes across processes
+    2. Pool writer lock (asyncio.Lock) - serializes within same process
     3. Retry on commit - fallback for any edge cases
     """
     db_path = get_db_path()
     lock_path = f"{db_path}.lock"
 
-    async with _file_lock(lock_path):
-        async with _transaction_lock:
-            async with _transaction_inner(db_path) as conn:
-                yield conn
+    async with file_lock(lock_path):
+        async with _transaction_inner(db_path) as conn:
+            yield conn
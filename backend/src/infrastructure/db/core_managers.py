@@ -6,7 +6,7 @@ from typing import Any
 
 import aiosqlite
 
-from .base import ORMBase
+from .base import ORMBase, _with_conn
 from .models import History, LifeArea, User
 
 
@@ -59,6 +59,29 @@ class HistoriesManager(ORMBase[History]):
             "created_ts": data.created_ts,
         }
 
+    @classmethod
+    async def list_recent_by_user(
+        cls,
+        user_id: uuid.UUID,
+        limit: int,
+        conn: aiosqlite.Connection | None = None,
+    ) -> list[History]:
+        """Return the user's last ``limit`` messages, oldest first.
+
+        Walks the (user_id, created_ts) index backwards, so only the tail
+        rows are read and JSON-decoded regardless of total history size.
+        """
+        query = f"""
+            SELECT {", ".join(cls._columns)} FROM {cls._table}
+            WHERE user_id = ?
+            ORDER BY created_ts DESC
+            LIMIT ?
+        """
+        async with _with_conn(conn, read_only=True) as c:
+            cursor = await c.execute(query, (str(user_id), limit))
+            rows = await cursor.fetchall()
+        return [cls._row_to_obj(row) for row in reversed(rows)]
+
 
 class LifeAreasManager(ORMBase[LifeArea]):
     _table = "life_areas"
@@ -126,7 +149,7 @@ class LifeAreasManager(ORMBase[LifeArea]):
             ORDER BY id
         """
         if conn is None:
-            async with get_connection() as local_conn:
+            async with get_connection(read_only=True) as local_conn:
                 cursor = await local_conn.execute(query, (str(area_id),))
                 rows = await cursor.fetchall()
         else:
@@ -154,7 +177,7 @@ class LifeAreasManager(ORMBase[LifeArea]):
             SELECT id, title, parent_id, user_id, covered_at FROM ancestors
         """
         if conn is None:
-            async with get_connection() as local_conn:
+            async with get_connection(read_only=True) as local_conn:
                 cursor = await local_conn.execute(query, (str(area_id),))
                 rows = await cursor.fetchall()
         else:
@@ -0,0 +1,75 @@
+"""Embedding cache database manager."""
+
+import aiosqlite
+
+from src.shared.vectors import pack_vector, unpack_vector
+
+from .base import _with_conn
+
+
+class EmbeddingCacheManager:
+    """Manager for the embedding_cache table (content-hash key -> vector).
+
+    Note: Does not extend ORMBase because rows have no model class; keys are
+    opaque hashes built by src.infrastructure.embedding_cache.
+    """
+
+    _table = "embedding_cache"
+
+    @classmethod
+    async def get_vector(
+        cls, key: str, conn: aiosqlite.Connection | None = None
+    ) -> list[float] | None:
+        """Return the cached vector for key, or None."""
+        query = f"SELECT vector FROM {cls._table} WHERE key = ?"
+        async with _with_conn(conn, read_only=True) as c:
+            cursor = await c.execute(query, (key,))
+            row = await cursor.fetchone()
+        return list(unpack_vector(row["vector"])) if row else None
+
+    @classmethod
+    async def put_vector(
+        cls,
+        key: str,
+        vector: list[float],
+        created_at: float,
+        conn: aiosqlite.Connection | None = None,
+    ) -> None:
+        """Store a vector under key (first writer wins)."""
+        query = (
+            f"INSERT OR IGNORE INTO {cls._table} (key, vector, created_at)"
+            " VALUES (?, ?, ?)"
+        )
+        async with _with_conn(conn) as c:
+            await c.execute(query, (key, pack_vector(vector), created_at))
+            if conn is None:
+                await c.commit()
+
+    @classmethod
+    async def prune(
+        cls,
+        max_rows: int,
+        min_created_at: float,
+        conn: aiosqlite.Connection | None = None,
+    ) -> int:
+        """Drop rows created before min_created_at, then the oldest beyond max_rows.
+
+        max_rows <= 0 leaves the row count unbounded. Returns rows deleted.
+        """
+        deleted = 0
+        async with _with_conn(conn) as c:
+            cursor = await c.execute(
+                f"DELETE FROM {cls._table} WHERE created_at < ?", (min_created_at,)
+            )
+            deleted += cursor.rowcount
+            if max_rows > 0:
+                cursor = await c.execute(
+                    f"DELETE FROM {cls._table} WHERE key IN ("
+                    f" SELECT key FROM {cls._table}"
+                    " ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+                    (max_rows,),
+                )
+                deleted += cursor.rowcount
+            if conn is None:
+                await c.commit()
+        return deleted
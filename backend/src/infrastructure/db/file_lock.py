@@ -0,0 +1,151 @@
+"""Cross-process flock acquired by non-blocking polling on the event loop.
+
+Writers get priority over readers through a second "intent" lock file next
+to the main one. A writer holds LOCK_EX on the intent file while it waits for
+LOCK_EX on the main file; readers pass the intent file (LOCK_SH, released at
+once) before taking LOCK_SH on the main file. New readers therefore queue
+behind a waiting writer, which only waits for readers already holding the
+lock, so steady read traffic cannot starve writers.
+"""
+
+import asyncio
+import fcntl
+import logging
+import time
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Backoff between LOCK_NB attempts while another holder has the lock
+LOCK_POLL_INITIAL_WAIT = 0.001  # 1ms
+LOCK_POLL_MAX_WAIT = 0.05  # 50ms
+
+
+@dataclass
+class FileLockStats:
+    """Acquisition and wait-time counters for one lock file."""
+
+    acquisitions: int = 0
+    contended: int = 0
+    polls: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.acquisitions if self.acquisitions else 0.0
+
+    def record(self, waited: float, polls: int) -> None:
+        self.acquisitions += 1
+        self.polls += polls
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if polls:
+            self.contended += 1
+
+
+# Stats per lock path, kept for the life of the process
+_lock_stats: dict[str, FileLockStats] = {}
+
+# Lock paths the current task holds; a nested reader skips the intent gate,
+# since waiting there for a writer that waits for this task would deadlock
+_held: ContextVar[frozenset[str]] = ContextVar("file_locks_held", default=frozenset())
+
+
+def get_file_lock_stats(lock_path: str) -> FileLockStats | None:
+    """Return wait-time counters for lock_path, or None if never locked."""
+    return _lock_stats.get(lock_path)
+
+
+def _try_flock(fd: int, operation: int) -> bool:
+    """Attempt the lock without blocking; False means another holder has it."""
+    try:
+        fcntl.flock(fd, operation | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+async def _acquire(fd: int, operation: int) -> int:
+    """Poll for the lock with exponential backoff; return the number of retries.
+
+    Sleeping on the event loop instead of blocking in ``run_in_executor``
+    keeps waiters from exhausting the default thread pool.
+    """
+    polls = 0
+    delay = LOCK_POLL_INITIAL_WAIT
+    while not _try_flock(fd, operation):
+        polls += 1
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, LOCK_POLL_MAX_WAIT)
+    return polls
+
+
+async def _acquire_with_intent(
+    lock_file: object, lock_path: str, operation: int
+) -> int:
+    """Take the main lock through the writer-intent gate; return retries."""
+    if operation == fcntl.LOCK_SH and lock_path in _held.get():
+        return await _acquire(lock_file.fileno(), operation)
+    with open(f"{lock_path}.intent", "a") as intent_file:  # noqa: ASYNC230
+        intent = intent_file.fileno()
+        polls = await _acquire(intent, operation)
+        try:
+            if operation == fcntl.LOCK_SH:
+                fcntl.flock(intent, fcntl.LOCK_UN)
+            return polls + await _acquire(lock_file.fileno(), operation)
+        finally:
+            fcntl.flock(intent, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _holding(lock_path: str) -> Generator[None, None, None]:
+    """Mark lock_path as held by the current task for the block."""
+    token = _held.set(_held.get() | {lock_path})
+    try:
+        yield
+    finally:
+        _held.reset(token)
+
+
+def _release(lock_file: object, lock_path: str) -> None:
+    """Release file lock and close file.
+
+    The lock file is left in place: unlinking it would let a later opener
+    lock a fresh inode while another process still holds the old one.
+    """
+    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    lock_file.close()
+    logger.debug("Released file lock", extra={"lock_path": lock_path})
+
+
+@asynccontextmanager
+async def file_lock(
+    lock_path: str, operation: int | None = fcntl.LOCK_EX
+) -> AsyncGenerator[None, None]:
+    """Cross-process file lock using flock. Waits until lock is available.
+
+    Args:
+        lock_path: Path of the lock file (created if missing)
+        operation: fcntl.LOCK_EX or fcntl.LOCK_SH; None skips locking entirely
+    """
+    if operation is None:
+        yield
+        return
+    lock_file = open(lock_path, "a")  # noqa: ASYNC230
+    try:
+        start = time.monotonic()
+        polls = await _acquire_with_intent(lock_file, lock_path, operation)
+        waited = time.monotonic() - start
+        _lock_stats.setdefault(lock_path, FileLockStats()).record(waited, polls)
+        logger.debug(
+            "Acquired file lock",
+            extra={"lock_path": lock_path, "wait_ms": round(waited * 1000, 1)},
+        )
+        with _holding(lock_path):
+            yield
+    finally:
+        _release(lock_file, lock_path)
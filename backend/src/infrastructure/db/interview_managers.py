@@ -2,10 +2,13 @@
 
 import json
 import uuid
+from collections.abc import Sequence
 from typing import Any
 
 import aiosqlite
 
+from src.shared.vectors import pack_vector, unpack_vector, vector_norm
+
 from .base import ORMBase, _with_conn
 from .models import Summary
 
@@ -27,7 +30,7 @@ class SummariesManager(ORMBase[Summary]):
 
     @classmethod
     def _row_to_obj(cls, row: aiosqlite.Row) -> Summary:
-        vector = json.loads(row["vector"]) if row["vector"] else None
+        vector = list(unpack_vector(row["vector"])) if row["vector"] else None
         return Summary(
             id=uuid.UUID(row["id"]),
             area_id=uuid.UUID(row["area_id"]),
@@ -46,10 +49,21 @@ class SummariesManager(ORMBase[Summary]):
             "summary_text": data.summary_text,
             "question_id": str(data.question_id) if data.question_id else None,
             "answer_id": str(data.answer_id) if data.answer_id else None,
-            "vector": json.dumps(data.vector) if data.vector else None,
+            **cls._vector_columns(data.vector),
             "created_at": data.created_at,
         }
 
+    @staticmethod
+    def _vector_columns(vector: Sequence[float] | None) -> dict[str, Any]:
+        """Packed float32 blob plus its dimension and L2 norm."""
+        if not vector:
+            return {"vector": None, "vector_dim": None, "vector_norm": None}
+        return {
+            "vector": pack_vector(vector),
+            "vector_dim": len(vector),
+            "vector_norm": vector_norm(vector),
+        }
+
     @classmethod
     async def create_summary(
         cls,
@@ -91,10 +105,15 @@ class SummariesManager(ORMBase[Summary]):
         vector: list[float],
         conn: aiosqlite.Connection | None = None,
     ) -> None:
-        """Write embedding vector to a summary record."""
-        query = f"UPDATE {cls._table} SET vector = ? WHERE id = ?"
+        """Write embedding vector (packed float32) to a summary record."""
+        columns = cls._vector_columns(vector)
+        query = (
+            f"UPDATE {cls._table}"
+            " SET vector = :vector, vector_dim = :vector_dim, vector_norm = :vector_norm"
+            " WHERE id = :id"
+        )
         async with _with_conn(conn) as c:
-            await c.execute(query, (json.dumps(vector), str(summary_id)))
+            await c.execute(query, {**columns, "id": str(summary_id)})
             if conn is None:
                 await c.commit()
 
@@ -122,29 +141,56 @@ class SummariesManager(ORMBase[Summary]):
             WHERE la.user_id = ?
             ORDER BY s.created_at DESC
         """
-        async with _with_conn(conn) as c:
+        async with _with_conn(conn, read_only=True) as c:
             cursor = await c.execute(query, (str(user_id),))
             rows = await cursor.fetchall()
         return [cls._row_to_obj(row) for row in rows]
 
     @classmethod
     async def list_vectors_by_user(
-        cls, user_id: uuid.UUID, conn: aiosqlite.Connection | None = None
-    ) -> list[tuple[str, list[float]]]:
+        cls,
+        user_id: uuid.UUID,
+        conn: aiosqlite.Connection | None = None,
+        after_seq: int = -1,
+        upto_seq: int | None = None,
+    ) -> list[tuple[str, Sequence[float]]]:
         """Return (id, vector) pairs for all vectorized summaries owned by user.
 
         Only loads id and vector columns to avoid fetching full summary text.
+        Vectors are float32 views over the fetched blobs, decoded without copying.
+        after_seq/upto_seq restrict the result to vectors whose ``vector_seq``
+        falls in (after_seq, upto_seq]; rows written before sequencing count as 0.
         """
         query = """
             SELECT s.id, s.vector
             FROM summaries s
             JOIN life_areas la ON s.area_id = la.id
             WHERE la.user_id = ? AND s.vector IS NOT NULL
+              AND COALESCE(s.vector_seq, 0) > ?
         """
-        async with _with_conn(conn) as c:
-            cursor = await c.execute(query, (str(user_id),))
+        params: list[Any] = [str(user_id), after_seq]
+        if upto_seq is not None:
+            query += " AND COALESCE(s.vector_seq, 0) <= ?"
+            params.append(upto_seq)
+        async with _with_conn(conn, read_only=True) as c:
+            cursor = await c.execute(query, params)
             rows = await cursor.fetchall()
-        return [(row["id"], json.loads(row["vector"])) for row in rows]
+        return [(row["id"], unpack_vector(row["vector"])) for row in rows]
+
+    @classmethod
+    async def get_vector_state(
+        cls, user_id: uuid.UUID, conn: aiosqlite.Connection | None = None
+    ) -> tuple[int, int]:
+        """Return the user's (seq, generation) vector change counters.
+
+        Maintained by triggers (schema migration 9); (0, 0) if the user's
+        vectors never changed since the migration.
+        """
+        query = "SELECT seq, generation FROM vector_index_state WHERE user_id = ?"
+        async with _with_conn(conn, read_only=True) as c:
+            cursor = await c.execute(query, (str(user_id),))
+            row = await cursor.fetchone()
+        return (row["seq"], row["generation"]) if row else (0, 0)
 
 
 class LeafHistoryManager:
@@ -188,7 +234,7 @@ class LeafHistoryManager:
             WHERE lh.leaf_id = ?
             ORDER BY h.created_ts
         """
-        async with _with_conn(conn) as c:
+        async with _with_conn(conn, read_only=True) as c:
             cursor = await c.execute(query, (str(leaf_id),))
             rows = await cursor.fetchall()
         return [json.loads(row["message_data"]) for row in rows]
@@ -209,7 +255,7 @@ class LeafHistoryManager:
             WHERE lh.leaf_id = ?
             ORDER BY h.created_ts
         """
-        async with _with_conn(conn) as c:
+        async with _with_conn(conn, read_only=True) as c:
             cursor = await c.execute(query, (str(leaf_id),))
             rows = await cursor.fetchall()
         return [(uuid.UUID(row["id"]), json.loads(row["message_data"])) for row in rows]
@@ -220,7 +266,7 @@ class LeafHistoryManager:
     ) -> int:
         """Get count of messages linked to a leaf."""
         query = f"SELECT COUNT(*) FROM {cls._table} WHERE leaf_id = ?"
-        async with _with_conn(conn) as c:
+        async with _with_conn(conn, read_only=True) as c:
             cursor = await c.execute(query, (str(leaf_id),))
             row = await cursor.fetchone()
         return row[0] if row else 0
@@ -49,7 +49,18 @@ class UserKnowledgeManager(ORMBase[UserKnowledge]):
             JOIN life_areas la ON s.area_id = la.id
             WHERE la.user_id = ?
         """
-        async with _with_conn(conn) as c:
+        async with _with_conn(conn, read_only=True) as c:
             cursor = await c.execute(query, (str(user_id),))
             rows = await cursor.fetchall()
         return [cls._row_to_obj(row) for row in rows]
+
+    @classmethod
+    async def delete_by_summary(
+        cls, summary_id: uuid.UUID, conn: aiosqlite.Connection | None = None
+    ) -> None:
+        """Delete knowledge items extracted from a summary."""
+        query = f"DELETE FROM {cls._table} WHERE summary_id = ?"
+        async with _with_conn(conn) as c:
+            await c.execute(query, (str(summary_id),))
+            if conn is None:
+                await c.commit()
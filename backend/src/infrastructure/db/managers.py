@@ -13,6 +13,9 @@ from .core_managers import (
     UsersManager,
 )
 
+# Embedding Cache Manager
+from .embedding_managers import EmbeddingCacheManager
+
 # Interview Managers
 from .interview_managers import (
     LeafHistoryManager,
@@ -32,6 +35,9 @@ from .models import (
     UserKnowledge,
 )
 
+# Queue Managers
+from .queue_managers import ExtractQueueManager
+
 __all__ = [
     # Models
     "ApiKey",
@@ -42,6 +48,8 @@ __all__ = [
     "UserKnowledge",
     # Managers
     "ApiKeysManager",
+    "EmbeddingCacheManager",
+    "ExtractQueueManager",
     "HistoriesManager",
     "LeafHistoryManager",
     "LifeAreasManager",
@@ -0,0 +1,167 @@
+"""Long-lived aiosqlite connection pool: bounded readers plus a single writer."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+ConnectionFactory = Callable[[str, bool], Awaitable[aiosqlite.Connection]]
+
+
+@dataclass
+class PoolStats:
+    """Counters describing pool usage since it was created."""
+
+    checkouts: int = 0
+    waits: int = 0
+    opened: int = 0
+    closed: int = 0
+    health_check_failures: int = 0
+    in_use: int = 0
+
+    @property
+    def open_count(self) -> int:
+        return self.opened - self.closed
+
+
+class ConnectionPool:
+    """Bounded pool of persistent connections for one database file.
+
+    Readers share up to ``max_readers`` connections opened with
+    ``PRAGMA query_only``; all writes go through one writer connection
+    guarded by an asyncio.Lock. Connections are opened lazily and reused,
+    so PRAGMAs and schema checks run once per physical connection.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        connect: ConnectionFactory,
+        max_readers: int,
+        health_check_interval: float,
+    ) -> None:
+        self.db_path = db_path
+        self.stats = PoolStats()
+        self.loop = asyncio.get_running_loop()
+        self._connect = connect
+        self._health_check_interval = health_check_interval
+        self._readers = asyncio.Semaphore(max(1, max_readers))
+        self._idle: deque[tuple[aiosqlite.Connection, float]] = deque()
+        self._writer_lock = asyncio.Lock()
+        self._writer: aiosqlite.Connection | None = None
+        self._writer_last_used = 0.0
+
+    async def _open(self, read_only: bool) -> aiosqlite.Connection:
+        conn = await self._connect(self.db_path, read_only)
+        self.stats.opened += 1
+        logger.debug(
+            "Opened pooled connection",
+            extra={"db_path": self.db_path, "read_only": read_only},
+        )
+        return conn
+
+    async def _discard(self, conn: aiosqlite.Connection) -> None:
+        self.stats.closed += 1
+        try:
+            await conn.close()
+        except Exception:
+            logger.debug("Failed to close pooled connection", exc_info=True)
+
+    async def _is_healthy(self, conn: aiosqlite.Connection, last_used: float) -> bool:
+        """Probe connections that sat idle longer than the health-check interval."""
+        if time.monotonic() - last_used < self._health_check_interval:
+            return True
+        try:
+            await conn.execute("SELECT 1")
+            return True
+        except Exception:
+            self.stats.health_check_failures += 1
+            logger.warning("Pooled connection failed health check")
+            return False
+
+    async def _reset(self, conn: aiosqlite.Connection) -> None:
+        """Roll back anything a caller left uncommitted before reuse."""
+        if conn.in_transaction:
+            await conn.rollback()
+
+    async def _checkout_reader(self) -> aiosqlite.Connection:
+        while self._idle:
+            conn, last_used = self._idle.pop()
+            if await self._is_healthy(conn, last_used):
+                return conn
+            await self._discard(conn)
+        return await self._open(read_only=True)
+
+    async def _checkout_writer(self) -> aiosqlite.Connection:
+        if self._writer is not None and not await self._is_healthy(
+            self._writer, self._writer_last_used
+        ):
+            await self._discard(self._writer)
+            self._writer = None
+        if self._writer is None:
+            self._writer = await self._open(read_only=False)
+        return self._writer
+
+    async def _checkin(self, conn: aiosqlite.Connection) -> bool:
+        """Reset a returned connection; False means it is broken and was closed."""
+        self.stats.in_use -= 1
+        try:
+            await self._reset(conn)
+            return True
+        except Exception:
+            logger.warning("Dropping pooled connection after failed reset")
+            await self._discard(conn)
+            return False
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Check out a read-only connection for the duration of the block."""
+        if self._readers.locked():
+            self.stats.waits += 1
+        async with self._readers:
+            conn = await self._checkout_reader()
+            self.stats.checkouts += 1
+            self.stats.in_use += 1
+            try:
+                yield conn
+            finally:
+                if await self._checkin(conn):
+                    self._idle.append((conn, time.monotonic()))
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Check out the single writer connection for the duration of the block."""
+        if self._writer_lock.locked():
+            self.stats.waits += 1
+        async with self._writer_lock:
+            conn = await self._checkout_writer()
+            self.stats.checkouts += 1
+            self.stats.in_use += 1
+            try:
+                yield conn
+            finally:
+                if await self._checkin(conn):
+                    self._writer_last_used = time.monotonic()
+                else:
+                    self._writer = None
+
+    async def close(self) -> None:
+        """Close every idle connection and the writer.
+
+        Does not wait on the pool locks, so it is safe to call from a
+        different event loop than the one the pool was created on.
+        """
+        while self._idle:
+            conn, _ = self._idle.pop()
+            await self._discard(conn)
+        if self._writer is not None:
+            await self._discard(self._writer)
+            self._writer = None
+        logger.debug("Closed connection pool", extra={"db_path": self.db_path})
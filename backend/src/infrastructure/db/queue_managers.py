@@ -0,0 +1,153 @@
+"""Durable extract queue database manager."""
+
+import uuid
+
+import aiosqlite
+
+from .base import _with_conn
+
+
+class ExtractQueueManager:
+    """Manager for the extract_queue table (claim/lease/ack work queue).
+
+    Note: Does not extend ORMBase because rows are queue entries keyed by
+    summary_id rather than domain objects. Claims, acks and failures are
+    single statements, so they are atomic without an explicit transaction.
+    """
+
+    _table = "extract_queue"
+
+    @classmethod
+    async def enqueue(
+        cls,
+        summary_ids: list[uuid.UUID],
+        now: float,
+        conn: aiosqlite.Connection | None = None,
+    ) -> None:
+        """Add summaries as pending; summaries already queued are left as they are."""
+        query = (
+            f"INSERT OR IGNORE INTO {cls._table}"
+            " (summary_id, status, attempts, available_at, created_at)"
+            " VALUES (?, 'pending', 0, ?, ?)"
+        )
+        async with _with_conn(conn) as c:
+            await c.executemany(query, [(str(sid), now, now) for sid in summary_ids])
+            if conn is None:
+                await c.commit()
+
+    @classmethod
+    async def enqueue_missing_vectors(
+        cls, now: float, conn: aiosqlite.Connection | None = None
+    ) -> int:
+        """Queue every non-empty summary that has no vector yet; returns the count."""
+        query = f"""
+            INSERT OR IGNORE INTO {cls._table}
+                (summary_id, status, attempts, available_at, created_at)
+            SELECT id, 'pending', 0, ?, ? FROM summaries
+            WHERE vector IS NULL AND summary_text != ''
+        """
+        async with _with_conn(conn) as c:
+            cursor = await c.execute(query, (now, now))
+            if conn is None:
+                await c.commit()
+        return cursor.rowcount
+
+    @classmethod
+    async def claim(
+        cls,
+        owner: str,
+        limit: int,
+        now: float,
+        lease_expires: float,
+        conn: aiosqlite.Connection | None = None,
+    ) -> list[tuple[uuid.UUID, int]]:
+        """Lease up to limit available entries, oldest first.
+
+        Available means pending and past available_at, or leased with an
+        expired lease (the previous owner crashed or stalled).
+
+        Returns:
+            (summary_id, attempts) pairs, attempts including this claim.
+        """
+        query = f"""
+            UPDATE {cls._table}
+            SET status = 'leased', lease_owner = :owner,
+                lease_expires = :lease_expires, attempts = attempts + 1
+            WHERE summary_id IN (
+                SELECT summary_id FROM {cls._table}
+                WHERE (status = 'pending' AND available_at <= :now)
+                   OR (status = 'leased' AND lease_expires <= :now)
+                ORDER BY created_at
+                LIMIT :limit
+            )
+            RETURNING summary_id, attempts, created_at
+        """
+        params = {
+            "owner": owner,
+            "lease_expires": lease_expires,
+            "now": now,
+            "limit": limit,
+        }
+        async with _with_conn(conn) as c:
+            cursor = await c.execute(query, params)
+            rows = await cursor.fetchall()
+            if conn is None:
+                await c.commit()
+        rows = sorted(rows, key=lambda row: row["created_at"])
+        return [(uuid.UUID(row["summary_id"]), row["attempts"]) for row in rows]
+
+    @classmethod
+    async def ack(
+        cls,
+        summary_ids: list[uuid.UUID],
+        owner: str,
+        conn: aiosqlite.Connection | None = None,
+    ) -> None:
+        """Remove completed entries still leased by owner."""
+        query = f"DELETE FROM {cls._table} WHERE summary_id = ? AND lease_owner = ?"
+        async with _with_conn(conn) as c:
+            await c.executemany(query, [(str(sid), owner) for sid in summary_ids])
+            if conn is None:
+                await c.commit()
+
+    @classmethod
+    async def fail(
+        cls,
+        summary_id: uuid.UUID,
+        owner: str,
+        error: str,
+        retry_at: float | None,
+        conn: aiosqlite.Connection | None = None,
+    ) -> None:
+        """Release a failed lease: back to pending at retry_at, or dead if None."""
+        query = f"""
+            UPDATE {cls._table}
+            SET status = :status, available_at = COALESCE(:retry_at, available_at),
+                lease_owner = NULL, lease_expires = NULL, last_error = :error
+            WHERE summary_id = :summary_id AND lease_owner = :owner
+        """
+        params = {
+            "status": "dead" if retry_at is None else "pending",
+            "retry_at": retry_at,
+            "error": error,
+            "summary_id": str(summary_id),
+            "owner": owner,
+        }
+        async with _with_conn(conn) as c:
+            await c.execute(query, params)
+            if conn is None:
+                await c.commit()
+
+    @classmethod
+    async def counts(
+        cls, conn: aiosqlite.Connection | None = None
+    ) -> dict[str, tuple[int, float]]:
+        """Return {status: (count, oldest created_at)} for non-empty statuses."""
+        query = (
+            f"SELECT status, COUNT(*) AS n, MIN(created_at) AS oldest"
+            f" FROM {cls._table} GROUP BY status"
+        )
+        async with _with_conn(conn, read_only=True) as c:
+            cursor = await c.execute(query)
+            rows = await cursor.fetchall()
+        return {row["status"]: (row["n"], row["oldest"]) for row in rows}
@@ -1,10 +1,13 @@
 import asyncio
+import json
 import time
 from collections.abc import Awaitable, Callable
 from typing import NamedTuple
 
 import aiosqlite
 
+from src.shared.vectors import pack_vector, vector_norm
+
 # Track which database file has been initialized to avoid redundant initialization
 _db_initialized_paths: set[str] = set()
 _init_lock = asyncio.Lock()
@@ -35,8 +38,6 @@ _SCHEMA_SQL = """
         PRIMARY KEY (leaf_id, history_id)
     );
     CREATE INDEX IF NOT EXISTS leaf_history_leaf_idx ON leaf_history(leaf_id);
-    CREATE INDEX IF NOT EXISTS histories_user_id_idx
-        ON histories(user_id);
     CREATE INDEX IF NOT EXISTS histories_created_ts_idx
         ON histories(created_ts);
     CREATE INDEX IF NOT EXISTS life_areas_user_id_idx
@@ -58,7 +59,7 @@ _SCHEMA_SQL = """
         summary_text TEXT NOT NULL,
         question_id TEXT,
         answer_id TEXT,
-        vector TEXT,
+        vector BLOB,
         created_at REAL NOT NULL
     );
     CREATE INDEX IF NOT EXISTS idx_summaries_area_id ON summaries(area_id);
@@ -159,6 +160,138 @@ async def _migration_006(conn: aiosqlite.Connection) -> None:
     )
 
 
+async def _migration_007(conn: aiosqlite.Connection) -> None:
+    # Composite index serves both user filtering and newest-first tail reads,
+    # making the single-column user_id index redundant
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS histories_user_created_ts_idx"
+        " ON histories(user_id, created_ts)"
+    )
+    await conn.execute("DROP INDEX IF EXISTS histories_user_id_idx")
+
+
+async def _migration_008(conn: aiosqlite.Connection) -> None:
+    await ensure_column_async(conn, "summaries", "vector_dim", "vector_dim INTEGER")
+    await ensure_column_async(conn, "summaries", "vector_norm", "vector_norm REAL")
+    # Convert JSON-text vectors to packed float32 blobs
+    cursor = await conn.execute(
+        "SELECT id, vector FROM summaries WHERE typeof(vector) = 'text'"
+    )
+    rows = await cursor.fetchall()
+    updates = []
+    for row in rows:
+        vector = json.loads(row["vector"])
+        updates.append(
+            (pack_vector(vector), len(vector), vector_norm(vector), row["id"])
+        )
+    await conn.executemany(
+        "UPDATE summaries SET vector = ?, vector_dim = ?, vector_norm = ? WHERE id = ?",
+        updates,
+    )
+
+
+# Per-user change tracking for in-memory vector indexes (possibly in another
+# process): "seq" advances on every new vector and stamps the row, so caches
+# can fetch only rows with vector_seq > cached seq; "generation" advances when
+# a vector may have been removed or replaced, which forces a rebuild.
+_VECTOR_INDEX_STATE_SQL = """
+    CREATE TABLE IF NOT EXISTS vector_index_state (
+        user_id TEXT PRIMARY KEY,
+        seq INTEGER NOT NULL DEFAULT 0,
+        generation INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TRIGGER IF NOT EXISTS summaries_vector_written
+    AFTER UPDATE OF vector ON summaries WHEN NEW.vector IS NOT NULL
+    BEGIN
+        INSERT INTO vector_index_state (user_id, seq, generation)
+            SELECT user_id, 1, 0 FROM life_areas WHERE id = NEW.area_id
+            ON CONFLICT (user_id) DO UPDATE SET
+                seq = seq + 1,
+                generation = generation + (OLD.vector IS NOT NULL);
+        UPDATE summaries SET vector_seq = (
+            SELECT vis.seq FROM vector_index_state vis
+            JOIN life_areas la ON la.user_id = vis.user_id
+            WHERE la.id = NEW.area_id
+        ) WHERE id = NEW.id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS summaries_vector_cleared
+    AFTER UPDATE OF vector ON summaries
+    WHEN NEW.vector IS NULL AND OLD.vector IS NOT NULL
+    BEGIN
+        INSERT INTO vector_index_state (user_id, seq, generation)
+            SELECT user_id, 0, 1 FROM life_areas WHERE id = OLD.area_id
+            ON CONFLICT (user_id) DO UPDATE SET generation = generation + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS summaries_vector_inserted
+    AFTER INSERT ON summaries WHEN NEW.vector IS NOT NULL
+    BEGIN
+        INSERT INTO vector_index_state (user_id, seq, generation)
+            SELECT user_id, 0, 1 FROM life_areas WHERE id = NEW.area_id
+            ON CONFLICT (user_id) DO UPDATE SET generation = generation + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS summaries_vector_deleted
+    AFTER DELETE ON summaries WHEN OLD.vector IS NOT NULL
+    BEGIN
+        INSERT INTO vector_index_state (user_id, seq, generation)
+            SELECT user_id, 0, 1 FROM life_areas WHERE id = OLD.area_id
+            ON CONFLICT (user_id) DO UPDATE SET generation = generation + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS life_areas_deleted
+    AFTER DELETE ON life_areas
+    BEGIN
+        INSERT INTO vector_index_state (user_id, seq, generation)
+            VALUES (OLD.user_id, 0, 1)
+            ON CONFLICT (user_id) DO UPDATE SET generation = generation + 1;
+    END;
+"""
+
+
+async def _migration_009(conn: aiosqlite.Connection) -> None:
+    await ensure_column_async(conn, "summaries", "vector_seq", "vector_seq INTEGER")
+    await conn.executescript(_VECTOR_INDEX_STATE_SQL)
+
+
+async def _migration_010(conn: aiosqlite.Connection) -> None:
+    # Optional persistent layer of the embedding cache (EMBEDDING_CACHE_BACKEND)
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            key TEXT PRIMARY KEY,
+            vector BLOB NOT NULL,
+            created_at REAL NOT NULL
+        )
+    """)
+
+
+async def _migration_011(conn: aiosqlite.Connection) -> None:
+    # Durable extract queue: rows are deleted on ack; status is
+    # 'pending' (claimable once available_at passes), 'leased' (claimed until
+    # lease_expires) or 'dead' (retries exhausted)
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS extract_queue (
+            summary_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            available_at REAL NOT NULL,
+            lease_owner TEXT,
+            lease_expires REAL,
+            last_error TEXT,
+            created_at REAL NOT NULL
+        )
+    """)
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_extract_queue_status"
+        " ON extract_queue(status, available_at)"
+    )
+
+
+async def _migration_012(conn: aiosqlite.Connection) -> None:
+    # Serves the embedding cache prune (TTL and oldest-first row cap)
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS embedding_cache_created_at_idx"
+        " ON embedding_cache(created_at)"
+    )
+
+
 _MIGRATIONS: list[Migration] = [
     Migration(1, "Add current_area_id to users", _migration_001),
     Migration(2, "Add covered_at to life_areas", _migration_002),
@@ -166,6 +299,12 @@ _MIGRATIONS: list[Migration] = [
     Migration(4, "Drop extracted_at from life_areas", _migration_004),
     Migration(5, "Drop deprecated tables", _migration_005),
     Migration(6, "Create api_keys table", _migration_006),
+    Migration(7, "Index histories by (user_id, created_ts)", _migration_007),
+    Migration(8, "Store summary vectors as packed float32 blobs", _migration_008),
+    Migration(9, "Track vector changes per user for index caches", _migration_009),
+    Migration(10, "Create embedding_cache table", _migration_010),
+    Migration(11, "Create extract_queue table", _migration_011),
+    Migration(12, "Index embedding_cache by created_at", _migration_012),
 ]
 
 
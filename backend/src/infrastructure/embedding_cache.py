@@ -0,0 +1,176 @@
+"""Content-hash keyed cache for embedding vectors.
+
+Keys are SHA-256 digests of (model, dimensions, text), so a model or
+dimension change never serves stale vectors. Two layers:
+
+- in-process LRU of EMBEDDING_CACHE_SIZE entries (always on unless 0)
+- optional SQLite ``embedding_cache`` table (EMBEDDING_CACHE_BACKEND=sqlite),
+  shared by the main app and the MCP server and kept across restarts; pruned
+  to EMBEDDING_CACHE_TTL_DAYS and EMBEDDING_CACHE_MAX_ROWS on the first
+  insert of a process and every _PRUNE_EVERY inserts after that
+
+Entries are immutable: the same key always maps to the same vector, so
+concurrent misses for one key share a single lookup and embedding call.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import aiosqlite
+
+from src.config.settings import (
+    EMBEDDING_CACHE_BACKEND,
+    EMBEDDING_CACHE_MAX_ROWS,
+    EMBEDDING_CACHE_SIZE,
+    EMBEDDING_CACHE_TTL_DAYS,
+)
+from src.infrastructure.db import managers as db
+from src.shared.timestamp import get_timestamp
+
+logger = logging.getLogger(__name__)
+
+# Persisted inserts between two prunes of the SQLite layer
+_PRUNE_EVERY = 256
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters describing cache usage since process start."""
+
+    hits: int = 0
+    persistent_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    pruned: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without calling the embedding API."""
+        lookups = self.hits + self.persistent_hits + self.misses
+        return (self.hits + self.persistent_hits) / lookups if lookups else 0.0
+
+
+def cache_key(model: str, dimensions: int, text: str) -> str:
+    """Stable cache key for an embedding request."""
+    digest = hashlib.sha256()
+    for part in (model, str(dimensions), text):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """LRU of embedding vectors with an optional SQLite layer behind it."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        persistent: bool = False,
+        max_rows: int = 0,
+        ttl_seconds: float = 0.0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self.max_rows = max_rows
+        self.ttl_seconds = ttl_seconds
+        self.stats = EmbeddingCacheStats()
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[list[float]]] = {}
+        self._inserts_since_prune = _PRUNE_EVERY
+
+    async def get_or_embed(
+        self, key: str, embed: Callable[[], Awaitable[list[float]]]
+    ) -> list[float]:
+        """Return the vector for key, calling embed() only on a miss."""
+        vector = self._entries.get(key)
+        if vector is not None:
+            self.stats.hits += 1
+            self._entries.move_to_end(key)
+            return list(vector)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+        else:
+            task = asyncio.ensure_future(self._load(key, embed))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a cancelled caller does not cancel the other waiters
+        return list(await asyncio.shield(task))
+
+    async def _load(
+        self, key: str, embed: Callable[[], Awaitable[list[float]]]
+    ) -> list[float]:
+        """Resolve a memory miss from SQLite or embed(), then keep it in memory."""
+        vector = await self._lookup(key)
+        if vector is None:
+            vector = await embed()
+            self.stats.misses += 1
+            if self.persistent:
+                await self._persist(key, vector)
+        self._store(key, vector)
+        return vector
+
+    async def _lookup(self, key: str) -> list[float] | None:
+        if not self.persistent:
+            return None
+        vector = await db.EmbeddingCacheManager.get_vector(key)
+        if vector is not None:
+            self.stats.persistent_hits += 1
+        return vector
+
+    async def _persist(self, key: str, vector: list[float]) -> None:
+        # The vector is already paid for; a failed write only costs a future miss
+        try:
+            await db.EmbeddingCacheManager.put_vector(key, vector, get_timestamp())
+            self._inserts_since_prune += 1
+            if self._inserts_since_prune >= _PRUNE_EVERY:
+                self._inserts_since_prune = 0
+                await self._prune()
+        except aiosqlite.Error:
+            logger.warning("Failed to persist embedding", exc_info=True)
+
+    async def _prune(self) -> None:
+        """Apply the TTL and row cap to the SQLite layer."""
+        min_created_at = (
+            get_timestamp() - self.ttl_seconds if self.ttl_seconds > 0 else 0.0
+        )
+        self.stats.pruned += await db.EmbeddingCacheManager.prune(
+            self.max_rows, min_created_at
+        )
+
+    def _store(self, key: str, vector: list[float]) -> None:
+        """Insert as most recently used, then evict down to max_entries."""
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
+
+
+_cache = EmbeddingCache(
+    EMBEDDING_CACHE_SIZE,
+    persistent=EMBEDDING_CACHE_BACKEND == "sqlite",
+    max_rows=EMBEDDING_CACHE_MAX_ROWS,
+    ttl_seconds=EMBEDDING_CACHE_TTL_DAYS * 86400,
+)
+
+
+async def get_or_embed(
+    key: str, embed: Callable[[], Awaitable[list[float]]]
+) -> list[float]:
+    """Return the vector for key from the process cache, embedding on a miss."""
+    return await _cache.get_or_embed(key, embed)
+
+
+def get_embedding_cache_stats() -> EmbeddingCacheStats:
+    """Return cache counters for this process."""
+    return _cache.stats
@@ -1,19 +1,78 @@
 """OpenRouter embedding client wrapper."""
 
+from functools import lru_cache
+
+import openai
 from langchain_openai import OpenAIEmbeddings
 
-from src.config.settings import EMBEDDING_DIMENSIONS, EMBEDDING_MODEL, load_api_key
+from src.config.settings import (
+    EMBEDDING_DIMENSIONS,
+    EMBEDDING_MODEL,
+    EXTRACT_EMBED_BATCH_MAX_WAIT,
+    EXTRACT_EMBED_BATCH_SIZE,
+    load_api_key,
+)
+from src.infrastructure.embedding_cache import cache_key, get_or_embed
+from src.infrastructure.http_clients import get_async_http_client
+from src.shared.batching import BatcherStats, MicroBatcher
+from src.shared.retry import invoke_with_retry
 
 
+@lru_cache(maxsize=1)
 def get_embedding_client() -> OpenAIEmbeddings:
-    """Create an OpenAI embeddings client configured for OpenRouter.
+    """Get the process-wide OpenAI embeddings client configured for OpenRouter.
 
     Returns:
-        OpenAIEmbeddings instance configured with OpenRouter API.
+        OpenAIEmbeddings instance on the shared HTTP connection pool.
     """
     return OpenAIEmbeddings(
         model=EMBEDDING_MODEL,
         api_key=load_api_key(),
         base_url="https://openrouter.ai/api/v1",
         dimensions=EMBEDDING_DIMENSIONS,
+        http_async_client=get_async_http_client(),
+    )
+
+
+async def embed_text(text: str) -> list[float]:
+    """Embed a search query (single request), served from the embedding cache if possible.
+
+    Returns:
+        Embedding vector for text.
+    """
+    key = cache_key(EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, text)
+    return await get_or_embed(key, lambda: get_embedding_client().aembed_query(text))
+
+
+async def _embed_documents(texts: list[str]) -> list[list[float]]:
+    # Transient errors retry the whole batch with backoff
+    return await invoke_with_retry(
+        lambda: get_embedding_client().aembed_documents(texts)
     )
+
+
+# Only errors a single text can cause (e.g. over the token limit) split a batch
+_document_batcher = MicroBatcher(
+    _embed_documents,
+    EXTRACT_EMBED_BATCH_SIZE,
+    EXTRACT_EMBED_BATCH_MAX_WAIT,
+    split_on=(ValueError, openai.BadRequestError, openai.UnprocessableEntityError),
+)
+
+
+async def embed_document(text: str) -> list[float]:
+    """Embed a document text via batched aembed_documents calls.
+
+    Concurrent callers (e.g. extract workers) are coalesced into one API call;
+    cache hits skip the batch entirely.
+
+    Returns:
+        Embedding vector for text.
+    """
+    key = cache_key(EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, text)
+    return await get_or_embed(key, lambda: _document_batcher.submit(text))
+
+
+def get_embedding_batch_stats() -> BatcherStats:
+    """Return document batching counters for this process."""
+    return _document_batcher.stats
@@ -0,0 +1,95 @@
+"""Process-wide shared HTTP connection pool for LLM and embedding clients.
+
+Every ChatOpenAI / OpenAIEmbeddings instance is built with the same
+``httpx.AsyncClient``, so all of them share keep-alive connections and TLS
+sessions to the API host instead of each owning a private pool.
+"""
+
+import importlib.util
+import logging
+from dataclasses import dataclass
+
+import httpx
+
+from src.config.settings import (
+    HTTP_HTTP2,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Matches the OpenAI SDK defaults (generous read timeout for long generations)
+_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+@dataclass
+class HttpPoolStats:
+    """Snapshot of the shared pool: requests since start and open connections."""
+
+    requests: int = 0
+    connections: int = 0
+    idle_connections: int = 0
+    max_connections: int = HTTP_MAX_CONNECTIONS
+    http2: bool = False
+
+
+_client: httpx.AsyncClient | None = None
+_transport: httpx.AsyncHTTPTransport | None = None
+_stats = HttpPoolStats()
+
+
+async def _count_request(request: httpx.Request) -> None:
+    _stats.requests += 1
+
+
+def _http2_enabled() -> bool:
+    if HTTP_HTTP2 != "on":
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP_HTTP2=on but h2 is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use."""
+    global _client, _transport
+    if _client is None:
+        _stats.http2 = _http2_enabled()
+        _transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+            ),
+            http2=_stats.http2,
+        )
+        _client = httpx.AsyncClient(
+            transport=_transport,
+            timeout=_TIMEOUT,
+            event_hooks={"request": [_count_request]},
+        )
+    return _client
+
+
+def get_http_pool_stats() -> HttpPoolStats:
+    """Return request count and current connection usage of the shared pool."""
+    # httpx exposes no public pool accessor, so this reads the private
+    # transport._pool (an httpcore pool); if a release renames it, connection
+    # gauges stay at zero and only the request count is reported
+    pool = getattr(_transport, "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is not None:
+        _stats.connections = len(connections)
+        _stats.idle_connections = sum(1 for c in connections if c.is_idle())
+    return _stats
+
+
+async def close_http_clients() -> None:
+    """Close the shared client (call on shutdown from the owning event loop)."""
+    global _client, _transport
+    if _client is not None:
+        await _client.aclose()
+    _client = _transport = None
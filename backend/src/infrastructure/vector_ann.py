@@ -0,0 +1,168 @@
+"""Optional IVF-flat ANN layer for per-user vector indexes.
+
+Enabled with VECTOR_INDEX_MODE=ivf (and NumPy installed) for users with at
+least VECTOR_INDEX_ANN_MIN_VECTORS vectors. Each trained index is persisted
+to a sidecar file ``{db_path}.vectors/{user_id}.npz`` holding ids, unit
+rows, centroids and the (seq, generation) it reflects, so a restarted MCP
+server neither re-decodes every vector nor retrains k-means:
+
+- same generation: rows and centroids are restored and only newer vectors
+  are fetched from SQLite
+- newer generation (vectors removed): rows are reloaded, but centroids are
+  reused while the corpus has not grown past 4x the training size
+"""
+
+import asyncio
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.config.settings import (
+    VECTOR_INDEX_ANN_MIN_VECTORS,
+    VECTOR_INDEX_ANN_NPROBE,
+    VECTOR_INDEX_MODE,
+)
+from src.infrastructure.db.connection import get_db_path
+from src.shared import similarity
+
+if TYPE_CHECKING:
+    from src.infrastructure.vector_index import UserVectorIndex
+
+logger = logging.getLogger(__name__)
+
+# Retrain once the corpus outgrows the training set by this factor
+_RETRAIN_GROWTH = 4
+# Rewrite the sidecar after this fraction of new rows since the last save
+_RESAVE_FRACTION = 0.1
+
+
+def ann_enabled() -> bool:
+    """True when IVF mode is configured and NumPy is importable."""
+    return VECTOR_INDEX_MODE == "ivf" and similarity.np is not None
+
+
+def sidecar_path(user_id: uuid.UUID) -> Path:
+    """Sidecar file for a user's index, next to the database file."""
+    return Path(f"{get_db_path()}.vectors") / f"{user_id}.npz"
+
+
+def remove_sidecar(user_id: uuid.UUID) -> None:
+    """Delete a user's sidecar (account deletion must not leave vectors behind)."""
+    sidecar_path(user_id).unlink(missing_ok=True)
+
+
+def _load(path: Path) -> dict | None:
+    if not path.exists():
+        return None
+    try:
+        with similarity.np.load(path, allow_pickle=False) as data:
+            return {key: data[key] for key in data.files}
+    except (OSError, ValueError, KeyError):
+        logger.warning("Ignoring unreadable vector sidecar", extra={"path": str(path)})
+        return None
+
+
+def _snapshot(index: "UserVectorIndex") -> dict:
+    """Capture sidecar contents on the event loop, before handing off to a thread."""
+    return {
+        "ids": similarity.np.array(index.ids),
+        "rows": index.rows,
+        "centroids": index.ann.centroids,
+        "seq": index.seq,
+        "generation": index.generation,
+        "trained_on": index.ann.trained_on,
+    }
+
+
+def _save(path: Path, snapshot: dict) -> None:
+    """Write the sidecar atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        similarity.np.savez(f, **snapshot)
+    os.replace(tmp, path)
+
+
+def _ivf(rows, centroids, trained_on: int):
+    """IVF layer over rows; fully built before it is attached to an index."""
+    from src.shared.ivf import IvfFlatIndex
+
+    ann = IvfFlatIndex(centroids, trained_on)
+    ann.add(rows)
+    return ann
+
+
+def _restore(path: Path, generation: int, seq: int) -> dict | None:
+    data = _load(path)
+    if data is None or int(data["generation"]) != generation:
+        return None
+    if int(data["seq"]) > seq:
+        return None
+    data["ann"] = _ivf(data["rows"], data["centroids"], int(data["trained_on"]))
+    return data
+
+
+async def restore(user_id: uuid.UUID, index: "UserVectorIndex", seq: int) -> None:
+    """Load a sidecar matching index.generation (up to seq) into an empty index."""
+    path = sidecar_path(user_id)
+    data = await asyncio.to_thread(_restore, path, index.generation, seq)
+    if data is None:
+        return
+    index.ids = data["ids"].tolist()
+    index.rows = data["rows"]
+    index.seq = int(data["seq"])
+    index.ann, index.nprobe = data["ann"], VECTOR_INDEX_ANN_NPROBE
+    index.saved_rows = len(index)
+    logger.info(
+        "Restored ANN index", extra={"user_id": str(user_id), "vectors": len(index)}
+    )
+
+
+def _reusable_centroids(path: Path, rows) -> tuple:
+    data = _load(path)
+    if data is None:
+        return None, 0
+    centroids, trained_on = data["centroids"], int(data["trained_on"])
+    if centroids.shape[1] != rows.shape[1] or len(rows) > trained_on * _RETRAIN_GROWTH:
+        return None, 0
+    return centroids, trained_on
+
+
+def _train(path: Path, rows):
+    from src.shared.ivf import default_nlist, train_centroids
+
+    centroids, trained_on = _reusable_centroids(path, rows)
+    if centroids is None:
+        centroids, trained_on = (
+            train_centroids(rows, default_nlist(len(rows))),
+            len(rows),
+        )
+    return _ivf(rows, centroids, trained_on)
+
+
+async def _persist(path: Path, index: "UserVectorIndex") -> None:
+    await asyncio.to_thread(_save, path, _snapshot(index))
+    index.saved_rows = len(index)
+
+
+async def update(user_id: uuid.UUID, index: "UserVectorIndex") -> None:
+    """Attach or persist the ANN layer after the index gained rows.
+
+    Training and file IO run in a worker thread to keep the event loop free.
+    Callers hold the user's VectorIndexCache lock, so training runs once.
+    """
+    if len(index) < VECTOR_INDEX_ANN_MIN_VECTORS:
+        return
+    path = sidecar_path(user_id)
+    if index.ann is None:
+        # No rows can be appended meanwhile: appends need the same lock
+        ann = await asyncio.to_thread(_train, path, index.rows)
+        index.ann, index.nprobe = ann, VECTOR_INDEX_ANN_NPROBE
+        logger.info(
+            "Built ANN index", extra={"user_id": str(user_id), "vectors": len(index)}
+        )
+        await _persist(path, index)
+    elif len(index) - index.saved_rows >= _RESAVE_FRACTION * index.saved_rows:
+        await _persist(path, index)
@@ -0,0 +1,172 @@
+"""Per-user in-memory vector indexes for semantic search over summaries.
+
+Each index holds the user's summary vectors as one contiguous float32
+matrix of unit rows plus a parallel id list. Freshness is checked against
+the trigger-maintained ``vector_index_state`` row on every lookup (one
+primary-key read), so writes made by other processes are picked up:
+
+- ``seq`` advanced: only vectors stamped after the cached seq are fetched
+  and appended (new vectors from persist_extraction)
+- ``generation`` advanced: vectors were removed or replaced (/reset_area,
+  /delete, area deletion), so the index is rebuilt
+
+Lookups for the same user are serialized by a per-user lock, so concurrent
+searches never append the same rows (or train the ANN layer) twice.
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.config.settings import VECTOR_INDEX_CACHE_MAX_MB
+from src.infrastructure import vector_ann
+from src.infrastructure.db import managers as db
+from src.shared import similarity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VectorIndexStats:
+    """Counters describing cache usage since process start."""
+
+    hits: int = 0
+    builds: int = 0
+    incremental_updates: int = 0
+    evictions: int = 0
+    cached_users: int = 0
+    cached_bytes: int = 0
+
+
+class UserVectorIndex:
+    """Search index over one user's summary vectors at a given (seq, generation)."""
+
+    def __init__(self, seq: int, generation: int) -> None:
+        self.seq = seq
+        self.generation = generation
+        self.ids: list[str] = []
+        # NumPy unit-row matrix, or the raw vectors when NumPy is unavailable
+        self.rows = None
+        # Optional IVF-flat layer (VECTOR_INDEX_MODE=ivf), see vector_ann
+        self.ann = None
+        self.nprobe = 0
+        self.saved_rows = 0
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        if similarity.np is not None and self.rows is not None:
+            return self.rows.nbytes
+        return sum(len(vec) * 4 for vec in self.rows or [])
+
+    def extend(self, candidates: list[tuple[str, Sequence[float]]]) -> None:
+        """Append (id, vector) pairs."""
+        if not candidates:
+            return
+        self.ids.extend(cid for cid, _ in candidates)
+        vectors = [vec for _, vec in candidates]
+        if similarity.np is None:
+            self.rows = (self.rows or []) + vectors
+            return
+        rows = similarity.normalize_rows(vectors)
+        if self.ann is not None:
+            self.ann.add(rows)
+        if self.rows is not None:
+            rows = similarity.np.concatenate((self.rows, rows))
+        self.rows = rows
+
+    def search(self, query_vec: Sequence[float], k: int) -> list[tuple[str, float]]:
+        """Return top-k (id, score) pairs ranked by cosine similarity."""
+        if not self.ids:
+            return []
+        if similarity.np is None:
+            return similarity.find_top_k(query_vec, list(zip(self.ids, self.rows)), k)
+        if self.ann is None:
+            return similarity.top_k_normalized(query_vec, self.ids, self.rows, k)
+        query = similarity.np.asarray(query_vec, dtype=similarity.np.float32)
+        rows = self.ann.candidates(query, self.nprobe)
+        ids = [self.ids[i] for i in rows]
+        return similarity.top_k_normalized(query_vec, ids, self.rows[rows], k)
+
+
+class VectorIndexCache:
+    """LRU cache of UserVectorIndex objects bounded by total matrix bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.stats = VectorIndexStats()
+        self._indexes: OrderedDict[uuid.UUID, UserVectorIndex] = OrderedDict()
+        self._locks: dict[uuid.UUID, asyncio.Lock] = {}
+
+    async def get(self, user_id: uuid.UUID) -> UserVectorIndex:
+        """Return an up-to-date index for user_id, building it if needed."""
+        async with self._locks.setdefault(user_id, asyncio.Lock()):
+            seq, generation = await db.SummariesManager.get_vector_state(user_id)
+            index = self._indexes.get(user_id)
+            if index is None or index.generation != generation:
+                index = await self._build(user_id, seq, generation)
+            elif index.seq < seq:
+                await self._append(user_id, index, seq)
+                self.stats.incremental_updates += 1
+            else:
+                self.stats.hits += 1
+            self._store(user_id, index)
+            return index
+
+    async def _build(
+        self, user_id: uuid.UUID, seq: int, generation: int
+    ) -> UserVectorIndex:
+        index = UserVectorIndex(-1, generation)
+        if vector_ann.ann_enabled():
+            await vector_ann.restore(user_id, index, seq)
+        await self._append(user_id, index, seq)
+        self.stats.builds += 1
+        logger.debug(
+            "Built vector index",
+            extra={"user_id": str(user_id), "vectors": len(index)},
+        )
+        return index
+
+    async def _append(self, user_id: uuid.UUID, index: UserVectorIndex, seq: int):
+        """Fetch vectors stamped in (index.seq, seq] and add them to the index."""
+        index.extend(
+            await db.SummariesManager.list_vectors_by_user(
+                user_id, after_seq=index.seq, upto_seq=seq
+            )
+        )
+        index.seq = seq
+        if vector_ann.ann_enabled():
+            await vector_ann.update(user_id, index)
+
+    def _store(self, user_id: uuid.UUID, index: UserVectorIndex) -> None:
+        """Insert as most recently used, then evict down to the byte budget."""
+        self._indexes[user_id] = index
+        self._indexes.move_to_end(user_id)
+        total = sum(i.nbytes for i in self._indexes.values())
+        while total > self.max_bytes and self._indexes:
+            evicted_id, evicted = self._indexes.popitem(last=False)
+            total -= evicted.nbytes
+            lock = self._locks.get(evicted_id)
+            if lock is not None and not lock.locked():
+                del self._locks[evicted_id]
+            self.stats.evictions += 1
+        self.stats.cached_users = len(self._indexes)
+        self.stats.cached_bytes = total
+
+
+_cache = VectorIndexCache(int(VECTOR_INDEX_CACHE_MAX_MB * 1024 * 1024))
+
+
+async def get_user_index(user_id: uuid.UUID) -> UserVectorIndex:
+    """Return the up-to-date vector index for a user from the process cache."""
+    return await _cache.get(user_id)
+
+
+def get_vector_index_stats() -> VectorIndexStats:
+    """Return cache counters for this process."""
+    return _cache.stats
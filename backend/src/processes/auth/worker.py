@@ -1,21 +1,18 @@
 """Auth worker for exchanging external IDs for internal user_ids."""
 
-import asyncio
 import logging
 import uuid
 from functools import partial
 
-from src.config.settings import WORKER_POLL_TIMEOUT
+from src.config.settings import WORKER_POOL_AUTH, WORKER_POOL_AUTH_MAX
 from src.infrastructure.db import managers as db
 from src.processes.auth.interfaces import AuthRequest
-from src.runtime import Channels, run_worker_pool
+from src.runtime import Channels, run_worker_pool, worker_busy
 
 logger = logging.getLogger(__name__)
 
 EXTERNAL_ID_NAMESPACE = uuid.UUID("a1b2c3d4-e5f6-7890-abcd-ef1234567890")
 
-WORKER_POOL_AUTH = 1
-
 
 def resolve_user_id(provider: str, external_id: str) -> uuid.UUID:
     """Deterministic mapping from external ID to internal user_id."""
@@ -43,14 +40,10 @@ async def _process_auth_request(request: AuthRequest) -> None:
 async def _auth_worker_loop(worker_id: int, channels: Channels) -> None:
     """Exchange external user ID for internal user_id."""
     while not channels.shutdown.is_set():
+        request = await channels.auth_requests.get()
         try:
-            request = await asyncio.wait_for(
-                channels.auth_requests.get(), timeout=WORKER_POLL_TIMEOUT
-            )
-        except asyncio.TimeoutError:
-            continue
-        try:
-            await _process_auth_request(request)
+            with worker_busy("auth"):
+                await _process_auth_request(request)
         except Exception:
             logger.exception("Auth worker %d error", worker_id)
             request.response_future.set_exception(RuntimeError("Auth worker failed"))
@@ -61,4 +54,11 @@ async def _auth_worker_loop(worker_id: int, channels: Channels) -> None:
 async def run_auth_pool(channels: Channels) -> None:
     """Run the auth worker pool."""
     worker_fn = partial(_auth_worker_loop, channels=channels)
-    await run_worker_pool("auth", worker_fn, WORKER_POOL_AUTH, channels.shutdown)
+    await run_worker_pool(
+        "auth",
+        worker_fn,
+        WORKER_POOL_AUTH,
+        channels.shutdown,
+        max_size=WORKER_POOL_AUTH_MAX,
+        depth=channels.auth_requests.qsize,
+    )
@@ -9,3 +9,5 @@ class ExtractTask:
     """Task to vectorize and extract knowledge from one turn summary."""
 
     summary_id: uuid.UUID
+    # Deliveries so far including the current one (set by ExtractQueue.claim)
+    attempts: int = 0
@@ -0,0 +1,130 @@
+"""Durable extract queue backed by the extract_queue table.
+
+Pending ExtractTasks survive restarts. Delivery is at-least-once:
+
+- ``claim`` leases up to N tasks for LEAF_EXTRACT_LEASE_TIMEOUT seconds;
+  a lease that expires (worker crashed or stalled) is handed out again
+- ``ack`` deletes finished tasks
+- ``fail`` schedules a retry with exponential backoff, or moves the task to
+  the 'dead' state after LEAF_EXTRACT_MAX_RETRIES retries
+
+``put`` wakes idle workers in this process immediately; workers also poll
+every LEAF_EXTRACT_POLL_INTERVAL seconds to see tasks from other processes.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from src.config.settings import (
+    LEAF_EXTRACT_LEASE_TIMEOUT,
+    LEAF_EXTRACT_MAX_RETRIES,
+    LEAF_EXTRACT_RETRY_BACKOFF,
+)
+from src.infrastructure.db import managers as db
+from src.shared.timestamp import get_timestamp
+
+from .interfaces import ExtractTask
+
+logger = logging.getLogger(__name__)
+
+# Cap the exponential backoff exponent (5s * 2**10 is about 85 minutes)
+_MAX_BACKOFF_EXPONENT = 10
+# Poll interval of join(), which waits for the queue to drain
+_JOIN_POLL_INTERVAL = 0.01
+
+
+@dataclass
+class ExtractQueueStats:
+    """Queue depth by state, read from the database."""
+
+    pending: int = 0
+    leased: int = 0
+    dead: int = 0
+    oldest_pending_age: float = 0.0
+
+
+class ExtractQueue:
+    """Claim/lease/ack work queue of ExtractTasks (one row per summary)."""
+
+    def __init__(self) -> None:
+        self._ready = asyncio.Event()
+
+    async def put(self, task: ExtractTask) -> None:
+        """Persist a task and wake idle workers."""
+        await db.ExtractQueueManager.enqueue([task.summary_id], get_timestamp())
+        self._ready.set()
+
+    async def recover(self) -> int:
+        """Queue every summary still missing its vector (startup sweep).
+
+        Covers tasks lost before the queue was durable and summaries whose
+        embedding never succeeded. Already queued or dead summaries are kept.
+        """
+        count = await db.ExtractQueueManager.enqueue_missing_vectors(get_timestamp())
+        if count:
+            self._ready.set()
+        return count
+
+    async def claim(self, owner: str, limit: int) -> list[ExtractTask]:
+        """Lease up to limit tasks for owner, oldest first."""
+        # Clear before reading so a put() racing with this claim still wakes wait()
+        self._ready.clear()
+        now = get_timestamp()
+        claimed = await db.ExtractQueueManager.claim(
+            owner, limit, now, now + LEAF_EXTRACT_LEASE_TIMEOUT
+        )
+        tasks = []
+        for summary_id, attempts in claimed:
+            if attempts > LEAF_EXTRACT_MAX_RETRIES + 1:
+                # Leases kept expiring (e.g. the task crashes the process)
+                await self._dead_letter(summary_id, owner, "lease expired")
+                continue
+            tasks.append(ExtractTask(summary_id=summary_id, attempts=attempts))
+        return tasks
+
+    async def ack(self, owner: str, tasks: list[ExtractTask]) -> None:
+        """Mark tasks done."""
+        await db.ExtractQueueManager.ack([t.summary_id for t in tasks], owner)
+
+    async def fail(self, owner: str, task: ExtractTask, error: str) -> None:
+        """Schedule a retry with backoff, or dead-letter after the last retry."""
+        if task.attempts > LEAF_EXTRACT_MAX_RETRIES:
+            await self._dead_letter(task.summary_id, owner, error)
+            return
+        exponent = min(task.attempts - 1, _MAX_BACKOFF_EXPONENT)
+        retry_at = get_timestamp() + LEAF_EXTRACT_RETRY_BACKOFF * 2**exponent
+        await db.ExtractQueueManager.fail(task.summary_id, owner, error, retry_at)
+
+    async def _dead_letter(self, summary_id, owner: str, error: str) -> None:
+        logger.error(
+            "Extract task dead-lettered",
+            extra={"summary_id": str(summary_id), "error": error},
+        )
+        await db.ExtractQueueManager.fail(summary_id, owner, error, None)
+
+    async def wait(self, timeout: float) -> None:
+        """Sleep until put() is called or timeout elapses."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def stats(self) -> ExtractQueueStats:
+        """Current queue depth per state and age of the oldest pending task."""
+        counts = await db.ExtractQueueManager.counts()
+        pending, oldest = counts.get("pending", (0, None))
+        return ExtractQueueStats(
+            pending=pending,
+            leased=counts.get("leased", (0, None))[0],
+            dead=counts.get("dead", (0, None))[0],
+            oldest_pending_age=get_timestamp() - oldest if oldest else 0.0,
+        )
+
+    async def join(self) -> None:
+        """Wait until no task is pending or leased (dead tasks are ignored)."""
+        while True:
+            stats = await self.stats()
+            if not stats.pending and not stats.leased:
+                return
+            await asyncio.sleep(_JOIN_POLL_INTERVAL)
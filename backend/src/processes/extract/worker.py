@@ -1,75 +1,226 @@
-"""Extract worker pool for knowledge extraction from summaries."""
+"""Extract worker pool for knowledge extraction from summaries.
+
+Workers drain the durable extract queue (see queue.py) in batches. Claimed
+tasks are acked after a successful run and failed otherwise, so they are
+retried with backoff and eventually dead-lettered.
+"""
 
 import asyncio
 import logging
+import os
+from collections.abc import Awaitable
 from functools import partial
 
 from src.config.settings import (
+    EXTRACT_EMBED_BATCH_SIZE,
+    KNOWLEDGE_BATCH_MAX_WAIT,
+    KNOWLEDGE_BATCH_SIZE,
+    KNOWLEDGE_EXTRACTION_MODE,
+    LEAF_EXTRACT_POLL_INTERVAL,
     MAX_TOKENS_KNOWLEDGE,
+    MAX_TOKENS_KNOWLEDGE_BATCH,
     MODEL_KNOWLEDGE_EXTRACTION,
-    WORKER_POLL_TIMEOUT,
     WORKER_POOL_EXTRACT,
+    WORKER_POOL_EXTRACT_MAX,
 )
 from src.infrastructure.ai import LLMClientBuilder
 from src.processes.extract.interfaces import ExtractTask
-from src.runtime import Channels, run_worker_pool
+from src.runtime import Channels, run_worker_pool, worker_busy
 from src.workflows.subgraphs.knowledge_extraction.graph import (
+    build_knowledge_batch_extraction_graph,
     build_knowledge_extraction_graph,
 )
-from src.workflows.subgraphs.knowledge_extraction.state import KnowledgeExtractionState
+from src.workflows.subgraphs.knowledge_extraction.state import (
+    KnowledgeBatchState,
+    KnowledgeExtractionState,
+)
 
 logger = logging.getLogger(__name__)
 
+# Recorded as last_error when the graph ran but the summary is still unembedded
+_MISSING_VECTOR = "embedding failed"
+
+
+def _owner(worker_id: int) -> str:
+    """Lease owner id, unique across processes sharing the database."""
+    return f"{os.getpid()}-{worker_id}"
+
 
 async def _invoke_extraction_graph(task: ExtractTask, graph, worker_id: int) -> None:
-    """Invoke the knowledge extraction graph for a task."""
+    """Invoke the knowledge extraction graph for a task.
+
+    Raises RuntimeError if the summary is still missing its vector, so the
+    task is retried.
+    """
     extra = {"summary_id": str(task.summary_id), "worker_id": worker_id}
     logger.info("Processing extract task", extra=extra)
     state = KnowledgeExtractionState(summary_id=task.summary_id)
-    await graph.ainvoke(state)
+    result = await graph.ainvoke(state)
+    if (
+        isinstance(result, dict)
+        and result.get("summary_text")
+        and result.get("summary_vector") is None
+    ):
+        raise RuntimeError(_MISSING_VECTOR)
     logger.info("Completed extract task", extra=extra)
 
 
-async def _run_extraction_with_recovery(
-    task: ExtractTask,
-    graph,
-    channels: Channels,
-    worker_id: int,
-) -> None:
-    """Run extraction with error recovery - log and continue on failure."""
+async def _invoke_batch_graph(
+    tasks: list[ExtractTask], graph, worker_id: int
+) -> dict[str, str]:
+    """Invoke the batched graph; returns errors of unembedded summaries by id."""
+    extra = {"batch_size": len(tasks), "worker_id": worker_id}
+    logger.info("Processing extract batch", extra=extra)
+    state = KnowledgeBatchState(summary_ids=[t.summary_id for t in tasks])
+    result = await graph.ainvoke(state)
+    summaries = result.get("summaries", []) if isinstance(result, dict) else []
+    logger.info("Completed extract batch", extra=extra)
+    return {
+        str(s.summary_id): _MISSING_VECTOR
+        for s in summaries
+        if s.summary_text and s.summary_vector is None
+    }
+
+
+async def _run_with_recovery(extraction: Awaitable, worker_id: int):
+    """Run extraction with error recovery - log and continue on failure.
+
+    Returns the extraction result, or the exception it raised.
+    """
     try:
-        await _invoke_extraction_graph(task, graph, worker_id)
+        return await extraction
     except asyncio.CancelledError:
         logger.info("Extract worker %d cancelled", worker_id)
         raise
-    except Exception:
+    except Exception as exc:
         logger.exception("Extract worker %d error", worker_id)
+        return exc
+
+
+async def _claim(channels: Channels, owner: str, limit: int) -> list[ExtractTask]:
+    """Claim tasks; a database error is logged and retried on the next poll."""
+    try:
+        return await channels.extract.claim(owner, limit)
+    except Exception:
+        logger.exception("Failed to claim extract tasks")
+        return []
+
+
+async def _process_task(
+    task: ExtractTask, graph, channels: Channels, worker_id: int
+) -> None:
+    """Run one task and ack or fail its lease."""
+    owner = _owner(worker_id)
+    outcome = await _run_with_recovery(
+        _invoke_extraction_graph(task, graph, worker_id), worker_id
+    )
+    if isinstance(outcome, Exception):
+        await channels.extract.fail(owner, task, repr(outcome))
+    else:
+        await channels.extract.ack(owner, [task])
 
 
 async def _extract_worker_loop(worker_id: int, graph, channels: Channels) -> None:
-    """Process knowledge extraction tasks."""
+    """Process knowledge extraction tasks.
+
+    Up to EXTRACT_EMBED_BATCH_SIZE claimed tasks run concurrently, so their
+    embeddings can fill one batched API call.
+    """
+    owner = _owner(worker_id)
     while not channels.shutdown.is_set():
-        try:
-            task = await asyncio.wait_for(
-                channels.extract.get(), timeout=WORKER_POLL_TIMEOUT
+        tasks = await _claim(channels, owner, EXTRACT_EMBED_BATCH_SIZE)
+        if not tasks:
+            await channels.extract.wait(LEAF_EXTRACT_POLL_INTERVAL)
+            continue
+        with worker_busy("extract"):
+            await asyncio.gather(
+                *(_process_task(t, graph, channels, worker_id) for t in tasks)
             )
-        except asyncio.TimeoutError:
+
+
+async def _collect(
+    channels: Channels, owner: str, tasks: list[ExtractTask]
+) -> list[ExtractTask]:
+    """Claim more tasks for up to KNOWLEDGE_BATCH_MAX_WAIT, up to KNOWLEDGE_BATCH_SIZE."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + KNOWLEDGE_BATCH_MAX_WAIT
+    while len(tasks) < KNOWLEDGE_BATCH_SIZE:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        await channels.extract.wait(remaining)
+        tasks += await _claim(channels, owner, KNOWLEDGE_BATCH_SIZE - len(tasks))
+    return tasks
+
+
+async def _settle_batch(
+    tasks: list[ExtractTask], outcome, channels: Channels, owner: str
+) -> None:
+    """Ack succeeded tasks and fail the rest.
+
+    outcome is the exception that failed the whole batch, or the per-summary
+    errors returned by _invoke_batch_graph.
+    """
+    if isinstance(outcome, Exception):
+        outcome = {str(t.summary_id): repr(outcome) for t in tasks}
+    await channels.extract.ack(
+        owner, [t for t in tasks if str(t.summary_id) not in outcome]
+    )
+    for task in tasks:
+        if str(task.summary_id) in outcome:
+            await channels.extract.fail(owner, task, outcome[str(task.summary_id)])
+
+
+async def _batch_worker_loop(worker_id: int, graph, channels: Channels) -> None:
+    """Process extraction tasks in batches (KNOWLEDGE_EXTRACTION_MODE=batched)."""
+    owner = _owner(worker_id)
+    while not channels.shutdown.is_set():
+        tasks = await _claim(channels, owner, KNOWLEDGE_BATCH_SIZE)
+        if not tasks:
+            await channels.extract.wait(LEAF_EXTRACT_POLL_INTERVAL)
             continue
-        try:
-            await _run_extraction_with_recovery(task, graph, channels, worker_id)
-        finally:
-            channels.extract.task_done()
+        with worker_busy("extract"):
+            tasks = await _collect(channels, owner, tasks)
+            outcome = await _run_with_recovery(
+                _invoke_batch_graph(tasks, graph, worker_id), worker_id
+            )
+            await _settle_batch(tasks, outcome, channels, owner)
+
+
+async def _queued_batches(channels: Channels) -> int:
+    """Pending tasks in units of what one worker claims at a time."""
+    pending = (await channels.extract.stats()).pending
+    per_worker = (
+        KNOWLEDGE_BATCH_SIZE
+        if KNOWLEDGE_EXTRACTION_MODE == "batched"
+        else EXTRACT_EMBED_BATCH_SIZE
+    )
+    return -(-pending // per_worker)
 
 
 async def run_extract_pool(channels: Channels) -> None:
-    """Run the extract worker pool."""
+    """Run the extract worker pool after queueing summaries missing vectors."""
+    recovered = await channels.extract.recover()
+    logger.info("Extract queue recovery sweep", extra={"queued": recovered})
+    batched = KNOWLEDGE_EXTRACTION_MODE == "batched"
     # Minimize reasoning for structured output to avoid LengthFinishReasonError
-    graph = build_knowledge_extraction_graph(
-        LLMClientBuilder(
-            MODEL_KNOWLEDGE_EXTRACTION,
-            max_tokens=MAX_TOKENS_KNOWLEDGE,
-            reasoning={"effort": "low"},
-        ).build()
+    llm = LLMClientBuilder(
+        MODEL_KNOWLEDGE_EXTRACTION,
+        max_tokens=MAX_TOKENS_KNOWLEDGE_BATCH if batched else MAX_TOKENS_KNOWLEDGE,
+        reasoning={"effort": "low"},
+    ).build()
+    if batched:
+        graph = build_knowledge_batch_extraction_graph(llm)
+        loop_fn = _batch_worker_loop
+    else:
+        graph = build_knowledge_extraction_graph(llm)
+        loop_fn = _extract_worker_loop
+    worker_fn = partial(loop_fn, graph=graph, channels=channels)
+    await run_worker_pool(
+        "extract",
+        worker_fn,
+        WORKER_POOL_EXTRACT,
+        channels.shutdown,
+        max_size=WORKER_POOL_EXTRACT_MAX,
+        depth=partial(_queued_batches, channels),
     )
-    worker_fn = partial(_extract_worker_loop, graph=graph, channels=channels)
-    await run_worker_pool("extract", worker_fn, WORKER_POOL_EXTRACT, channels.shutdown)
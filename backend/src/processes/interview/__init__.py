@@ -1,6 +1,6 @@
 """Interview process: Main graph worker for message processing."""
 
-from src.processes.interview.interfaces import ChannelRequest, ChannelResponse
+from src.processes.interview.interfaces import ChannelRequest
 from src.processes.interview.state import State, Target
 
 # Lazy imports for graph-related items to avoid circular imports
@@ -21,6 +21,15 @@ def run_graph_pool(channels):
     return _run_graph_pool(channels)
 
 
+def run_graph_process_pool(channels):
+    """Run the graph workers in WORKER_PROCESSES_GRAPH child processes."""
+    from src.processes.interview.processes import (
+        run_graph_process_pool as _run_graph_process_pool,
+    )
+
+    return _run_graph_process_pool(channels)
+
+
 def _init_graph_state(msg, user):
     """Initialize graph state and create temporary files for media processing."""
     from src.processes.interview.worker import (
@@ -32,10 +41,10 @@ def _init_graph_state(msg, user):
 
 __all__ = [
     "ChannelRequest",
-    "ChannelResponse",
     "State",
     "Target",
     "_init_graph_state",
     "get_graph",
     "run_graph_pool",
+    "run_graph_process_pool",
 ]
@@ -3,6 +3,7 @@ from functools import partial
 from langgraph.graph import END, START, StateGraph
 
 from src.infrastructure.llms import (
+    PreparedLLM,
     get_llm_area_chat,
     get_llm_extract_target,
     get_llm_leaf_response,
@@ -11,9 +12,13 @@ from src.infrastructure.llms import (
     get_llm_transcribe,
 )
 from src.processes.interview.state import State
+from src.shared.interview_models import LeafEvaluation
 from src.workflows.nodes.commands.handle_command import handle_command
 from src.workflows.nodes.input.build_user_message import build_user_message
-from src.workflows.nodes.input.extract_target import extract_target
+from src.workflows.nodes.input.extract_target import (
+    IntentClassification,
+    extract_target,
+)
 from src.workflows.nodes.persistence.save_history import save_history
 from src.workflows.nodes.processing.load_history import load_history
 from src.workflows.nodes.processing.small_talk_response import small_talk_response
@@ -24,6 +29,7 @@ from src.workflows.subgraphs.area_loop.graph import (
     MAX_AREA_RECURSION,
     build_area_graph,
 )
+from src.workflows.subgraphs.area_loop.tools import AREA_TOOLS
 from src.workflows.subgraphs.leaf_interview import build_leaf_interview_graph
 from src.workflows.subgraphs.transcribe.graph import build_transcribe_graph
 
@@ -34,9 +40,9 @@ def _add_input_nodes(builder: StateGraph, transcribe_graph) -> None:
     builder.add_node("handle_command", handle_command)
     builder.add_node("load_history", load_history)
     builder.add_node("build_user_message", build_user_message)
-    builder.add_node(
-        "extract_target", partial(extract_target, llm=get_llm_extract_target())
-    )
+    # Structured runnable prepared once instead of per classified message
+    llm_extract = PreparedLLM(get_llm_extract_target(), schemas=[IntentClassification])
+    builder.add_node("extract_target", partial(extract_target, llm=llm_extract))
 
 
 def _add_response_nodes(builder: StateGraph, area_graph, leaf_interview_graph) -> None:
@@ -95,15 +101,15 @@ def get_graph():
     """
     builder = StateGraph(State)
     transcribe_graph = build_transcribe_graph(get_llm_transcribe())
-    area_graph = build_area_graph(get_llm_area_chat()).with_config(
-        {"recursion_limit": MAX_AREA_RECURSION}
-    )
+    area_graph = build_area_graph(
+        PreparedLLM(get_llm_area_chat(), tools=AREA_TOOLS)
+    ).with_config({"recursion_limit": MAX_AREA_RECURSION})
     # leaf_interview subgraph uses LeafInterviewState which maps to/from State:
     # - Input: user, area_id, messages
     # - Output: messages_to_save, is_successful, completed_leaf_id,
     #           active_leaf_id, question_text, turn_summary_text, set_covered_at
     leaf_interview_graph = build_leaf_interview_graph(
-        get_llm_quick_evaluate(),
+        PreparedLLM(get_llm_quick_evaluate(), schemas=[LeafEvaluation]),
         get_llm_leaf_response(),
     )
     _add_workflow_nodes(builder, transcribe_graph, area_graph, leaf_interview_graph)
@@ -1,23 +1,32 @@
 """Interface types for the interview process."""
 
+import asyncio
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from src.domain import ClientMessage
 
+# Reply sent when admission control turns a message away (see runtime/queues.py)
+BUSY_RESPONSE = "I'm handling a lot of messages right now. Please try again shortly."
+
 
 @dataclass
 class ChannelRequest:
-    """Envelope for messages from transport to graph workers."""
+    """Envelope for messages from transport to graph workers.
+
+    The graph worker sets the reply text on response_future; correlation_id
+    only ties log lines of one request together. When on_chunk is set, the
+    reply text is also passed to it in deltas while the LLM streams it.
+    """
 
     correlation_id: uuid.UUID
     user_id: uuid.UUID
     client_message: ClientMessage
+    response_future: asyncio.Future[str]
+    on_chunk: Callable[[str], None] | None = None
 
-
-@dataclass
-class ChannelResponse:
-    """Envelope for responses from graph workers to transport."""
-
-    correlation_id: uuid.UUID
-    response_text: str
+    def reply(self, text: str) -> None:
+        """Resolve the reply unless the transport stopped waiting for it."""
+        if not self.response_future.done():
+            self.response_future.set_result(text)
@@ -0,0 +1,299 @@
+"""Multi-process graph workers (WORKER_PROCESSES_GRAPH > 0).
+
+The main process keeps the transports, channels.requests and the graph pool,
+but its workers only proxy: each request goes over a socket pair to one of N
+spawned child processes, which run the graph on their own event loop and
+core. Routing is sticky by user (``user_id.int % N``), so per-user caches
+stay in one process, and ordering is still enforced by the keyed requests
+channel, which keeps at most one message per user in flight.
+
+Children write extract tasks to the durable extract queue (SQLite), where the
+main process's extract workers pick them up on their next poll. A child that
+dies fails its in-flight requests, is reaped, and is started again on the
+next request.
+
+Messages are length-prefixed pickles read and written with asyncio streams on
+both sides, so a large message (voice bytes, a burst of chunks) never blocks
+either event loop. Children answer with ``(call_id, "chunk", text)`` for each
+streamed reply delta (only when the request has an on_chunk callback) and one
+final ``(call_id, "reply", text)``.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import logging
+import multiprocessing
+import pickle
+import socket
+import struct
+from collections.abc import Callable
+from dataclasses import replace
+from functools import partial
+
+from src.config.settings import (
+    WORKER_POOL_GRAPH,
+    WORKER_POOL_GRAPH_MAX,
+    WORKER_PROCESSES_GRAPH,
+)
+from src.processes.interview.interfaces import ChannelRequest
+from src.runtime import Channels, run_worker_pool, worker_busy
+from src.shared.ids import new_id
+
+logger = logging.getLogger(__name__)
+
+# Seconds a child gets to finish in-flight requests on shutdown
+_STOP_TIMEOUT = 10.0
+
+# spawn, not fork: the parent has running threads (aiosqlite, executors)
+_context = multiprocessing.get_context("spawn")
+
+# Payload length in front of every pickled message
+_HEADER = struct.Struct("!I")
+
+
+async def _read_message(reader: asyncio.StreamReader):
+    """Next message from reader, or None once the other end closed."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        payload = await reader.readexactly(_HEADER.unpack(header)[0])
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    return pickle.loads(payload)
+
+
+def _write_message(writer: asyncio.StreamWriter, message) -> None:
+    """Buffer message on writer; callers drain() when they can wait."""
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    writer.write(_HEADER.pack(len(payload)) + payload)
+
+
+async def _reap(process: multiprocessing.Process) -> None:
+    """Join process without blocking the loop, terminating it after _STOP_TIMEOUT."""
+    await asyncio.to_thread(process.join, _STOP_TIMEOUT)
+    if process.is_alive():
+        process.terminate()
+        await asyncio.to_thread(process.join)
+
+
+class _ChildServer:
+    """Child side of the socket: runs each received request as its own task."""
+
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, graph
+    ) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.graph = graph
+        self.channels = Channels()
+        self.running: set[asyncio.Task] = set()
+
+    async def serve(self) -> None:
+        """Handle requests until the parent closes its end of the socket."""
+        try:
+            while (message := await _read_message(self.reader)) is not None:
+                task = asyncio.create_task(self._handle(*message))
+                self.running.add(task)
+                task.add_done_callback(self.running.discard)
+        finally:
+            await asyncio.gather(*self.running, return_exceptions=True)
+            self.writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self.writer.wait_closed()
+
+    async def _handle(
+        self, call_id: int, user_id, client_message, stream: bool
+    ) -> None:
+        from src.processes.interview.worker import _process_channel_request
+
+        future = asyncio.get_running_loop().create_future()
+        on_chunk = partial(self._send, call_id, "chunk") if stream else None
+        request = ChannelRequest(new_id(), user_id, client_message, future, on_chunk)
+        await _process_channel_request(request, self.graph, self.channels, call_id)
+        self._send(call_id, "reply", future.result())
+        # The parent may be gone already; its requests failed on its side
+        with contextlib.suppress(ConnectionError):
+            await self.writer.drain()
+
+    def _send(self, call_id: int, kind: str, text: str) -> None:
+        _write_message(self.writer, (call_id, kind, text))
+
+
+async def _serve(sock: socket.socket, graph_factory: Callable) -> None:
+    """Child event loop; releases pooled connections when the parent is gone."""
+    from src.infrastructure.db import close_pools
+    from src.infrastructure.http_clients import close_http_clients
+
+    try:
+        reader, writer = await asyncio.open_connection(sock=sock)
+        await _ChildServer(reader, writer, graph_factory()).serve()
+    finally:
+        await close_http_clients()
+        await close_pools()
+
+
+def _child_main(sock: socket.socket, graph_factory: Callable, log_level: int) -> None:
+    """Entry point of a graph worker process."""
+    from src.config.logging import configure_logging
+
+    configure_logging(level=log_level)
+    asyncio.run(_serve(sock, graph_factory))
+
+
+class GraphProcess:
+    """One graph worker process and the requests in flight to it."""
+
+    def __init__(self, index: int, graph_factory: Callable) -> None:
+        self.index = index
+        self._graph_factory = graph_factory
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._process: multiprocessing.Process | None = None
+        self._start_lock = asyncio.Lock()
+        self._pending: dict[int, ChannelRequest] = {}
+        self._call_ids = itertools.count()
+
+    async def start(self) -> None:
+        if self._reader_task is not None:
+            # A detached child is joined before its replacement starts
+            await self._reader_task
+        parent_sock, child_sock = socket.socketpair()
+        self._process = _context.Process(
+            target=_child_main,
+            args=(child_sock, self._graph_factory, logging.getLogger().level),
+            name=f"graph-process-{self.index}",
+            daemon=True,
+        )
+        self._process.start()
+        child_sock.close()
+        reader, self._writer = await asyncio.open_connection(sock=parent_sock)
+        self._reader_task = asyncio.create_task(
+            self._read_replies(reader, self._process)
+        )
+        logger.info(
+            "Started graph process",
+            extra={"index": self.index, "pid": self._process.pid},
+        )
+
+    async def call(self, request: ChannelRequest) -> str:
+        """Run request in the child process and return its reply text."""
+        writer = await self._connected()
+        call_id = next(self._call_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[call_id] = replace(request, response_future=future)
+        message = (
+            call_id,
+            request.user_id,
+            request.client_message,
+            request.on_chunk is not None,
+        )
+        try:
+            _write_message(writer, message)
+            await writer.drain()
+            return await future
+        except ConnectionError as exc:
+            # Only this call fails; the reader detaches and reaps the child
+            raise RuntimeError(f"graph process {self.index} is unavailable") from exc
+        finally:
+            self._pending.pop(call_id, None)
+
+    async def _connected(self) -> asyncio.StreamWriter:
+        """Writer to the child, starting it first if it is not running."""
+        async with self._start_lock:
+            if self._writer is None:
+                await self.start()
+            return self._writer
+
+    async def _read_replies(
+        self, reader: asyncio.StreamReader, process: multiprocessing.Process
+    ) -> None:
+        """Dispatch the child's messages; on EOF detach and reap it."""
+        while (message := await _read_message(reader)) is not None:
+            self._on_reply(*message)
+        self._detach(RuntimeError(f"graph process {self.index} exited"))
+        await _reap(process)
+        logger.error(
+            "Graph process exited",
+            extra={
+                "index": self.index,
+                "pid": process.pid,
+                "exitcode": process.exitcode,
+            },
+        )
+
+    def _on_reply(self, call_id: int, kind: str, text: str) -> None:
+        pending = self._pending.get(call_id)
+        if pending is None:
+            return
+        if kind == "reply":
+            pending.reply(text)
+        elif pending.on_chunk is not None:
+            pending.on_chunk(text)
+
+    def _detach(self, exc: Exception) -> None:
+        """Forget a dead child: fail its in-flight calls, restart on next call."""
+        self._writer.close()
+        self._writer = None
+        for pending in self._pending.values():
+            if not pending.response_future.done():
+                pending.response_future.set_exception(exc)
+
+    async def stop(self) -> None:
+        """Ask the child to finish in-flight requests and exit."""
+        if self._writer is not None:
+            self._reader_task.cancel()
+            self._writer.close()
+            self._writer = None
+        if self._reader_task is not None:
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        if self._process is not None:
+            await _reap(self._process)
+
+
+async def _proxy_worker_loop(
+    worker_id: int, processes: list[GraphProcess], channels: Channels
+) -> None:
+    """Forward requests to the process owning their user and relay the reply."""
+    while not channels.shutdown.is_set():
+        request = await channels.requests.get()
+        try:
+            with worker_busy("graph"):
+                owner = processes[request.user_id.int % len(processes)]
+                request.reply(await owner.call(request))
+        except Exception:
+            logger.exception("Graph proxy worker %d error", worker_id)
+            request.reply("An error occurred")
+        finally:
+            channels.requests.task_done(request)
+
+
+def _default_graph():
+    from src.processes.interview.graph import get_graph
+
+    return get_graph()
+
+
+async def run_graph_process_pool(
+    channels: Channels, graph_factory: Callable = _default_graph
+) -> None:
+    """Run WORKER_PROCESSES_GRAPH graph processes fed by proxy workers.
+
+    graph_factory runs in each child, so it must be a picklable module-level
+    callable.
+    """
+    processes = [
+        GraphProcess(index, graph_factory) for index in range(WORKER_PROCESSES_GRAPH)
+    ]
+    await asyncio.gather(*(process.start() for process in processes))
+    worker_fn = partial(_proxy_worker_loop, processes=processes, channels=channels)
+    try:
+        await run_worker_pool(
+            "graph",
+            worker_fn,
+            WORKER_POOL_GRAPH * len(processes),
+            channels.shutdown,
+            max_size=WORKER_POOL_GRAPH_MAX * len(processes),
+            depth=channels.requests.servable,
+        )
+    finally:
+        await asyncio.gather(*(process.stop() for process in processes))
@@ -1,24 +1,21 @@
 """Graph worker pool for processing messages through the main graph."""
 
-import asyncio
 import logging
 import os
 import tempfile
 from functools import partial
 from typing import Any
 
-from src.config.settings import WORKER_POLL_TIMEOUT, WORKER_POOL_GRAPH
+from src.config.settings import WORKER_POOL_GRAPH, WORKER_POOL_GRAPH_MAX
 from src.domain import ClientMessage, InputMode, User
 from src.infrastructure.db import managers as db
 from src.processes.extract.interfaces import ExtractTask
 from src.processes.interview.graph import get_graph
-from src.processes.interview.interfaces import (
-    ChannelRequest,
-    ChannelResponse,
-)
+from src.processes.interview.interfaces import ChannelRequest
 from src.processes.interview.state import State, Target
-from src.runtime import Channels, run_worker_pool
+from src.runtime import Channels, run_worker_pool, worker_busy
 from src.shared.ids import new_id
+from src.shared.streaming import streaming_to
 from src.shared.utils.content import normalize_content
 
 logger = logging.getLogger(__name__)
@@ -101,44 +98,45 @@ async def _invoke_graph_and_get_response(
 async def _process_channel_request(
     request: ChannelRequest, graph, channels: Channels, worker_id: int
 ) -> None:
-    """Process a channel request: invoke graph and send response."""
+    """Process a channel request: invoke graph and reply on its future."""
+    extra = {"correlation_id": str(request.correlation_id)}
     try:
-        logger.debug("Graph worker %d processing message", worker_id)
+        logger.debug("Graph worker %d processing message", worker_id, extra=extra)
         user = await _get_user_from_db(request.user_id)
-        response = await _invoke_graph_and_get_response(
-            request.client_message, user, graph, channels
-        )
-        await channels.responses.put(
-            ChannelResponse(
-                correlation_id=request.correlation_id, response_text=response
+        with streaming_to(request.on_chunk):
+            response = await _invoke_graph_and_get_response(
+                request.client_message, user, graph, channels
             )
-        )
+        request.reply(response)
     except Exception:
-        logger.exception("Graph worker %d error", worker_id)
-        await channels.responses.put(
-            ChannelResponse(
-                correlation_id=request.correlation_id, response_text="An error occurred"
-            )
-        )
+        logger.exception("Graph worker %d error", worker_id, extra=extra)
+        request.reply("An error occurred")
 
 
 async def _graph_worker_loop(worker_id: int, graph, channels: Channels) -> None:
-    """Process messages through the main graph."""
+    """Process messages through the main graph.
+
+    channels.requests hands out one message per user at a time, so a user's
+    messages are processed in order while other users proceed in parallel.
+    """
     while not channels.shutdown.is_set():
+        request = await channels.requests.get()
         try:
-            request = await asyncio.wait_for(
-                channels.requests.get(), timeout=WORKER_POLL_TIMEOUT
-            )
-        except asyncio.TimeoutError:
-            continue
-        try:
-            await _process_channel_request(request, graph, channels, worker_id)
+            with worker_busy("graph"):
+                await _process_channel_request(request, graph, channels, worker_id)
         finally:
-            channels.requests.task_done()
+            channels.requests.task_done(request)
 
 
 async def run_graph_pool(channels: Channels) -> None:
-    """Run the graph worker pool."""
+    """Run the graph worker pool, scaling with users that have queued messages."""
     graph = get_graph()
     worker_fn = partial(_graph_worker_loop, graph=graph, channels=channels)
-    await run_worker_pool("graph", worker_fn, WORKER_POOL_GRAPH, channels.shutdown)
+    await run_worker_pool(
+        "graph",
+        worker_fn,
+        WORKER_POOL_GRAPH,
+        channels.shutdown,
+        max_size=WORKER_POOL_GRAPH_MAX,
+        depth=channels.requests.servable,
+    )
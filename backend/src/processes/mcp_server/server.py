@@ -1,8 +1,23 @@
 """MCP server entry point (Streamable HTTP)."""
 
+import asyncio
+
+
+async def _serve(host: str, port: int) -> None:
+    from src.infrastructure.db import close_pools
+    from src.infrastructure.http_clients import close_http_clients
 
-def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
-    """Start the MCP server on the given host and port."""
     from .tools import mcp
 
-    mcp.run(transport="streamable-http", host=host, port=port)
+    try:
+        await mcp.run_async(transport="streamable-http", host=host, port=port)
+    finally:
+        # The shared HTTP client belongs to this event loop; pooled aiosqlite
+        # connections own non-daemon threads
+        await close_http_clients()
+        await close_pools()
+
+
+def run_server(host: str = "0.0.0.0", port: int = 8080) -> None:
+    """Start the MCP server on the given host and port."""
+    asyncio.run(_serve(host, port))
@@ -5,8 +5,8 @@ import uuid
 from fastmcp import FastMCP
 
 from src.infrastructure.db import managers as db
-from src.infrastructure.embeddings import get_embedding_client
-from src.shared.similarity import find_top_k
+from src.infrastructure.embeddings import embed_text
+from src.infrastructure.vector_index import get_user_index
 
 from .auth import AuthMiddleware, get_user_id
 
@@ -40,21 +40,16 @@ def _knowledge_to_dict(k: db.UserKnowledge) -> dict:
     }
 
 
-async def _embed_query(query: str) -> list[float]:
-    client = get_embedding_client()
-    return await client.aembed_query(query)
-
-
 @mcp.tool
 async def search_summaries(query: str, limit: int = 5) -> list[dict]:
     """Search summaries by semantic similarity to a query string."""
     limit = max(1, min(limit, 100))
     user_id = get_user_id()
-    candidates = await db.SummariesManager.list_vectors_by_user(user_id)
-    if not candidates:
+    index = await get_user_index(user_id)
+    if not len(index):
         return []
-    query_vec = await _embed_query(query)
-    top = find_top_k(query_vec, candidates, k=limit)
+    query_vec = await embed_text(query)
+    top = index.search(query_vec, k=limit)
     top_ids = [uuid.UUID(sid) for sid, _ in top]
     full_records = await db.SummariesManager.get_by_ids(top_ids)
     by_id = {str(s.id): s for s in full_records}
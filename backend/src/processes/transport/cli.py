@@ -4,11 +4,13 @@ import asyncio
 import logging
 import unicodedata
 import uuid
+from collections.abc import Callable
 
+from src.config.settings import RESPONSE_STREAMING
 from src.domain import ClientMessage, InputMode, User
 from src.infrastructure.db import managers as db
-from src.processes.interview.interfaces import ChannelRequest
-from src.runtime import Channels
+from src.processes.interview.interfaces import BUSY_RESPONSE, ChannelRequest
+from src.runtime import ChannelFull, Channels
 from src.shared.ids import new_id
 
 logger = logging.getLogger(__name__)
@@ -63,42 +65,53 @@ def _validate_user_input(text: str) -> str | None:
     return None
 
 
-async def _response_listener(
-    channels: Channels, pending: dict[uuid.UUID, asyncio.Future]
-) -> None:
-    """Filter responses and resolve matching futures."""
-    while not channels.shutdown.is_set():
-        try:
-            response = await asyncio.wait_for(channels.responses.get(), timeout=0.5)
-        except asyncio.TimeoutError:
-            continue
-        if future := pending.pop(response.correlation_id, None):
-            future.set_result(response.response_text)
-        channels.responses.task_done()
-
-
 async def _send_request(
     text: str,
     user_id: uuid.UUID,
     channels: Channels,
-    pending: dict[uuid.UUID, asyncio.Future],
+    on_chunk: Callable[[str], None] | None = None,
 ) -> str:
-    """Send a request and wait for the matching response."""
-    corr_id, future = new_id(), asyncio.get_event_loop().create_future()
-    pending[corr_id] = future
-    await channels.requests.put(
-        ChannelRequest(
-            correlation_id=corr_id,
-            user_id=user_id,
-            client_message=ClientMessage(data=text),
+    """Send a request and wait for the graph worker's reply."""
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    try:
+        channels.submit_request(
+            ChannelRequest(
+                correlation_id=new_id(),
+                user_id=user_id,
+                client_message=ClientMessage(data=text),
+                response_future=future,
+                on_chunk=on_chunk,
+            )
         )
-    )
+    except ChannelFull:
+        return BUSY_RESPONSE
     return await future
 
 
 MAX_EXIT_WAIT = 120  # Maximum wait time for /exit_N
 
 
+async def _send_and_print(text: str, user_id: uuid.UUID, channels: Channels) -> None:
+    """Send a request and print the reply, as it streams if enabled."""
+    if RESPONSE_STREAMING == "off":
+        print(await _send_request(text, user_id, channels))
+        return
+    streamed: list[str] = []
+
+    def on_chunk(chunk: str) -> None:
+        streamed.append(chunk)
+        print(chunk, end="", flush=True)
+
+    reply = await _send_request(text, user_id, channels, on_chunk)
+    if not streamed:
+        print(reply)
+    elif "".join(streamed) == reply:
+        print()
+    else:
+        # The graph replied with something other than the streamed text
+        print(f"\n{reply}")
+
+
 def _parse_exit_command(text: str) -> int | None:
     """Parse /exit or /exit_N command. Returns wait seconds or None if not exit."""
     if text == "/exit":
@@ -112,10 +125,7 @@ def _parse_exit_command(text: str) -> int | None:
 
 
 async def _handle_user_input(
-    text: str,
-    user_id: uuid.UUID,
-    channels: Channels,
-    pending: dict[uuid.UUID, asyncio.Future],
+    text: str, user_id: uuid.UUID, channels: Channels
 ) -> tuple[str, int]:
     """Handle user input. Returns (action, wait_seconds)."""
     if not text:
@@ -132,12 +142,12 @@ async def _handle_user_input(
         print(f"Error: {error}")
     else:
         # Send to graph (handles /help, /clear, /delete, /mode and regular messages)
-        print(await _send_request(normalized, user_id, channels, pending))
+        await _send_and_print(normalized, user_id, channels)
     return ("continue", 0)
 
 
 async def _read_and_process_input(
-    channels: Channels, user_id: uuid.UUID, pending: dict[uuid.UUID, asyncio.Future]
+    channels: Channels, user_id: uuid.UUID
 ) -> tuple[str, int]:
     """Read one input line and process it. Returns (action, wait_seconds)."""
     loop = asyncio.get_event_loop()
@@ -145,15 +155,13 @@ async def _read_and_process_input(
         text = await loop.run_in_executor(None, input, "> ")
     except EOFError:
         return ("exit", 0)
-    return await _handle_user_input(text.strip(), user_id, channels, pending)
+    return await _handle_user_input(text.strip(), user_id, channels)
 
 
-async def _run_input_loop(
-    channels: Channels, user_id: uuid.UUID, pending: dict[uuid.UUID, asyncio.Future]
-) -> None:
+async def _run_input_loop(channels: Channels, user_id: uuid.UUID) -> None:
     """Read input, send requests, await responses."""
     while not channels.shutdown.is_set():
-        action, wait_seconds = await _read_and_process_input(channels, user_id, pending)
+        action, wait_seconds = await _read_and_process_input(channels, user_id)
         if action == "exit":
             if wait_seconds > 0:
                 print(f"Waiting {wait_seconds}s for background tasks...")
@@ -167,11 +175,4 @@ async def run_cli(channels: Channels, user_id: uuid.UUID) -> None:
     user = await get_or_create_user(user_id)
     logger.info("Starting CLI transport", extra={"user_id": str(user.id)})
     print(f"User: {user.id}\nType /help for commands.\n")
-
-    pending: dict[uuid.UUID, asyncio.Future[str]] = {}
-    listener = asyncio.create_task(_response_listener(channels, pending))
-    try:
-        await _run_input_loop(channels, user.id, pending)
-    finally:
-        listener.cancel()
-        await asyncio.gather(listener, return_exceptions=True)
+    await _run_input_loop(channels, user.id)
@@ -16,6 +16,7 @@ from aiogram.types import Message
 from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
 from aiohttp import web
 
+from src.config.settings import RESPONSE_STREAMING
 from src.config.telegram_settings import (
     TELEGRAM_BOT_TOKEN,
     TELEGRAM_MAX_MESSAGE_LENGTH,
@@ -29,8 +30,9 @@ from src.config.telegram_settings import (
 )
 from src.domain import ClientMessage, MediaMessage, MessageType
 from src.processes.auth.interfaces import AuthRequest
-from src.processes.interview.interfaces import ChannelRequest, ChannelResponse
-from src.runtime import Channels
+from src.processes.interview.interfaces import BUSY_RESPONSE, ChannelRequest
+from src.processes.transport.telegram_stream import ReplyStream
+from src.runtime import ChannelFull, Channels
 from src.shared.ids import new_id
 
 logger = logging.getLogger(__name__)
@@ -103,9 +105,13 @@ async def _get_user_id(
     display_name: str | None,
     channels: Channels,
 ) -> uuid.UUID:
-    """Send AuthRequest, await user_id via future."""
+    """Send AuthRequest, await user_id via future.
+
+    Raises:
+        ChannelFull: The auth channel is full.
+    """
     future: asyncio.Future[uuid.UUID] = asyncio.get_running_loop().create_future()
-    await channels.auth_requests.put(
+    channels.auth_requests.admit(
         AuthRequest(
             provider="telegram",
             external_id=str(telegram_id),
@@ -120,19 +126,22 @@ async def _send_request(
     user_id: uuid.UUID,
     client_message: ClientMessage,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
+    on_chunk: Callable[[str], None] | None = None,
 ) -> str:
-    """Send request to graph workers and await response."""
-    corr_id = new_id()
+    """Send request to graph workers and await the reply (BUSY_RESPONSE if full)."""
     future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
-    pending_responses[corr_id] = future
-    await channels.requests.put(
-        ChannelRequest(
-            correlation_id=corr_id,
-            user_id=user_id,
-            client_message=client_message,
+    try:
+        channels.submit_request(
+            ChannelRequest(
+                correlation_id=new_id(),
+                user_id=user_id,
+                client_message=client_message,
+                response_future=future,
+                on_chunk=on_chunk,
+            )
         )
-    )
+    except ChannelFull:
+        return BUSY_RESPONSE
     return await future
 
 
@@ -155,28 +164,36 @@ def _split_message(text: str, max_length: int) -> list[str]:
 
 async def _send_response(bot: Bot, chat_id: int, text: str) -> None:
     """Send response, splitting if too long."""
-    for chunk in _split_message(text, TELEGRAM_MAX_MESSAGE_LENGTH):
+    await _send_chunks(bot, chat_id, _split_message(text, TELEGRAM_MAX_MESSAGE_LENGTH))
+
+
+async def _send_chunks(bot: Bot, chat_id: int, chunks: list[str]) -> None:
+    """Send each chunk as its own message."""
+    for chunk in chunks:
         await _retry_send(
             lambda c=chunk: bot.send_message(chat_id, c),
             "sending response",
         )
 
 
-async def _dispatch_responses(
+async def _respond(
+    bot: Bot,
+    chat_id: int,
+    user_id: uuid.UUID,
+    client_msg: ClientMessage,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> None:
-    """Match graph responses to pending futures."""
-    while not channels.shutdown.is_set():
-        try:
-            response: ChannelResponse = await asyncio.wait_for(
-                channels.responses.get(), timeout=0.5
-            )
-        except asyncio.TimeoutError:
-            continue
-        if future := pending_responses.pop(response.correlation_id, None):
-            future.set_result(response.response_text)
-        channels.responses.task_done()
+    """Send request to the graph and deliver the reply, streaming if enabled."""
+    if RESPONSE_STREAMING == "off":
+        response = await _send_request(user_id, client_msg, channels)
+        await _send_response(bot, chat_id, response)
+        return
+    stream = ReplyStream(bot, chat_id)
+    response = await _send_request(user_id, client_msg, channels, stream.push)
+    chunks = _split_message(response, TELEGRAM_MAX_MESSAGE_LENGTH)
+    if await stream.finish(chunks[0]):
+        chunks = chunks[1:]
+    await _send_chunks(bot, chat_id, chunks)
 
 
 def _get_display_name(message: Message) -> str | None:
@@ -191,27 +208,34 @@ def _get_display_name(message: Message) -> str | None:
     return None
 
 
+async def _process_text(
+    message: Message,
+    bot: Bot,
+    channels: Channels,
+) -> None:
+    """Send text message to the graph and respond."""
+    user_id = await _get_user_id(
+        message.from_user.id, _get_display_name(message), channels
+    )
+    client_msg = ClientMessage(data=message.text)
+    await _respond(bot, message.chat.id, user_id, client_msg, channels)
+
+
 async def _handle_text_message(
     message: Message,
     bot: Bot,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> None:
     """Process text message through graph."""
     if not message.from_user or not message.text:
         return
     try:
         async with _typing(bot, message.chat.id):
-            user_id = await _get_user_id(
-                message.from_user.id, _get_display_name(message), channels
-            )
-            client_msg = ClientMessage(data=message.text)
-            response = await _send_request(
-                user_id, client_msg, channels, pending_responses
-            )
-            await _send_response(bot, message.chat.id, response)
+            await _process_text(message, bot, channels)
     except asyncio.TimeoutError:
         await _safe_reply(message, "Service temporarily unavailable. Please try again.")
+    except ChannelFull:
+        await _safe_reply(message, BUSY_RESPONSE)
     except Exception:
         logger.exception("Failed to process text message")
         await _safe_reply(message, "An error occurred. Please try again.")
@@ -230,7 +254,6 @@ async def _process_voice(
     message: Message,
     bot: Bot,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> None:
     """Download, transcribe, and respond to voice message."""
     if not message.voice:
@@ -244,24 +267,24 @@ async def _process_voice(
     )
     media = MediaMessage(type=MessageType.audio, content=voice_data)
     client_msg = ClientMessage(data=media)
-    response = await _send_request(user_id, client_msg, channels, pending_responses)
-    await _send_response(bot, message.chat.id, response)
+    await _respond(bot, message.chat.id, user_id, client_msg, channels)
 
 
 async def _handle_voice_message(
     message: Message,
     bot: Bot,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> None:
     """Process voice message through graph."""
     if not message.from_user or not message.voice:
         return
     try:
         async with _typing(bot, message.chat.id):
-            await _process_voice(message, bot, channels, pending_responses)
+            await _process_voice(message, bot, channels)
     except asyncio.TimeoutError:
         await _safe_reply(message, "Service temporarily unavailable. Please try again.")
+    except ChannelFull:
+        await _safe_reply(message, BUSY_RESPONSE)
     except Exception:
         logger.exception("Failed to process voice message")
         await _safe_reply(message, "An error occurred. Please try again.")
@@ -271,7 +294,6 @@ async def _process_video_note(
     message: Message,
     bot: Bot,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> None:
     """Download, transcribe, and respond to video note (video circle)."""
     if not message.video_note:
@@ -285,24 +307,24 @@ async def _process_video_note(
     )
     media = MediaMessage(type=MessageType.video, content=video_data)
     client_msg = ClientMessage(data=media)
-    response = await _send_request(user_id, client_msg, channels, pending_responses)
-    await _send_response(bot, message.chat.id, response)
+    await _respond(bot, message.chat.id, user_id, client_msg, channels)
 
 
 async def _handle_video_note_message(
     message: Message,
     bot: Bot,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> None:
     """Process video note (video circle) message through graph."""
     if not message.from_user or not message.video_note:
         return
     try:
         async with _typing(bot, message.chat.id):
-            await _process_video_note(message, bot, channels, pending_responses)
+            await _process_video_note(message, bot, channels)
     except asyncio.TimeoutError:
         await _safe_reply(message, "Service temporarily unavailable. Please try again.")
+    except ChannelFull:
+        await _safe_reply(message, BUSY_RESPONSE)
     except Exception:
         logger.exception("Failed to process video note message")
         await _safe_reply(message, "An error occurred. Please try again.")
@@ -311,7 +333,6 @@ async def _handle_video_note_message(
 def _create_router(
     bot: Bot,
     channels: Channels,
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]],
 ) -> Router:
     """Create message router with handlers."""
     router = Router()
@@ -327,52 +348,40 @@ def _create_router(
     @router.message(F.text.startswith("/"), ~Command("start"))
     async def on_command(message: Message) -> None:
         """Route all commands (except /start) through the graph."""
-        await _handle_text_message(message, bot, channels, pending_responses)
+        await _handle_text_message(message, bot, channels)
 
     @router.message(F.text)
     async def on_text(message: Message) -> None:
-        await _handle_text_message(message, bot, channels, pending_responses)
+        await _handle_text_message(message, bot, channels)
 
     @router.message(F.voice)
     async def on_voice(message: Message) -> None:
-        await _handle_voice_message(message, bot, channels, pending_responses)
+        await _handle_voice_message(message, bot, channels)
 
     @router.message(F.video_note)
     async def on_video_note(message: Message) -> None:
-        await _handle_video_note_message(message, bot, channels, pending_responses)
+        await _handle_video_note_message(message, bot, channels)
 
     return router
 
 
-def _setup_bot(channels: Channels) -> tuple[Bot, Dispatcher, asyncio.Task]:
-    """Initialize bot, dispatcher, and response dispatcher task."""
+def _setup_bot(channels: Channels) -> tuple[Bot, Dispatcher]:
+    """Initialize bot and dispatcher."""
     validate_telegram_config()
     bot = Bot(token=TELEGRAM_BOT_TOKEN)
     dp = Dispatcher()
-    pending_responses: dict[uuid.UUID, asyncio.Future[str]] = {}
-    router = _create_router(bot, channels, pending_responses)
-    dp.include_router(router)
-    dispatcher_task = asyncio.create_task(
-        _dispatch_responses(channels, pending_responses)
-    )
-    return bot, dp, dispatcher_task
-
-
-async def _cleanup_bot(bot: Bot, dispatcher_task: asyncio.Task) -> None:
-    """Cancel dispatcher task and close bot session."""
-    dispatcher_task.cancel()
-    await asyncio.gather(dispatcher_task, return_exceptions=True)
-    await bot.session.close()
+    dp.include_router(_create_router(bot, channels))
+    return bot, dp
 
 
 async def run_telegram_polling(channels: Channels) -> None:
     """Run Telegram bot in polling mode."""
-    bot, dp, dispatcher_task = _setup_bot(channels)
+    bot, dp = _setup_bot(channels)
     logger.info("Starting Telegram polling")
     try:
         await dp.start_polling(bot, handle_signals=False)
     finally:
-        await _cleanup_bot(bot, dispatcher_task)
+        await bot.session.close()
 
 
 async def _create_webhook_app(dp: Dispatcher, bot: Bot) -> web.AppRunner:
@@ -392,13 +401,12 @@ async def _run_webhook_server(runner: web.AppRunner, channels: Channels) -> None
     """Start webhook server and wait for shutdown."""
     site = web.TCPSite(runner, TELEGRAM_WEBHOOK_HOST, get_webhook_port())
     await site.start()
-    while not channels.shutdown.is_set():
-        await asyncio.sleep(0.5)
+    await channels.shutdown.wait()
 
 
 async def run_telegram_webhook(channels: Channels) -> None:
     """Run Telegram bot in webhook mode."""
-    bot, dp, dispatcher_task = _setup_bot(channels)
+    bot, dp = _setup_bot(channels)
     logger.info("Starting Telegram webhook", extra={"url": TELEGRAM_WEBHOOK_URL})
     runner = await _create_webhook_app(dp, bot)
     try:
@@ -406,7 +414,7 @@ async def run_telegram_webhook(channels: Channels) -> None:
     finally:
         await bot.delete_webhook()
         await runner.cleanup()
-        await _cleanup_bot(bot, dispatcher_task)
+        await bot.session.close()
 
 
 async def run_telegram(channels: Channels) -> None:
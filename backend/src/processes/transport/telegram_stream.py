@@ -0,0 +1,88 @@
+"""Progressive display of a streamed reply in one Telegram message."""
+
+import asyncio
+import contextlib
+import logging
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
+
+from src.config.telegram_settings import (
+    TELEGRAM_MAX_MESSAGE_LENGTH,
+    get_stream_edit_interval,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReplyStream:
+    """Shows reply deltas by sending one message and editing it as text grows.
+
+    Edits are throttled to one per TELEGRAM_STREAM_EDIT_INTERVAL seconds and
+    the preview is cut at the Telegram length limit; ``finish`` replaces it
+    with the final reply. Preview failures are logged, not raised, since the
+    final reply is sent regardless.
+    """
+
+    def __init__(self, bot: Bot, chat_id: int) -> None:
+        self._bot = bot
+        self._chat_id = chat_id
+        self._interval = get_stream_edit_interval()
+        self._text = ""
+        self._shown = ""
+        self._message_id: int | None = None
+        self._last_flush = float("-inf")
+        self._flush_task: asyncio.Task | None = None
+        self._sending = False
+
+    def push(self, delta: str) -> None:
+        """Append a delta and schedule an edit if none is pending."""
+        self._text += delta
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def finish(self, text: str) -> bool:
+        """Show text as the final preview; False if no message was sent yet."""
+        if self._flush_task is not None:
+            # Only a pending edit is cancelled; one in progress must finish
+            # so the placeholder's message_id is known
+            if not self._sending:
+                self._flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+            self._flush_task = None
+        if self._message_id is None:
+            return False
+        await self._show(text)
+        return True
+
+    async def _flush_later(self) -> None:
+        loop = asyncio.get_running_loop()
+        delay = self._last_flush + self._interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._sending = True
+        self._last_flush = loop.time()
+        try:
+            await self._show(self._text[:TELEGRAM_MAX_MESSAGE_LENGTH])
+        except TelegramAPIError:
+            logger.warning("Could not update streamed reply", exc_info=True)
+        finally:
+            self._sending = False
+            self._flush_task = None
+
+    async def _show(self, text: str) -> None:
+        if text == self._shown:
+            return
+        if self._message_id is None:
+            message = await self._bot.send_message(self._chat_id, text)
+            self._message_id = message.message_id
+        else:
+            try:
+                await self._bot.edit_message_text(
+                    text, chat_id=self._chat_id, message_id=self._message_id
+                )
+            except TelegramBadRequest as e:
+                if "not modified" not in str(e):
+                    raise
+        self._shown = text
@@ -1,6 +1,27 @@
 """Shared runtime infrastructure for worker pools and channels."""
 
 from src.runtime.channels import Channels
-from src.runtime.pool import run_worker_pool
+from src.runtime.pool import (
+    WorkerPoolStats,
+    get_worker_pool_stats,
+    run_worker_pool,
+    worker_busy,
+)
+from src.runtime.queues import (
+    BoundedChannel,
+    ChannelFull,
+    ChannelStats,
+    KeyedChannel,
+)
 
-__all__ = ["Channels", "run_worker_pool"]
+__all__ = [
+    "BoundedChannel",
+    "ChannelFull",
+    "ChannelStats",
+    "Channels",
+    "KeyedChannel",
+    "WorkerPoolStats",
+    "get_worker_pool_stats",
+    "run_worker_pool",
+    "worker_busy",
+]
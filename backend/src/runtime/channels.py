@@ -3,17 +3,57 @@
 import asyncio
 from dataclasses import dataclass, field
 
-from src.processes.auth.interfaces import AuthRequest
-from src.processes.extract.interfaces import ExtractTask
-from src.processes.interview.interfaces import ChannelRequest, ChannelResponse
+from src.config.settings import (
+    CHANNEL_ADMISSION_POLICY,
+    CHANNEL_AUTH_MAXSIZE,
+    CHANNEL_REQUESTS_MAXSIZE,
+)
+from src.processes.extract.queue import ExtractQueue
+from src.processes.interview.interfaces import BUSY_RESPONSE, ChannelRequest
+from src.runtime.queues import BoundedChannel, ChannelStats, KeyedChannel
+
+
+def _request_user(request: ChannelRequest):
+    return request.user_id
+
+
+def _new_requests_channel() -> KeyedChannel:
+    return KeyedChannel(_request_user, CHANNEL_REQUESTS_MAXSIZE)
 
 
 @dataclass
 class Channels:
     """Shared communication channels between all worker pools."""
 
-    requests: asyncio.Queue[ChannelRequest] = field(default_factory=asyncio.Queue)
-    responses: asyncio.Queue[ChannelResponse] = field(default_factory=asyncio.Queue)
-    extract: asyncio.Queue[ExtractTask] = field(default_factory=asyncio.Queue)
-    auth_requests: asyncio.Queue[AuthRequest] = field(default_factory=asyncio.Queue)
+    # Bounded: transports admit() work and answer BUSY_RESPONSE when full.
+    # Keyed by user: FIFO per user, one in flight per user, round-robin across users
+    requests: KeyedChannel = field(default_factory=_new_requests_channel)
+    # Durable (SQLite-backed), so pending extractions survive restarts
+    extract: ExtractQueue = field(default_factory=ExtractQueue)
+    auth_requests: BoundedChannel = field(
+        default_factory=lambda: BoundedChannel(CHANNEL_AUTH_MAXSIZE)
+    )
     shutdown: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def submit_request(self, request: ChannelRequest) -> None:
+        """Admit a request for the graph workers.
+
+        With CHANNEL_ADMISSION_POLICY=shed a full channel drops its oldest
+        request, which is answered with BUSY_RESPONSE.
+
+        Raises:
+            ChannelFull: The channel is full (CHANNEL_ADMISSION_POLICY=reject).
+        """
+        dropped = self.requests.admit(request, shed=CHANNEL_ADMISSION_POLICY == "shed")
+        if dropped is not None:
+            dropped.reply(BUSY_RESPONSE)
+
+    def stats(self) -> dict[str, ChannelStats]:
+        """Depth/age gauges of the in-memory channels.
+
+        The durable extract queue reports its own via ``await extract.stats()``.
+        """
+        return {
+            "requests": self.requests.stats(),
+            "auth_requests": self.auth_requests.stats(),
+        }
@@ -1,53 +1,263 @@
-"""Worker pool utilities for running concurrent workers."""
+"""Autoscaling worker pools.
+
+``run_worker_pool`` keeps between ``pool_size`` and ``max_size`` workers:
+
+- Scale up: every WORKER_POOL_SCALE_INTERVAL the pool grows to busy workers
+  plus queued work (``depth()``), capped at ``max_size``
+- Scale down: once the pool has been oversized for
+  WORKER_POOL_SCALE_DOWN_DELAY, one idle worker is cancelled per interval.
+  Idle workers are blocked in a queue ``get()``, which is cancellation-safe
+- A worker that crashes (or returns before shutdown) is restarted on its own
+  after WORKER_RESTART_BACKOFF * 2**(n-1) seconds for its n-th consecutive
+  crash, capped at WORKER_RESTART_BACKOFF_MAX; the other workers keep running
+
+Workers wrap the handling of each item in ``worker_busy(name)`` so the pool
+knows which workers are idle and tracks the mean time per item.
+``get_worker_pool_stats()`` reports size, busy count, restarts and latency.
+"""
 
 import asyncio
+import inspect
 import logging
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 
-from src.config.settings import WORKER_SHUTDOWN_CHECK_INTERVAL
+from src.config.settings import (
+    WORKER_POOL_SCALE_DOWN_DELAY,
+    WORKER_POOL_SCALE_INTERVAL,
+    WORKER_RESTART_BACKOFF,
+    WORKER_RESTART_BACKOFF_MAX,
+)
 
 logger = logging.getLogger(__name__)
 
+# Weight of the newest item in the mean latency (exponential moving average)
+_LATENCY_ALPHA = 0.2
+
+Depth = Callable[[], int | Awaitable[int]]
+
+
+@dataclass
+class WorkerPoolStats:
+    """Gauges and counters of one worker pool since it started."""
+
+    size: int = 0
+    busy: int = 0
+    min_size: int = 0
+    max_size: int = 0
+    completed: int = 0
+    restarts: int = 0
+    scale_ups: int = 0
+    scale_downs: int = 0
+    mean_latency: float = 0.0
+
+
+class _WorkerPool:
+    """Worker tasks of one pool, keyed by worker_id."""
+
+    def __init__(
+        self,
+        name: str,
+        worker_fn: Callable[[int], Awaitable[None]],
+        sizes: tuple[int, int],
+        depth: Depth | None,
+    ) -> None:
+        self.name = name
+        self.worker_fn = worker_fn
+        self.min_size, self.max_size = sizes
+        self.depth = depth
+        self.tasks: dict[int, asyncio.Task] = {}
+        self.busy: set[asyncio.Task] = set()
+        self.stats = WorkerPoolStats(min_size=self.min_size, max_size=self.max_size)
+        self._retired: set[asyncio.Task] = set()
+        self._started: dict[int, float] = {}
+        self._crashes: dict[int, int] = {}
+        self._oversized_since: float | None = None
+
+    def start(self, worker_id: int, delay: float = 0.0) -> None:
+        self._started[worker_id] = time.monotonic() + delay
+        self.tasks[worker_id] = asyncio.create_task(
+            self._run(worker_id, delay), name=f"{self.name}-worker-{worker_id}"
+        )
+
+    async def _run(self, worker_id: int, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+        await self.worker_fn(worker_id)
+
+    def record(self, elapsed: float) -> None:
+        """Count a finished item and fold its duration into the mean."""
+        self.stats.completed += 1
+        if self.stats.completed == 1:
+            self.stats.mean_latency = elapsed
+        else:
+            self.stats.mean_latency += _LATENCY_ALPHA * (
+                elapsed - self.stats.mean_latency
+            )
+
+    def restart(self, done: set[asyncio.Task]) -> None:
+        """Restart each finished worker after its backoff."""
+        for worker_id, task in list(self.tasks.items()):
+            if task not in done:
+                continue
+            exc = None if task.cancelled() else task.exception()
+            logger.error(
+                "%s worker %d exited, restarting",
+                self.name,
+                worker_id,
+                exc_info=exc,
+            )
+            # A worker that ran longer than the cap starts a fresh crash streak
+            ran = time.monotonic() - self._started[worker_id]
+            streak = self._crashes.get(worker_id, 0) + 1
+            crashes = 1 if ran >= WORKER_RESTART_BACKOFF_MAX else streak
+            self._crashes[worker_id] = crashes
+            self.stats.restarts += 1
+            delay = WORKER_RESTART_BACKOFF * 2 ** (crashes - 1)
+            self.start(worker_id, min(delay, WORKER_RESTART_BACKOFF_MAX))
+
+    async def rescale(self) -> None:
+        """Grow to busy + queued workers, or shrink after a sustained surplus."""
+        if self.depth is None or self.max_size <= self.min_size:
+            return
+        queued = await self._queued()
+        if queued is None:
+            return
+        target = max(self.min_size, min(self.max_size, len(self.busy) + queued))
+        if target < len(self.tasks):
+            self._shrink()
+            return
+        self._oversized_since = None
+        if target > len(self.tasks):
+            free = (i for i in range(self.max_size) if i not in self.tasks)
+            for _ in range(target - len(self.tasks)):
+                self.start(next(free))
+            self.stats.scale_ups += 1
+            logger.info("Scaled %s pool up", self.name, extra={"size": target})
+
+    async def _queued(self) -> int | None:
+        try:
+            queued = self.depth()
+            if inspect.isawaitable(queued):
+                queued = await queued
+        except Exception:
+            logger.exception("Failed to read %s pool queue depth", self.name)
+            return None
+        return queued
+
+    def _shrink(self) -> None:
+        now = time.monotonic()
+        if self._oversized_since is None:
+            self._oversized_since = now
+        if now - self._oversized_since < WORKER_POOL_SCALE_DOWN_DELAY:
+            return
+        idle = [i for i, task in self.tasks.items() if task not in self.busy]
+        if not idle:
+            return
+        task = self.tasks.pop(max(idle))
+        task.cancel()
+        # Keep a reference until the cancellation completes
+        self._retired.add(task)
+        task.add_done_callback(self._retired.discard)
+        self.stats.scale_downs += 1
+        logger.info("Scaled %s pool down", self.name, extra={"size": len(self.tasks)})
+
+    async def supervise(self, shutdown: asyncio.Event) -> None:
+        """Start min_size workers, then restart and rescale until shutdown."""
+        for worker_id in range(self.min_size):
+            self.start(worker_id)
+        # Wakes on shutdown or a finished worker; ticks only to rescale
+        stopping = asyncio.create_task(shutdown.wait())
+        scaling = self.depth is not None and self.max_size > self.min_size
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    [stopping, *self.tasks.values()],
+                    timeout=WORKER_POOL_SCALE_INTERVAL if scaling else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if stopping in done:
+                    return
+                self.restart(done)
+                await self.rescale()
+        finally:
+            stopping.cancel()
+
+    async def stop(self) -> None:
+        tasks = [*self.tasks.values(), *self._retired]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# Running pools by name
+_pools: dict[str, _WorkerPool] = {}
+
+
+@contextmanager
+def worker_busy(name: str) -> Iterator[None]:
+    """Mark the calling worker of pool ``name`` busy while handling one item."""
+    pool = _pools.get(name)
+    task = asyncio.current_task()
+    if pool is None or task is None:
+        yield
+        return
+    pool.busy.add(task)
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        pool.busy.discard(task)
+        pool.record(time.monotonic() - start)
+
+
+def get_worker_pool_stats() -> dict[str, WorkerPoolStats]:
+    """Current size, busy count and counters of every running pool."""
+    for pool in _pools.values():
+        pool.stats.size = len(pool.tasks)
+        pool.stats.busy = len(pool.busy)
+    return {name: pool.stats for name, pool in _pools.items()}
+
 
 async def run_worker_pool(
     name: str,
     worker_fn: Callable[[int], Awaitable[None]],
     pool_size: int,
     shutdown: asyncio.Event,
+    *,
+    max_size: int | None = None,
+    depth: Depth | None = None,
 ) -> None:
-    """Run a pool of workers concurrently.
+    """Run a pool of workers until shutdown, scaling with queued work.
+
+    Workers are cancelled as soon as shutdown is set, so they can block in a
+    queue get() without polling the event.
 
     Args:
-        name: Name for logging (e.g., "graph", "extract")
+        name: Name for logging and stats (e.g., "graph", "extract")
         worker_fn: Async function that takes worker_id and runs until shutdown
-        pool_size: Number of workers to spawn
+        pool_size: Minimum number of workers (the fixed size without depth)
         shutdown: Event that signals all workers to exit
+        max_size: Maximum number of workers (default: pool_size)
+        depth: Returns the number of queued items a new worker could take
+            now (sync or async); without it the pool does not scale
     """
-    logger.info("Starting %s worker pool", name, extra={"pool_size": pool_size})
-
-    tasks = [
-        asyncio.create_task(worker_fn(worker_id), name=f"{name}-worker-{worker_id}")
-        for worker_id in range(pool_size)
-    ]
-
+    sizes = (pool_size, max(pool_size, max_size or pool_size))
+    pool = _WorkerPool(name, worker_fn, sizes, depth)
+    _pools[name] = pool
+    logger.info(
+        "Starting %s worker pool",
+        name,
+        extra={"pool_size": pool_size, "max_size": sizes[1]},
+    )
     try:
-        # Check shutdown periodically
-        while not shutdown.is_set():
-            done, pending = await asyncio.wait(
-                tasks,
-                timeout=WORKER_SHUTDOWN_CHECK_INTERVAL,
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-            if done:
-                # A worker exited (crashed or finished)
-                break
-        # Cancel remaining workers
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
+        await pool.supervise(shutdown)
     except asyncio.CancelledError:
         logger.info("Shutting down %s worker pool", name)
-        for task in tasks:
-            task.cancel()
-        await asyncio.gather(*tasks, return_exceptions=True)
         raise
+    finally:
+        await pool.stop()
+        if _pools.get(name) is pool:
+            del _pools[name]
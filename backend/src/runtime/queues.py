@@ -0,0 +1,224 @@
+"""Bounded in-process channels with admission control and depth/age gauges.
+
+- BoundedChannel: a FIFO asyncio.Queue
+- KeyedChannel: per-key FIFO with fair round-robin across keys (graph requests)
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+class ChannelFull(Exception):
+    """Raised when a bounded channel rejects an item (admission control)."""
+
+
+@dataclass
+class ChannelStats:
+    """Gauges and counters of one channel since process start."""
+
+    depth: int = 0
+    maxsize: int = 0
+    oldest_age: float = 0.0
+    admitted: int = 0
+    rejected: int = 0
+    shed: int = 0
+
+
+class BoundedChannel(asyncio.Queue):
+    """asyncio.Queue that records enqueue times and never blocks producers.
+
+    Producers call ``admit`` instead of ``put``: when the channel is full the
+    item is rejected with ChannelFull, or with ``shed=True`` the oldest queued
+    item is dropped (and returned) to make room. ``maxsize=0`` is unbounded.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        super().__init__(maxsize)
+        self._counters = ChannelStats(maxsize=maxsize)
+
+    # asyncio.Queue storage hooks (as overridden by PriorityQueue/LifoQueue)
+    def _init(self, maxsize: int) -> None:
+        self._queue: deque[tuple[float, object]] = deque()
+
+    def _put(self, item) -> None:
+        self._queue.append((time.monotonic(), item))
+
+    def _get(self):
+        return self._queue.popleft()[1]
+
+    def admit(self, item, shed: bool = False):
+        """Enqueue item without waiting.
+
+        Returns:
+            The dropped item when the channel was full and shed is True,
+            otherwise None.
+
+        Raises:
+            ChannelFull: The channel is full and shed is False.
+        """
+        dropped = None
+        if self.full():
+            if not shed:
+                self._counters.rejected += 1
+                raise ChannelFull(f"channel full ({self.maxsize} items)")
+            dropped = self._queue.popleft()[1]
+            # The dropped item will never be processed, so settle its put()
+            self.task_done()
+            self._counters.shed += 1
+        self.put_nowait(item)
+        self._counters.admitted += 1
+        return dropped
+
+    def stats(self) -> ChannelStats:
+        """Current depth and age of the oldest queued item, plus counters."""
+        self._counters.depth = self.qsize()
+        self._counters.oldest_age = (
+            time.monotonic() - self._queue[0][0] if self._queue else 0.0
+        )
+        return self._counters
+
+
+class KeyedChannel:
+    """Per-key FIFO queues served round-robin, one in-flight item per key.
+
+    Items with the same key (e.g. a user_id) are handed out strictly in order
+    and never concurrently: a key is only served again after ``task_done`` is
+    called for its previous item. Keys with queued work take turns, so one
+    busy key cannot starve the others. Admission works like BoundedChannel,
+    with ``maxsize`` bounding the total number of queued items.
+    """
+
+    def __init__(self, key: Callable[[Any], Hashable], maxsize: int = 0) -> None:
+        self.maxsize = maxsize
+        self._key = key
+        self._queues: dict[Hashable, deque[tuple[float, Any]]] = {}
+        # Keys with queued items and nothing in flight, in serving order
+        self._ready: deque[Hashable] = deque()
+        self._in_flight: set[Hashable] = set()
+        self._getters: deque[asyncio.Future] = deque()
+        self._size = 0
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._counters = ChannelStats(maxsize=maxsize)
+
+    def qsize(self) -> int:
+        return self._size
+
+    def full(self) -> bool:
+        return 0 < self.maxsize <= self._size
+
+    def servable(self) -> int:
+        """Number of items get() could hand out now (one per ready key)."""
+        return len(self._ready)
+
+    def admit(self, item, shed: bool = False):
+        """Enqueue item without waiting (see BoundedChannel.admit)."""
+        dropped = None
+        if self.full():
+            if not shed:
+                self._counters.rejected += 1
+                raise ChannelFull(f"channel full ({self.maxsize} items)")
+            dropped = self._drop_oldest()
+            self._counters.shed += 1
+        self._enqueue(item)
+        self._counters.admitted += 1
+        return dropped
+
+    async def put(self, item) -> None:
+        """Admit item, rejecting it when full (API parity with asyncio.Queue)."""
+        self.admit(item)
+
+    def get_nowait(self):
+        """Take the next item of the next ready key.
+
+        Raises:
+            asyncio.QueueEmpty: No key has a servable item.
+        """
+        if not self._ready:
+            raise asyncio.QueueEmpty
+        key = self._ready.popleft()
+        queue = self._queues[key]
+        _, item = queue.popleft()
+        if not queue:
+            del self._queues[key]
+        self._in_flight.add(key)
+        self._size -= 1
+        return item
+
+    async def get(self):
+        """Wait for and take the next servable item."""
+        while not self._ready:
+            waiter = asyncio.get_running_loop().create_future()
+            self._getters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                with contextlib.suppress(ValueError):
+                    self._getters.remove(waiter)
+                # Pass a wake-up this getter consumed on to the next one
+                if self._ready and not waiter.cancelled():
+                    self._wake_getter()
+                raise
+        return self.get_nowait()
+
+    def task_done(self, item) -> None:
+        """Mark item processed so its key can be served again."""
+        key = self._key(item)
+        self._in_flight.discard(key)
+        if key in self._queues:
+            self._ready.append(key)
+            self._wake_getter()
+        self._settle()
+
+    async def join(self) -> None:
+        """Wait until every admitted item was taken and marked done."""
+        await self._finished.wait()
+
+    def stats(self) -> ChannelStats:
+        """Current depth and age of the oldest queued item, plus counters."""
+        self._counters.depth = self._size
+        heads = [queue[0][0] for queue in self._queues.values()]
+        self._counters.oldest_age = time.monotonic() - min(heads) if heads else 0.0
+        return self._counters
+
+    def _drop_oldest(self):
+        key = min(self._queues, key=lambda k: self._queues[k][0][0])
+        queue = self._queues[key]
+        _, item = queue.popleft()
+        if not queue:
+            del self._queues[key]
+            if key in self._ready:
+                self._ready.remove(key)
+        self._size -= 1
+        self._settle()
+        return item
+
+    def _enqueue(self, item) -> None:
+        key = self._key(item)
+        queue = self._queues.setdefault(key, deque())
+        queue.append((time.monotonic(), item))
+        if len(queue) == 1 and key not in self._in_flight:
+            self._ready.append(key)
+        self._size += 1
+        self._unfinished += 1
+        self._finished.clear()
+        self._wake_getter()
+
+    def _settle(self) -> None:
+        self._unfinished -= 1
+        if self._unfinished == 0:
+            self._finished.set()
+
+    def _wake_getter(self) -> None:
+        while self._getters:
+            waiter = self._getters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
@@ -0,0 +1,111 @@
+"""Async micro-batching: coalesce concurrent single-item calls into batch calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass
+class BatcherStats:
+    """Counters describing batching since process start."""
+
+    items: int = 0
+    batches: int = 0
+    max_batch: int = 0
+    splits: int = 0
+
+    @property
+    def mean_batch(self) -> float:
+        return self.items / self.batches if self.batches else 0.0
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collect submitted items and pass them to ``flush`` as one list.
+
+    A batch is flushed when it reaches ``max_size`` items or ``max_wait``
+    seconds after its first item, whichever comes first. ``flush`` must return
+    one result per item, in order. If it raises one of ``split_on`` (errors
+    caused by an item, e.g. a text over the token limit), the batch is split
+    in halves and retried, so the bad item only fails its own caller. Any
+    other error (rate limits, timeouts) fails the whole batch: ``flush``
+    retries those itself, and splitting would only multiply the calls.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[list[R]]],
+        max_size: int,
+        max_wait: float,
+        split_on: tuple[type[Exception], ...] = (ValueError,),
+    ) -> None:
+        self._flush = flush
+        self._split_on = split_on
+        self.max_size = max(1, max_size)
+        self.max_wait = max_wait
+        self.stats = BatcherStats()
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: T) -> R:
+        """Add item to the current batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            # Keep a reference so the task is not garbage collected mid-flight
+            task = asyncio.create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        self.stats.items += len(batch)
+        self.stats.batches += 1
+        self.stats.max_batch = max(self.stats.max_batch, len(batch))
+        await self._settle(batch)
+
+    async def _settle(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results = await self._flush([item for item, _ in batch])
+        except Exception as exc:
+            if len(batch) > 1 and isinstance(exc, self._split_on):
+                self.stats.splits += 1
+                mid = len(batch) // 2
+                await asyncio.gather(
+                    self._settle(batch[:mid]), self._settle(batch[mid:])
+                )
+            else:
+                _fail(batch, exc)
+            return
+        if len(results) != len(batch):
+            _fail(
+                batch,
+                ValueError(
+                    f"flush returned {len(results)} results for {len(batch)} items"
+                ),
+            )
+            return
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
+
+
+def _fail(batch: list[tuple[object, asyncio.Future]], exc: Exception) -> None:
+    for _, future in batch:
+        if not future.done():
+            future.set_exception(exc)
@@ -0,0 +1,82 @@
+"""In-process IVF-flat approximate nearest-neighbour index (requires NumPy).
+
+Rows are unit vectors (see similarity.normalize_rows), so inner product is
+cosine similarity. Spherical k-means partitions the rows into ``nlist``
+inverted lists; a query scores the centroids, probes the ``nprobe`` best
+lists and ranks only their rows exactly.
+"""
+
+import math
+
+import numpy as np
+
+_TRAIN_ITERATIONS = 10
+_TRAIN_MAX_SAMPLES = 32_768
+_ASSIGN_CHUNK = 8192
+
+
+def default_nlist(count: int) -> int:
+    """Number of inverted lists for ``count`` rows (about sqrt(n))."""
+    return max(1, int(math.sqrt(count)))
+
+
+def _assign(rows: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Index of the most similar centroid for every row, in bounded chunks."""
+    out = np.empty(len(rows), dtype=np.int32)
+    for start in range(0, len(rows), _ASSIGN_CHUNK):
+        chunk = rows[start : start + _ASSIGN_CHUNK]
+        out[start : start + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+    return out
+
+
+def train_centroids(rows: np.ndarray, nlist: int, seed: int = 0) -> np.ndarray:
+    """Spherical k-means over (a sample of) unit rows; returns unit centroids."""
+    rng = np.random.default_rng(seed)
+    if len(rows) > _TRAIN_MAX_SAMPLES:
+        rows = rows[rng.choice(len(rows), _TRAIN_MAX_SAMPLES, replace=False)]
+    nlist = min(nlist, len(rows))
+    centroids = rows[rng.choice(len(rows), nlist, replace=False)].copy()
+    for _ in range(_TRAIN_ITERATIONS):
+        assignment = _assign(rows, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, rows)
+        empty = np.bincount(assignment, minlength=nlist) == 0
+        # Re-seed empty lists with random rows so every list stays usable
+        sums[empty] = rows[rng.choice(len(rows), int(empty.sum()))]
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        centroids = sums / np.maximum(norms, 1e-12)
+    return centroids.astype(np.float32)
+
+
+class IvfFlatIndex:
+    """Inverted lists over the rows of an external, append-only matrix."""
+
+    def __init__(self, centroids: np.ndarray, trained_on: int) -> None:
+        self.centroids = centroids
+        self.trained_on = trained_on
+        self._assignment = np.empty(0, dtype=np.int32)
+        self._order: np.ndarray | None = None
+        self._offsets: np.ndarray | None = None
+
+    def add(self, rows: np.ndarray) -> None:
+        """Assign newly appended matrix rows to their nearest list."""
+        self._assignment = np.concatenate(
+            (self._assignment, _assign(rows, self.centroids))
+        )
+        self._order = None
+
+    def _lists(self) -> tuple[np.ndarray, np.ndarray]:
+        """Row indices grouped by list (CSR layout), rebuilt after adds."""
+        if self._order is None:
+            self._order = np.argsort(self._assignment, kind="stable")
+            counts = np.bincount(self._assignment, minlength=len(self.centroids))
+            self._offsets = np.concatenate(([0], np.cumsum(counts)))
+        return self._order, self._offsets
+
+    def candidates(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        """Sorted row indices in the ``nprobe`` lists closest to a unit query."""
+        order, offsets = self._lists()
+        nprobe = min(nprobe, len(self.centroids))
+        probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        rows = [order[offsets[p] : offsets[p + 1]] for p in probe]
+        return np.sort(np.concatenate(rows))
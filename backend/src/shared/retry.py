@@ -4,6 +4,7 @@ import logging
 from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
+import openai
 from httpx import HTTPStatusError
 from tenacity import (
     RetryCallState,
@@ -34,14 +35,17 @@ def _is_retryable_exception(exc: BaseException) -> bool:
     - ConnectionError: Network connectivity issues
     - TimeoutError: Request timeouts
     - HTTPStatusError: Only for specific status codes (429, 5xx server errors)
+    - openai.APIConnectionError (including APITimeoutError) and
+      openai.APIStatusError with a retryable status code, as raised by the
+      langchain_openai chat and embedding clients
     - ValueError: Structured output parsing failures from OpenAI when reasoning
       models exhaust max_completion_tokens before producing valid JSON. The check
       matches "Structured Output response" substring which is specific to OpenAI's
       error message format (e.g., "Structured Output response did not match...").
     """
-    if isinstance(exc, (ConnectionError, TimeoutError)):
+    if isinstance(exc, (ConnectionError, TimeoutError, openai.APIConnectionError)):
         return True
-    if isinstance(exc, HTTPStatusError):
+    if isinstance(exc, (HTTPStatusError, openai.APIStatusError)):
         return exc.response.status_code in RETRYABLE_STATUS_CODES
     if isinstance(exc, ValueError) and "Structured Output response" in str(exc):
         return True
@@ -1,9 +1,19 @@
-"""Vector similarity utilities (pure Python, no extra dependencies)."""
+"""Vector similarity utilities.
+
+Batch scoring uses NumPy (a declared dependency). The pure-Python fallback
+is only a safety net for environments where NumPy fails to import.
+"""
 
 import math
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised by patching np to None
+    np = None
 
 
-def cosine_similarity(a: list[float], b: list[float]) -> float:
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
     """Compute cosine similarity between two vectors."""
     dot = sum(x * y for x, y in zip(a, b, strict=True))
     norm_a = math.sqrt(sum(x * x for x in a))
@@ -13,12 +23,65 @@ def cosine_similarity(a: list[float], b: list[float]) -> float:
     return dot / (norm_a * norm_b)
 
 
-def find_top_k(
-    query_vec: list[float],
-    candidates: list[tuple[str, list[float]]],
-    k: int = 5,
+def _find_top_k_python(
+    query_vec: Sequence[float],
+    candidates: list[tuple[str, Sequence[float]]],
+    k: int,
 ) -> list[tuple[str, float]]:
-    """Return top-k (id, score) pairs ranked by cosine similarity."""
     scored = [(cid, cosine_similarity(query_vec, vec)) for cid, vec in candidates]
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored[:k]
+
+
+def normalize_rows(vectors: Sequence[Sequence[float]]) -> "np.ndarray":
+    """Stack vectors into a float32 matrix of unit-length rows.
+
+    Zero vectors stay zero, so they score 0.0 against any query.
+    Requires NumPy.
+    """
+    matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def top_k_normalized(
+    query_vec: Sequence[float],
+    ids: Sequence[str],
+    matrix: "np.ndarray",
+    k: int,
+) -> list[tuple[str, float]]:
+    """Rank rows of a normalize_rows() matrix against a query.
+
+    One matrix-vector product scores every row; argpartition selects the k
+    best in O(n) and only those k are sorted. Ties keep input order.
+    """
+    if k <= 0 or not len(ids):
+        return []
+    if matrix.shape[1] != len(query_vec):
+        raise ValueError(
+            f"Query has {len(query_vec)} dims, candidates have {matrix.shape[1]}"
+        )
+    query = np.asarray(query_vec, dtype=np.float32)
+    norm = np.linalg.norm(query)
+    scores = matrix @ (query / norm) if norm > 0 else np.zeros(len(ids))
+    top = np.arange(len(ids))
+    if k < len(ids):
+        top = np.sort(np.argpartition(-scores, k - 1)[:k])
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return [(ids[i], float(scores[i])) for i in top]
+
+
+def find_top_k(
+    query_vec: Sequence[float],
+    candidates: list[tuple[str, Sequence[float]]],
+    k: int = 5,
+) -> list[tuple[str, float]]:
+    """Return top-k (id, score) pairs ranked by cosine similarity."""
+    if np is None:
+        return _find_top_k_python(query_vec, candidates, k)
+    if not candidates:
+        return []
+    ids = [cid for cid, _ in candidates]
+    matrix = normalize_rows([vec for _, vec in candidates])
+    return top_k_normalized(query_vec, ids, matrix, k)
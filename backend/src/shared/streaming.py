@@ -0,0 +1,74 @@
+"""Streaming user-facing LLM replies to the transport.
+
+The graph worker sets a chunk sink for the duration of one graph run with
+``streaming_to(request.on_chunk)``. The context variable reaches every node
+(LangGraph runs nodes in tasks that copy the caller's context), so nodes that
+produce the reply call ``invoke_streaming`` instead of ``ainvoke``: with a
+sink it uses ``llm.astream`` and forwards each text delta, without one it is
+a plain ``invoke_with_retry`` call. The returned message is complete either
+way, so history is saved exactly as before.
+"""
+
+import contextvars
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from langchain_core.messages import AIMessage, BaseMessage
+
+from src.shared.retry import invoke_with_retry
+from src.shared.utils.content import normalize_content
+
+ChunkSink = Callable[[str], None]
+
+_sink: contextvars.ContextVar[ChunkSink | None] = contextvars.ContextVar(
+    "stream_sink", default=None
+)
+
+
+class StreamInterruptedError(Exception):
+    """The stream failed after text was already shown, so it is not retried."""
+
+
+@contextmanager
+def streaming_to(sink: ChunkSink | None) -> Iterator[None]:
+    """Send reply text deltas produced inside the block to sink."""
+    token = _sink.set(sink)
+    try:
+        yield
+    finally:
+        _sink.reset(token)
+
+
+def stream_text(text: str) -> None:
+    """Send text produced without streaming to the current sink, if any."""
+    if (sink := _sink.get()) is not None and text:
+        sink(text)
+
+
+async def _stream(llm, messages: list[BaseMessage], sink: ChunkSink) -> BaseMessage:
+    """One streaming attempt; the chunks add up to the complete message."""
+    message = None
+    emitted = False
+    try:
+        async for chunk in llm.astream(messages):
+            message = chunk if message is None else message + chunk
+            if text := normalize_content(chunk.content):
+                emitted = True
+                sink(text)
+    except Exception as exc:
+        if emitted:
+            raise StreamInterruptedError("LLM stream interrupted") from exc
+        raise
+    return message if message is not None else AIMessage(content="")
+
+
+async def invoke_streaming(llm, messages: list[BaseMessage]) -> BaseMessage:
+    """Invoke llm, streaming text deltas to the current sink if there is one.
+
+    Retries like invoke_with_retry until the first delta reaches the sink;
+    a failure after that raises StreamInterruptedError, which is not retried.
+    """
+    sink = _sink.get()
+    if sink is None:
+        return await invoke_with_retry(lambda: llm.ainvoke(messages))
+    return await invoke_with_retry(lambda: _stream(llm, messages, sink))
@@ -0,0 +1,37 @@
+"""Packed float32 encoding for embedding vectors stored as SQLite BLOBs."""
+
+import math
+import sys
+from array import array
+from collections.abc import Sequence
+
+# Vectors are stored little-endian regardless of host byte order
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Encode a vector as little-endian float32 bytes (4 bytes per dimension)."""
+    packed = array("f", vector)
+    if not _NATIVE_LITTLE_ENDIAN:
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(blob: bytes) -> Sequence[float]:
+    """Decode a packed float32 vector.
+
+    On little-endian hosts this is a zero-copy ``memoryview`` over the blob;
+    it supports len(), indexing and iteration like a list.
+    """
+    if len(blob) % 4:
+        raise ValueError(f"Packed vector length {len(blob)} is not a multiple of 4")
+    if _NATIVE_LITTLE_ENDIAN:
+        return memoryview(blob).cast("f")
+    unpacked = array("f", blob)
+    unpacked.byteswap()
+    return unpacked
+
+
+def vector_norm(vector: Sequence[float]) -> float:
+    """Euclidean (L2) norm of a vector."""
+    return math.sqrt(sum(x * x for x in vector))
@@ -10,6 +10,8 @@ import aiosqlite
 from src.domain import InputMode, User
 from src.infrastructure.db import managers as db
 from src.infrastructure.db.connection import transaction
+from src.infrastructure.vector_ann import remove_sidecar
+from src.workflows.nodes.input.sticky_routing import get_sticky_router
 
 HELP_TEXT = """Commands:
   /help      Show this help
@@ -69,6 +71,7 @@ async def handle_help() -> str:
 
 async def handle_clear(user_id: uuid.UUID) -> str:
     """Clear all conversation history for a user."""
+    get_sticky_router().forget(user_id)
     histories = await db.HistoriesManager.list_by_user(user_id)
     if not histories:
         return "No conversation history to clear."
@@ -153,6 +156,8 @@ async def _delete_user_data(user_id: uuid.UUID) -> None:
 
         await _delete_api_keys(user_id, conn)
         await db.UsersManager.delete(user_id, conn=conn, auto_commit=False)
+    remove_sidecar(user_id)
+    get_sticky_router().forget(user_id)
 
 
 async def handle_mode_show(user: User) -> str:
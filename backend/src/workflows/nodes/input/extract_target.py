@@ -1,17 +1,32 @@
 import logging
+import time
+import uuid
+from functools import lru_cache
 from typing import Annotated
 
-from langchain_core.messages import BaseMessage, SystemMessage, ToolMessage
+from langchain_core.messages import (
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
 from langchain_core.tools import BaseTool
 from langchain_openai import ChatOpenAI
 from langgraph.graph.message import add_messages
 from pydantic import BaseModel, Field
 
-from src.config.settings import HISTORY_LIMIT_EXTRACT_TARGET
+from src.config.settings import HISTORY_LIMIT_EXTRACT_TARGET, INTENT_PRECLASSIFIER
 from src.domain.models import InputMode, User
 from src.processes.interview import Target
 from src.shared.prompts import build_extract_target_prompt
 from src.shared.retry import invoke_with_retry
+from src.shared.utils.content import normalize_content
+from src.workflows.nodes.input.intent_preclassifier import (
+    get_intent_router_stats,
+    match_examples,
+    match_rules,
+)
+from src.workflows.nodes.input.sticky_routing import get_sticky_router
 from src.workflows.subgraphs.area_loop.tools import AREA_TOOLS
 
 logger = logging.getLogger(__name__)
@@ -29,11 +44,55 @@ async def extract_target(state: ExtractTargetState, llm: ChatOpenAI):
     if user_obj.mode != InputMode.auto:
         target = Target.from_user_mode(user_obj.mode)
     else:
-        target = await extract_target_from_messages(state.messages, llm)
+        target = await _classify(user_obj.id, state.messages, llm)
 
     return {"target": target}
 
 
+def _last_user_text(messages: list[BaseMessage]) -> str:
+    for msg in reversed(messages):
+        if isinstance(msg, HumanMessage):
+            return normalize_content(msg.content)
+    return ""
+
+
+async def _preclassify(user_id: uuid.UUID, text: str) -> tuple[Target | None, str]:
+    """Local guess as (target, source): rules, then sticky, then embeddings."""
+    enabled = INTENT_PRECLASSIFIER != "off" and bool(text)
+    if enabled and (target := match_rules(text)) is not None:
+        return target, "rules"
+    if (target := get_sticky_router().guess(user_id)) is not None:
+        return target, "sticky"
+    if enabled and INTENT_PRECLASSIFIER == "embeddings":
+        try:
+            return await match_examples(text), "embeddings"
+        except Exception:
+            logger.warning("Intent similarity check failed", exc_info=True)
+    return None, ""
+
+
+async def _classify(
+    user_id: uuid.UUID, messages: list[BaseMessage], llm: ChatOpenAI
+) -> Target:
+    """Route locally when the pre-classifier is confident, else ask the LLM."""
+    stats = get_intent_router_stats()
+    target, source = await _preclassify(user_id, _last_user_text(messages))
+    if target is not None:
+        logger.info(
+            "Target pre-classified",
+            extra={"target": target.value, "source": source},
+        )
+        if source == "sticky":
+            return target
+        stats.record_local(target, source)
+    else:
+        start = time.perf_counter()
+        target = await extract_target_from_messages(messages, llm)
+        stats.record_llm(target, time.perf_counter() - start)
+    get_sticky_router().record(user_id, target)
+    return target
+
+
 class IntentClassification(BaseModel):
     target: Target = Field(..., description="The classified target mode.")
 
@@ -50,6 +109,14 @@ def _generate_areas_tools_description(tools: list[BaseTool]) -> str:
     return "\n".join(tool_descriptions)
 
 
+@lru_cache(maxsize=1)
+def _system_prompt() -> SystemMessage:
+    """Classifier system prompt; AREA_TOOLS is fixed, so it is built once."""
+    # Auto-generate tools description from AREA_TOOLS
+    areas_tools_desc = _generate_areas_tools_description(AREA_TOOLS)
+    return SystemMessage(content=build_extract_target_prompt(areas_tools_desc))
+
+
 def _strip_orphan_tool_messages(messages: list[BaseMessage]) -> list[BaseMessage]:
     """Remove ToolMessages that lack their corresponding AIMessage with tool_call.
 
@@ -76,18 +143,14 @@ def _strip_orphan_tool_messages(messages: list[BaseMessage]) -> list[BaseMessage
 async def extract_target_from_messages(
     messages: list[BaseMessage], llm: ChatOpenAI
 ) -> Target:
+    # Prepared once per LLM when the graph wraps it in PreparedLLM
     structured_llm = llm.with_structured_output(IntentClassification)
 
-    # Auto-generate tools description from AREA_TOOLS
-    areas_tools_desc = _generate_areas_tools_description(AREA_TOOLS)
-    prompt_content = build_extract_target_prompt(areas_tools_desc)
-    system_prompt = SystemMessage(content=prompt_content)
-
     # Use only last N messages for classification (limit context for extract_target)
     recent_messages = messages[-HISTORY_LIMIT_EXTRACT_TARGET:]
     # Remove orphan ToolMessages that reference tool_calls outside the slice
     recent_messages = _strip_orphan_tool_messages(recent_messages)
-    messages_with_system = [system_prompt] + recent_messages
+    messages_with_system = [_system_prompt()] + recent_messages
 
     result = await invoke_with_retry(
         lambda: structured_llm.ainvoke(messages_with_system)
@@ -0,0 +1,182 @@
+"""Local intent pre-classifier run before the extract_target LLM call.
+
+Rules match only unambiguous messages (bare greetings, imperative area
+commands, first-person answers that do not mention areas); anything else
+returns None and is left to the LLM. In "embeddings" mode a message the rules
+miss is also compared with labelled example messages, and accepted only when
+its best match is both close and clearly ahead of every other target.
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+
+from src.config.settings import INTENT_SIMILARITY_MARGIN, INTENT_SIMILARITY_MIN
+from src.processes.interview import Target
+from src.shared.similarity import find_top_k
+
+_AREA_WORDS = (
+    r"(?:(?:life\s+)?areas?|sub-?areas?|(?:sub-?)?topics?|област\w*|тем[аеуы])\b"
+)
+# Words allowed between a command verb and its area noun ("add a new area")
+_DETERMINERS = r"(?:a|an|the|new|my|me|all|another|\d+|мо\w+|нов\w+|ещё|еще|все)"
+
+# The area noun must be the verb's object: "delete the travel area" is a
+# command, "make sure to note that my main area is ..." is an answer
+_MANAGE_AREAS = re.compile(
+    r"^(?:please\s+)?(?:create|add|make|delete|remove|rename|list|show|move"
+    r"|созда\w*|добав\w*|удал\w*|покаж\w*)\s+(?:"
+    + _DETERMINERS
+    + r"\s+)*(?:(?:a|an|the|my)\s+\w+\s+)?"
+    + _AREA_WORDS
+    + r"|^(?:what|which)\s+(?:are\s+)?my\s+"
+    + _AREA_WORDS,
+    re.IGNORECASE,
+)
+_SMALL_TALK = re.compile(
+    r"^(?:hi|hello|hey|hiya|good\s+(?:morning|afternoon|evening)|thanks"
+    r"|thank\s+you|привет|здравствуй(?:те)?|добрый\s+(?:день|вечер)|спасибо"
+    r"|what\s+can\s+you\s+do|how\s+does\s+(?:this|it)\s+work"
+    r"|what\s+is\s+this\s+(?:app|bot)(?:\s+for)?|who\s+are\s+you)[\s!?.,)]*$",
+    re.IGNORECASE,
+)
+_FIRST_PERSON = re.compile(
+    r"^(?:i|i'm|i've|i'd|my|we|we've|our|я|мой|моя|мы)\b", re.IGNORECASE
+)
+_MENTIONS_AREAS = re.compile(r"\b" + _AREA_WORDS, re.IGNORECASE)
+# Answers address the topic, not the assistant ("I don't get what you do")
+_MENTIONS_ASSISTANT = re.compile(
+    r"\b(?:you|your|this\s+(?:app|bot)|ты|вы|бот)\b", re.IGNORECASE
+)
+
+# Shortest first-person message treated as an interview answer
+_MIN_ANSWER_WORDS = 4
+
+LABELLED_EXAMPLES: dict[Target, tuple[str, ...]] = {
+    Target.manage_areas: (
+        "Create area for my career",
+        "Add sub-area Python under Skills",
+        "Create topics for hobbies, health and family",
+        "List my areas",
+        "Delete the fitness area",
+        "Which sub-areas should we add?",
+        "Rename the travel topic",
+    ),
+    Target.conduct_interview: (
+        "I have 5 years experience in backend development",
+        "My goal is to become a team lead",
+        "Let me tell you about my last job",
+        "I exercise 3 times a week",
+        "I studied economics at university",
+        "We shipped the project in six months",
+    ),
+    Target.small_talk: (
+        "Hello",
+        "What can you do?",
+        "How does this work?",
+        "What is this app for?",
+        "Good morning!",
+        "Thanks, that's helpful",
+    ),
+}
+
+
+@dataclass
+class IntentRouterStats:
+    """Counters for extract_target routing since process start.
+
+    Keys are target values. saved_seconds estimates the LLM time avoided as
+    local hits times the mean latency of the LLM calls that were made.
+    """
+
+    rule_hits: dict[str, int] = field(default_factory=dict)
+    similarity_hits: dict[str, int] = field(default_factory=dict)
+    llm_routes: dict[str, int] = field(default_factory=dict)
+    llm_seconds: float = 0.0
+
+    def record_local(self, target: Target, source: str) -> None:
+        hits = self.rule_hits if source == "rules" else self.similarity_hits
+        hits[target.value] = hits.get(target.value, 0) + 1
+
+    def record_llm(self, target: Target, seconds: float) -> None:
+        self.llm_routes[target.value] = self.llm_routes.get(target.value, 0) + 1
+        self.llm_seconds += seconds
+
+    def hit_rates(self) -> dict[str, float]:
+        """Share of messages per target routed without the LLM."""
+        rates = {}
+        for target in Target:
+            local = self.rule_hits.get(target.value, 0)
+            local += self.similarity_hits.get(target.value, 0)
+            total = local + self.llm_routes.get(target.value, 0)
+            rates[target.value] = local / total if total else 0.0
+        return rates
+
+    @property
+    def saved_seconds(self) -> float:
+        llm_calls = sum(self.llm_routes.values())
+        if not llm_calls:
+            return 0.0
+        local = sum(self.rule_hits.values()) + sum(self.similarity_hits.values())
+        return local * self.llm_seconds / llm_calls
+
+
+_stats = IntentRouterStats()
+_example_vectors: list[tuple[str, list[float]]] | None = None
+
+
+def get_intent_router_stats() -> IntentRouterStats:
+    """Return routing counters for this process."""
+    return _stats
+
+
+def match_rules(text: str) -> Target | None:
+    """Target for an unambiguous message, or None to ask the LLM."""
+    text = text.strip()
+    if _MANAGE_AREAS.search(text):
+        return Target.manage_areas
+    if _SMALL_TALK.match(text):
+        return Target.small_talk
+    if (
+        _FIRST_PERSON.match(text)
+        and len(text.split()) >= _MIN_ANSWER_WORDS
+        and not text.endswith("?")
+        and not _MENTIONS_AREAS.search(text)
+        and not _MENTIONS_ASSISTANT.search(text)
+    ):
+        return Target.conduct_interview
+    return None
+
+
+async def _get_example_vectors() -> list[tuple[str, list[float]]]:
+    global _example_vectors
+    if _example_vectors is None:
+        from src.infrastructure.embeddings import embed_text
+
+        labelled = [
+            (target.value, example)
+            for target, examples in LABELLED_EXAMPLES.items()
+            for example in examples
+        ]
+        vectors = await asyncio.gather(*(embed_text(text) for _, text in labelled))
+        _example_vectors = [
+            (label, vector)
+            for (label, _), vector in zip(labelled, vectors, strict=True)
+        ]
+    return _example_vectors
+
+
+async def match_examples(text: str) -> Target | None:
+    """Target of the closest labelled example if it is a confident match."""
+    from src.infrastructure.embeddings import embed_text
+
+    candidates = await _get_example_vectors()
+    ranked = find_top_k(await embed_text(text), candidates, k=len(candidates))
+    best_target, best_score = ranked[0]
+    runner_up = next((score for target, score in ranked if target != best_target), 0.0)
+    if (
+        best_score < INTENT_SIMILARITY_MIN
+        or best_score - runner_up < INTENT_SIMILARITY_MARGIN
+    ):
+        return None
+    return Target(best_target)
@@ -0,0 +1,105 @@
+"""Sticky routing: reuse a user's last target for follow-up turns.
+
+Most answers in an interview stay in conduct_interview, so after a
+classified turn routes there, the user's next turns reuse the target without
+classification. The guess decays: it is used for at most STICKY_ROUTING_TURNS
+consecutive turns and only while each turn arrives within STICKY_ROUTING_TTL
+seconds of the previous one. After that the classifier runs again and either
+confirms the target (starting a new streak) or corrects it; corrections are
+counted as a measure of how often sticky guesses were wrong.
+
+Sessions live in process memory. Graph worker processes own users by id, so
+a user's turns always see the same session.
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.config.settings import STICKY_ROUTING_TTL, STICKY_ROUTING_TURNS
+from src.processes.interview import Target
+
+# Targets whose follow-up turns usually stay in the same flow
+STICKY_TARGETS = frozenset({Target.conduct_interview})
+# Upper bound on remembered sessions; least recently routed users go first
+MAX_STICKY_SESSIONS = 10_000
+
+
+@dataclass
+class StickyRoutingStats:
+    """Counters for sticky guesses since process start.
+
+    confirmed / corrected count classified turns that followed sticky
+    guesses and agreed / disagreed with them.
+    """
+
+    hits: int = 0
+    expired: int = 0
+    confirmed: int = 0
+    corrected: int = 0
+
+    @property
+    def correction_rate(self) -> float:
+        """Fraction of checked sticky streaks the classifier overrode."""
+        checked = self.confirmed + self.corrected
+        return self.corrected / checked if checked else 0.0
+
+
+@dataclass
+class _Session:
+    target: Target
+    routed_at: float
+    guesses: int = 0
+
+
+class StickyRouter:
+    """Per-user last target with a turn budget and an idle timeout."""
+
+    def __init__(self, max_turns: int, ttl: float) -> None:
+        self.max_turns = max_turns
+        self.ttl = ttl
+        self.stats = StickyRoutingStats()
+        self._sessions: OrderedDict[uuid.UUID, _Session] = OrderedDict()
+
+    def guess(self, user_id: uuid.UUID) -> Target | None:
+        """Reuse the last target if the session is fresh and has budget left."""
+        session = self._sessions.get(user_id)
+        if session is None or session.guesses >= self.max_turns:
+            return None
+        now = time.monotonic()
+        if now - session.routed_at > self.ttl:
+            del self._sessions[user_id]
+            self.stats.expired += 1
+            return None
+        session.guesses += 1
+        session.routed_at = now
+        self._sessions.move_to_end(user_id)
+        self.stats.hits += 1
+        return session.target
+
+    def record(self, user_id: uuid.UUID, target: Target) -> None:
+        """Remember a classified target and score the guesses it follows."""
+        session = self._sessions.pop(user_id, None)
+        if session is not None and session.guesses:
+            if session.target == target:
+                self.stats.confirmed += 1
+            else:
+                self.stats.corrected += 1
+        if self.max_turns <= 0 or target not in STICKY_TARGETS:
+            return
+        self._sessions[user_id] = _Session(target, time.monotonic())
+        if len(self._sessions) > MAX_STICKY_SESSIONS:
+            self._sessions.popitem(last=False)
+
+    def forget(self, user_id: uuid.UUID) -> None:
+        """Drop the user's session, e.g. after their history is cleared."""
+        self._sessions.pop(user_id, None)
+
+
+_router = StickyRouter(STICKY_ROUTING_TURNS, STICKY_ROUTING_TTL)
+
+
+def get_sticky_router() -> StickyRouter:
+    """Return the sticky router for this process."""
+    return _router
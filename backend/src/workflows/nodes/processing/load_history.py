@@ -58,10 +58,8 @@ def _convert_tool_message(message_dict: dict[str, Any]) -> ToolMessage:
 async def get_formatted_history(
     user_obj: User, limit: int = HISTORY_LIMIT_GLOBAL
 ) -> list[BaseMessage]:
-    history_entries = sorted(
-        await db.HistoriesManager.list_by_user(user_obj.id), key=lambda x: x.created_ts
-    )
-    message_dicts = [entry.message_data for entry in history_entries[-limit:]]
+    history_entries = await db.HistoriesManager.list_recent_by_user(user_obj.id, limit)
+    message_dicts = [entry.message_data for entry in history_entries]
 
     formatted_messages = []
     for message_dict in message_dicts:
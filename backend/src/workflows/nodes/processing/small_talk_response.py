@@ -7,7 +7,7 @@ from src.config.settings import HISTORY_LIMIT_EXTRACT_TARGET
 from src.processes.interview import State
 from src.shared.messages import filter_tool_messages
 from src.shared.prompts import PROMPT_SMALL_TALK
-from src.shared.retry import invoke_with_retry
+from src.shared.streaming import invoke_streaming
 from src.shared.timestamp import get_timestamp
 
 logger = logging.getLogger(__name__)
@@ -19,7 +19,7 @@ async def small_talk_response(state: State, llm: ChatOpenAI):
     history = chat_messages[-HISTORY_LIMIT_EXTRACT_TARGET:]
     messages = [SystemMessage(content=PROMPT_SMALL_TALK), *history]
 
-    response = await invoke_with_retry(lambda: llm.ainvoke(messages))
+    response = await invoke_streaming(llm, messages)
 
     logger.info(
         "Small talk response generated",
@@ -0,0 +1,75 @@
+"""Nodes for batched knowledge_extraction (KNOWLEDGE_EXTRACTION_MODE=batched)."""
+
+import asyncio
+import logging
+
+from src.infrastructure.db import managers as db
+from src.shared.timestamp import get_timestamp
+
+from .nodes import save_knowledge_items
+from .state import BatchSummary, KnowledgeBatchState
+
+logger = logging.getLogger(__name__)
+
+
+async def load_summaries(state: KnowledgeBatchState) -> dict:
+    """Load summary texts and owning user ids for the batch."""
+    summaries = await db.SummariesManager.get_by_ids(state.summary_ids)
+    areas = await db.LifeAreasManager.get_by_ids(list({s.area_id for s in summaries}))
+    user_by_area = {area.id: area.user_id for area in areas}
+    missing = len(state.summary_ids) - len(summaries)
+    if missing:
+        logger.warning("Summaries not found", extra={"missing_count": missing})
+    return {
+        "summaries": [
+            BatchSummary(
+                summary_id=s.id,
+                area_id=s.area_id,
+                user_id=user_by_area.get(s.area_id),
+                summary_text=s.summary_text,
+            )
+            for s in summaries
+        ]
+    }
+
+
+async def _embed(summary: BatchSummary) -> BatchSummary:
+    from src.infrastructure.embeddings import embed_document
+
+    try:
+        vector = await embed_document(summary.summary_text)
+    except Exception:
+        logger.exception(
+            "Embedding failed", extra={"summary_id": str(summary.summary_id)}
+        )
+        return summary
+    return summary.model_copy(update={"summary_vector": vector})
+
+
+async def vectorize_summaries(state: KnowledgeBatchState) -> dict:
+    """Embed every summary; concurrent calls share batched API requests."""
+    summaries = await asyncio.gather(*(_embed(s) for s in state.summaries))
+    return {"summaries": list(summaries)}
+
+
+async def persist_batch(state: KnowledgeBatchState) -> dict:
+    """Persist vectors and knowledge items of the whole batch in one transaction."""
+    from src.infrastructure.db.connection import transaction
+
+    now = get_timestamp()
+    saved_count = 0
+    async with transaction() as conn:
+        for summary in state.summaries:
+            if summary.summary_vector is not None:
+                await db.SummariesManager.update_vector(
+                    summary.summary_id, summary.summary_vector, conn=conn
+                )
+            saved_count += await save_knowledge_items(
+                summary.summary_id, summary.extracted_knowledge, now, conn
+            )
+
+    logger.info(
+        "Persisted extraction batch",
+        extra={"summaries": len(state.summaries), "knowledge_count": saved_count},
+    )
+    return {}
@@ -5,27 +5,31 @@ from functools import partial
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
 
+from .batch_nodes import load_summaries, persist_batch, vectorize_summaries
+from .knowledge_nodes import extract_knowledge_batch
 from .nodes import (
     extract_knowledge,
     load_summary,
     persist_extraction,
     vectorize_summary,
 )
-from .state import KnowledgeExtractionState
+from .state import KnowledgeBatchState, KnowledgeExtractionState
 
 
-def _route_after_load(state: KnowledgeExtractionState) -> str:
-    return "vectorize_summary" if state.summary_text else "__end__"
+def _route_after_load(state: KnowledgeExtractionState) -> list[str] | str:
+    if not state.summary_text:
+        return "__end__"
+    return ["vectorize_summary", "extract_knowledge"]
 
 
 def build_knowledge_extraction_graph(llm: ChatOpenAI):
     """Build the knowledge_extraction workflow graph.
 
-    Linear 4-node pipeline:
+    Fan-out/fan-in over 4 nodes:
     1. load_summary: loads summary text and area_id from DB
-    2. vectorize_summary: generates embedding vector
-    3. extract_knowledge: extracts skills/facts from summary text
-    4. persist_extraction: saves vector + knowledge items atomically
+    2. vectorize_summary and extract_knowledge, in parallel: the embedding
+       vector and the skills/facts are independent calls on the same text
+    3. persist_extraction: waits for both, saves vector + knowledge atomically
 
     Args:
         llm: LLM client for knowledge extraction
@@ -41,9 +45,45 @@ def build_knowledge_extraction_graph(llm: ChatOpenAI):
     builder.add_node("persist_extraction", persist_extraction)
 
     builder.add_edge(START, "load_summary")
-    builder.add_conditional_edges("load_summary", _route_after_load)
-    builder.add_edge("vectorize_summary", "extract_knowledge")
-    builder.add_edge("extract_knowledge", "persist_extraction")
+    builder.add_conditional_edges(
+        "load_summary",
+        _route_after_load,
+        ["vectorize_summary", "extract_knowledge", END],
+    )
+    builder.add_edge(["vectorize_summary", "extract_knowledge"], "persist_extraction")
     builder.add_edge("persist_extraction", END)
 
     return builder.compile()
+
+
+def build_knowledge_batch_extraction_graph(llm: ChatOpenAI):
+    """Build the batched knowledge_extraction workflow graph.
+
+    Same pipeline as build_knowledge_extraction_graph over several summaries:
+    1. load_summaries: loads texts and owning user ids
+    2. vectorize_summaries: embeds all texts (batched API calls)
+    3. extract_knowledge_batch: one structured LLM call per user
+    4. persist_batch: saves all vectors + knowledge items in one transaction
+
+    Args:
+        llm: LLM client for knowledge extraction
+
+    Returns:
+        Compiled LangGraph workflow
+    """
+    builder = StateGraph(KnowledgeBatchState)
+
+    builder.add_node("load_summaries", load_summaries)
+    builder.add_node("vectorize_summaries", vectorize_summaries)
+    builder.add_node(
+        "extract_knowledge_batch", partial(extract_knowledge_batch, llm=llm)
+    )
+    builder.add_node("persist_batch", persist_batch)
+
+    builder.add_edge(START, "load_summaries")
+    builder.add_edge("load_summaries", "vectorize_summaries")
+    builder.add_edge("vectorize_summaries", "extract_knowledge_batch")
+    builder.add_edge("extract_knowledge_batch", "persist_batch")
+    builder.add_edge("persist_batch", END)
+
+    return builder.compile()
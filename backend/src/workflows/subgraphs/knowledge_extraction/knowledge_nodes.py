@@ -1,13 +1,15 @@
 """Knowledge extraction nodes for extract_data workflow."""
 
+import asyncio
 import json
 import logging
+import uuid
 from typing import Literal
 
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 
-from .state import KnowledgeExtractionState
+from .state import BatchSummary, KnowledgeBatchState, KnowledgeExtractionState
 
 logger = logging.getLogger(__name__)
 
@@ -100,3 +102,95 @@ async def extract_knowledge(state: KnowledgeExtractionState, llm: ChatOpenAI) ->
             "Failed to extract knowledge", extra={"summary_id": str(state.summary_id)}
         )
         return {"extracted_knowledge": []}
+
+
+_BATCH_INSTRUCTIONS = (
+    "\nBatch mode:\n"
+    "- The input holds several summaries about the same user, each with an id\n"
+    "- Extract from each summary on its own and return one entry per summary id\n"
+    "- Use an empty item list for a summary without extractable knowledge\n"
+)
+
+
+class SummaryKnowledge(BaseModel):
+    """Knowledge items extracted from one summary of a batch."""
+
+    summary_id: str = Field(description="The id of the summary the items come from")
+    items: list[KnowledgeItem] = Field(
+        default_factory=list, description="List of extracted knowledge items"
+    )
+
+
+class BatchKnowledgeExtractionResult(BaseModel):
+    """Result of knowledge extraction from several summaries."""
+
+    summaries: list[SummaryKnowledge] = Field(
+        default_factory=list, description="One entry per input summary"
+    )
+
+
+async def _extract_group(group: list[BatchSummary], llm: ChatOpenAI) -> dict[str, list]:
+    """One structured call for a user's summaries; returns items by summary id."""
+    user_prompt = {
+        "summaries": [
+            {"id": str(s.summary_id), "summary": s.summary_text} for s in group
+        ]
+    }
+    structured_llm = llm.with_structured_output(BatchKnowledgeExtractionResult)
+    result = await structured_llm.ainvoke(
+        [
+            {
+                "role": "system",
+                "content": _KNOWLEDGE_EXTRACTION_PROMPT + _BATCH_INSTRUCTIONS,
+            },
+            {"role": "user", "content": json.dumps(user_prompt)},
+        ]
+    )
+    if not isinstance(result, BatchKnowledgeExtractionResult):
+        result = BatchKnowledgeExtractionResult.model_validate(result)
+    return {
+        entry.summary_id: [item.model_dump() for item in entry.items]
+        for entry in result.summaries
+    }
+
+
+async def _extract_group_safe(
+    group: list[BatchSummary], llm: ChatOpenAI
+) -> dict[str, list]:
+    try:
+        return await _extract_group(group, llm)
+    except Exception:
+        logger.exception(
+            "Failed to extract knowledge batch",
+            extra={"summary_ids": [str(s.summary_id) for s in group]},
+        )
+        return {}
+
+
+async def extract_knowledge_batch(state: KnowledgeBatchState, llm: ChatOpenAI) -> dict:
+    """Extract skills and facts for a batch with one LLM call per user.
+
+    Summaries of different users are never mixed into one prompt. Entries
+    the model returns for unknown ids are ignored.
+    """
+    groups: dict[uuid.UUID | None, list[BatchSummary]] = {}
+    for summary in state.summaries:
+        if summary.summary_text and summary.user_id is not None:
+            groups.setdefault(summary.user_id, []).append(summary)
+    results = await asyncio.gather(
+        *(_extract_group_safe(group, llm) for group in groups.values())
+    )
+    by_id = {k: v for result in results for k, v in result.items()}
+    summaries = [
+        s.model_copy(update={"extracted_knowledge": by_id.get(str(s.summary_id), [])})
+        for s in state.summaries
+    ]
+    logger.info(
+        "Extracted knowledge batch",
+        extra={
+            "summaries": len(summaries),
+            "llm_calls": len(groups),
+            "items_count": sum(len(s.extracted_knowledge) for s in summaries),
+        },
+    )
+    return {"summaries": summaries}
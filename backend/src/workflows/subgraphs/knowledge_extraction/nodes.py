@@ -1,6 +1,7 @@
 """Nodes for knowledge_extraction workflow."""
 
 import logging
+import uuid
 
 import aiosqlite
 
@@ -43,10 +44,10 @@ async def load_summary(state: KnowledgeExtractionState) -> dict:
 
 async def vectorize_summary(state: KnowledgeExtractionState) -> dict:
     """Generate embedding vector for the summary text."""
-    from src.infrastructure.embeddings import get_embedding_client
+    from src.infrastructure.embeddings import embed_document
 
     try:
-        vector = await get_embedding_client().aembed_query(state.summary_text)
+        vector = await embed_document(state.summary_text)
         return {"summary_vector": vector}
     except Exception:
         logger.exception(
@@ -55,12 +56,21 @@ async def vectorize_summary(state: KnowledgeExtractionState) -> dict:
         return {}
 
 
-async def _save_knowledge_items(
-    state: KnowledgeExtractionState, now: float, conn: aiosqlite.Connection
+async def save_knowledge_items(
+    summary_id: uuid.UUID,
+    items: list[dict],
+    now: float,
+    conn: aiosqlite.Connection,
 ) -> int:
-    """Save extracted knowledge items within a transaction."""
+    """Save extracted knowledge items within a transaction.
+
+    Items previously saved for the summary are replaced, so a redelivered
+    extract task does not duplicate knowledge.
+    """
+    if items:
+        await db.UserKnowledgeManager.delete_by_summary(summary_id, conn)
     saved_count = 0
-    for item in state.extracted_knowledge:
+    for item in items:
         knowledge_id = new_id()
         knowledge = db.UserKnowledge(
             id=knowledge_id,
@@ -68,7 +78,7 @@ async def _save_knowledge_items(
             kind=item["kind"],
             confidence=item["confidence"],
             created_ts=now,
-            summary_id=state.summary_id,
+            summary_id=summary_id,
         )
         await db.UserKnowledgeManager.create(
             knowledge_id, knowledge, conn, auto_commit=False
@@ -89,7 +99,9 @@ async def persist_extraction(state: KnowledgeExtractionState) -> dict:
             )
         saved_count = 0
         if state.extracted_knowledge and state.area_id:
-            saved_count = await _save_knowledge_items(state, now, conn)
+            saved_count = await save_knowledge_items(
+                state.summary_id, state.extracted_knowledge, now, conn
+            )
 
     logger.info(
         "Persisted extraction",
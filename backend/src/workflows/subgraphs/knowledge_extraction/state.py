@@ -21,3 +21,23 @@ class KnowledgeExtractionState(BaseModel):
 
     # Extracted knowledge items: [{"content": str, "kind": str, "confidence": float}]
     extracted_knowledge: list[dict] = []
+
+
+class BatchSummary(BaseModel):
+    """One summary inside a knowledge extraction batch."""
+
+    summary_id: uuid.UUID
+    area_id: uuid.UUID
+    user_id: uuid.UUID | None = None
+    summary_text: str = ""
+    summary_vector: list[float] | None = None
+    extracted_knowledge: list[dict] = []
+
+
+class KnowledgeBatchState(BaseModel):
+    """State for the batched knowledge_extraction workflow."""
+
+    summary_ids: list[uuid.UUID]
+
+    # Loaded from DB, then enriched in place by each node
+    summaries: list[BatchSummary] = []
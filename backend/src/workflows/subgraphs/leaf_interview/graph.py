@@ -5,6 +5,7 @@ from functools import partial
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, START, StateGraph
 
+from src.config.settings import LEAF_SPECULATIVE_RESPONSE
 from src.workflows.subgraphs.leaf_interview.nodes import (
     completed_area_response,
     create_turn_summary,
@@ -15,14 +16,34 @@ from src.workflows.subgraphs.leaf_interview.nodes import (
     update_coverage_status,
 )
 from src.workflows.subgraphs.leaf_interview.routers import route_after_context_load
+from src.workflows.subgraphs.leaf_interview.speculative import speculative_turn
 from src.workflows.subgraphs.leaf_interview.state import LeafInterviewState
 
 
 def _add_nodes(
-    builder: StateGraph, llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI
+    builder: StateGraph,
+    llm_evaluate: ChatOpenAI,
+    llm_response: ChatOpenAI,
+    speculative: bool,
 ) -> None:
     """Register all nodes on the graph builder."""
     builder.add_node("load_interview_context", load_interview_context)
+    if speculative:
+        _add_speculative_turn_node(builder, llm_evaluate, llm_response)
+    else:
+        _add_turn_nodes(builder, llm_evaluate, llm_response)
+    builder.add_node(
+        "generate_leaf_response", partial(generate_leaf_response, llm=llm_response)
+    )
+    builder.add_node(
+        "completed_area_response", partial(completed_area_response, llm=llm_response)
+    )
+
+
+def _add_turn_nodes(
+    builder: StateGraph, llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI
+) -> None:
+    """Register the nodes handling an answer to the current leaf's question."""
     builder.add_node(
         "create_turn_summary", partial(create_turn_summary, llm=llm_response)
     )
@@ -31,33 +52,55 @@ def _add_nodes(
         "update_coverage_status", partial(update_coverage_status, llm=llm_response)
     )
     builder.add_node("select_next_leaf", select_next_leaf)
+
+
+def _add_speculative_turn_node(
+    builder: StateGraph, llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI
+) -> None:
+    """Register speculative_turn in place of the sequential turn nodes."""
     builder.add_node(
-        "generate_leaf_response", partial(generate_leaf_response, llm=llm_response)
-    )
-    builder.add_node(
-        "completed_area_response", partial(completed_area_response, llm=llm_response)
+        "speculative_turn",
+        partial(speculative_turn, llm_evaluate=llm_evaluate, llm_response=llm_response),
     )
 
 
-def _add_edges(builder: StateGraph) -> None:
+def _add_edges(builder: StateGraph, speculative: bool) -> None:
     """Wire all edges on the graph builder."""
+    turn_start = "speculative_turn" if speculative else "create_turn_summary"
     builder.add_edge(START, "load_interview_context")
     builder.add_conditional_edges(
         "load_interview_context",
         route_after_context_load,
-        ["create_turn_summary", "generate_leaf_response", "completed_area_response"],
+        {
+            "create_turn_summary": turn_start,
+            "generate_leaf_response": "generate_leaf_response",
+            "completed_area_response": "completed_area_response",
+        },
     )
-    builder.add_edge("create_turn_summary", "quick_evaluate")
-    builder.add_edge("quick_evaluate", "update_coverage_status")
-    builder.add_edge("update_coverage_status", "select_next_leaf")
-    builder.add_edge("select_next_leaf", "generate_leaf_response")
+    if speculative:
+        builder.add_edge("speculative_turn", END)
+    else:
+        builder.add_edge("create_turn_summary", "quick_evaluate")
+        builder.add_edge("quick_evaluate", "update_coverage_status")
+        builder.add_edge("update_coverage_status", "select_next_leaf")
+        builder.add_edge("select_next_leaf", "generate_leaf_response")
     builder.add_edge("generate_leaf_response", END)
     builder.add_edge("completed_area_response", END)
 
 
-def build_leaf_interview_graph(llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI):
-    """Build and compile the leaf interview subgraph."""
+def build_leaf_interview_graph(
+    llm_evaluate: ChatOpenAI,
+    llm_response: ChatOpenAI,
+    speculative: bool | None = None,
+):
+    """Build and compile the leaf interview subgraph.
+
+    speculative defaults to LEAF_SPECULATIVE_RESPONSE; when set, answers are
+    handled by speculative_turn instead of the sequential turn nodes.
+    """
+    if speculative is None:
+        speculative = LEAF_SPECULATIVE_RESPONSE == "on"
     builder = StateGraph(LeafInterviewState)
-    _add_nodes(builder, llm_evaluate, llm_response)
-    _add_edges(builder)
+    _add_nodes(builder, llm_evaluate, llm_response, speculative)
+    _add_edges(builder, speculative)
     return builder.compile()
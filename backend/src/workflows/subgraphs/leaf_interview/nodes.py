@@ -20,6 +20,7 @@ from src.shared.prompts import (
     PROMPT_TURN_SUMMARY,
 )
 from src.shared.retry import invoke_with_retry
+from src.shared.streaming import invoke_streaming
 from src.shared.timestamp import get_timestamp
 from src.shared.tree_utils import SubAreaInfo, get_leaf_path
 from src.shared.utils.content import normalize_content
@@ -92,7 +93,7 @@ async def _count_user_exchanges(leaf_id: uuid.UUID) -> int:
 async def _prompt_llm_with_history(llm: ChatOpenAI, prompt: str, history: list) -> str:
     """Send system prompt + chat history to LLM and return response content."""
     messages = [SystemMessage(content=prompt), *history]
-    response = await invoke_with_retry(lambda: llm.ainvoke(messages))
+    response = await invoke_streaming(llm, messages)
     return response.content
 
 
@@ -394,7 +395,7 @@ async def completed_area_response(state: LeafInterviewState, llm: ChatOpenAI):
     history = chat_messages[-HISTORY_LIMIT_EXTRACT_TARGET:]
     messages = [SystemMessage(content=prompt), *history]
 
-    response = await invoke_with_retry(lambda: llm.ainvoke(messages))
+    response = await invoke_streaming(llm, messages)
 
     logger.info(
         "Completed area response generated",
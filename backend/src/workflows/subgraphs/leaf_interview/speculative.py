@@ -0,0 +1,128 @@
+"""Speculative leaf turns (LEAF_SPECULATIVE_RESPONSE=on).
+
+A regular turn makes three dependent LLM round trips: create_turn_summary,
+quick_evaluate, then generate_leaf_response. The reply depends on the
+evaluation only through its status, so speculative_turn starts both possible
+replies while the summary and evaluation run:
+
+- follow-up: another question on the current leaf, with a generic context
+  in place of the evaluator's reason
+- advance: acknowledgement plus the question for the next uncovered leaf
+  (or the all-done reply)
+
+The variant matching the evaluation is kept and the other is cancelled. If
+neither matches (e.g. the next leaf turned out different), the reply is
+generated as usual. Variants run without streaming, so the kept reply is
+sent to the transport in one piece.
+"""
+
+import asyncio
+import logging
+from functools import partial
+
+from langchain_openai import ChatOpenAI
+
+from src.shared.interview_models import LeafEvaluation
+from src.shared.streaming import stream_text, streaming_to
+from src.workflows.subgraphs.leaf_interview.nodes import (
+    create_turn_summary,
+    generate_leaf_response,
+    quick_evaluate,
+    select_next_leaf,
+    update_coverage_status,
+)
+from src.workflows.subgraphs.leaf_interview.state import LeafInterviewState
+
+logger = logging.getLogger(__name__)
+
+# Follow-up context used before the evaluator's actual reason is known
+SPECULATIVE_FOLLOWUP_REASON = "The user's answer does not fully cover this topic yet."
+
+
+async def _evaluate_turn(
+    state: LeafInterviewState, llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI
+) -> dict:
+    """Run the summary → evaluation → next-leaf chain; returns merged updates."""
+    updates: dict = {}
+    for node in (
+        partial(create_turn_summary, llm=llm_response),
+        partial(quick_evaluate, llm=llm_evaluate),
+        partial(update_coverage_status, llm=llm_response),
+        select_next_leaf,
+    ):
+        updates.update(await node(state.model_copy(update=updates)))
+    return updates
+
+
+async def _followup_reply(state: LeafInterviewState, llm: ChatOpenAI) -> dict:
+    """Reply for a partial evaluation."""
+    evaluation = LeafEvaluation(status="partial", reason=SPECULATIVE_FOLLOWUP_REASON)
+    return await generate_leaf_response(
+        state.model_copy(update={"leaf_evaluation": evaluation}), llm
+    )
+
+
+async def _advance_reply(state: LeafInterviewState, llm: ChatOpenAI) -> tuple:
+    """Reply for a complete evaluation; returns (next leaf id, reply updates)."""
+    evaluation = LeafEvaluation(status="complete", reason="Speculative")
+    assumed = state.model_copy(
+        update={
+            "leaf_evaluation": evaluation,
+            "completed_leaf_id": state.active_leaf_id,
+        }
+    )
+    assumed = assumed.model_copy(update=await select_next_leaf(assumed))
+    return assumed.active_leaf_id, await generate_leaf_response(assumed, llm)
+
+
+async def _pick_reply(
+    state: LeafInterviewState,
+    updates: dict,
+    followup: asyncio.Task,
+    advance: asyncio.Task,
+) -> dict | None:
+    """The speculative reply whose assumption the evaluation confirmed, if any."""
+    evaluation = updates.get("leaf_evaluation")
+    if evaluation is None or updates.get("is_successful") is False:
+        return None
+    if evaluation.status == "partial":
+        return await followup
+    next_leaf_id, reply = await advance
+    if next_leaf_id != updates.get("active_leaf_id", state.active_leaf_id):
+        return None
+    return reply
+
+
+async def _speculate(
+    state: LeafInterviewState, llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI
+) -> tuple[dict, dict | None]:
+    """Evaluate the turn with both variants in flight; (updates, kept reply)."""
+    with streaming_to(None):
+        followup = asyncio.create_task(_followup_reply(state, llm_response))
+        advance = asyncio.create_task(_advance_reply(state, llm_response))
+    try:
+        updates = await _evaluate_turn(state, llm_evaluate, llm_response)
+        return updates, await _pick_reply(state, updates, followup, advance)
+    finally:
+        for task in (followup, advance):
+            task.cancel()
+        await asyncio.gather(followup, advance, return_exceptions=True)
+
+
+async def speculative_turn(
+    state: LeafInterviewState, llm_evaluate: ChatOpenAI, llm_response: ChatOpenAI
+):
+    """Handle an answer like the sequential turn nodes, with speculative replies."""
+    updates, reply = await _speculate(state, llm_evaluate, llm_response)
+    if reply is None:
+        logger.info(
+            "Speculative replies discarded",
+            extra={"leaf_id": str(state.active_leaf_id)},
+        )
+        reply = await generate_leaf_response(
+            state.model_copy(update=updates), llm_response
+        )
+    else:
+        for message in reply.get("messages", []):
+            stream_text(message.content)
+    return {**updates, **reply}
@@ -16,15 +16,24 @@ def _fast_test_timeouts(monkeypatch):
 
     Applied automatically to all tests.
     """
-    # Fast worker polling for responsive test shutdown
-    monkeypatch.setattr("src.config.settings.WORKER_POLL_TIMEOUT", 0.01)
-    monkeypatch.setattr("src.config.settings.WORKER_SHUTDOWN_CHECK_INTERVAL", 0.01)
-
     # Fast retry for testing failure scenarios
     monkeypatch.setattr("src.config.settings.RETRY_INITIAL_WAIT", 0.01)
     monkeypatch.setattr("src.config.settings.RETRY_MAX_WAIT", 0.1)
 
 
+@pytest.fixture(autouse=True)
+def _isolated_embedding_cache(monkeypatch):
+    """Give every test an empty process embedding cache.
+
+    Otherwise a vector cached by one test would hide another test's mocked client.
+    """
+    from src.infrastructure import embedding_cache
+
+    monkeypatch.setattr(
+        embedding_cache, "_cache", embedding_cache.EmbeddingCache(max_entries=1024)
+    )
+
+
 @pytest.fixture
 def sample_user() -> User:
     """Create a sample user for testing."""
@@ -40,7 +49,7 @@ async def temp_db(tmp_path: Path) -> AsyncGenerator[str, None]:
 
     Uses tmp_path so WAL, SHM, and lock files are all auto-cleaned.
     """
-    from src.infrastructure.db.connection import get_connection
+    from src.infrastructure.db.connection import close_pools, get_connection
     from src.infrastructure.db.schema import _db_initialized_paths
 
     db_path = str(tmp_path / "test.db")
@@ -51,6 +60,7 @@ async def temp_db(tmp_path: Path) -> AsyncGenerator[str, None]:
             pass  # Schema auto-initialized
         yield db_path
     finally:
+        await close_pools()
         _db_initialized_paths.discard(db_path)
         if old_db_path is not None:
             os.environ["INTERVIEW_DB_PATH"] = old_db_path
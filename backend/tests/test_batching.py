@@ -0,0 +1,128 @@
+"""Unit tests for the async micro-batcher."""
+
+import asyncio
+
+import pytest
+from src.shared.batching import MicroBatcher
+
+
+class _Recorder:
+    """Flush function that records batches and doubles every item."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.batches: list[list[int]] = []
+        self.error = error
+
+    async def __call__(self, items: list[int]) -> list[int]:
+        self.batches.append(items)
+        if self.error:
+            raise self.error
+        return [item * 2 for item in items]
+
+
+class TestMicroBatcher:
+    """Test size- and deadline-triggered flushes and result fan-out."""
+
+    async def test_concurrent_items_share_one_flush(self):
+        """Items submitted within the wait window go out as one batch, in order."""
+        flush = _Recorder()
+        batcher = MicroBatcher(flush, max_size=10, max_wait=0.01)
+
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(4)))
+
+        assert results == [0, 2, 4, 6]
+        assert flush.batches == [[0, 1, 2, 3]]
+        assert batcher.stats.mean_batch == 4
+
+    async def test_full_batch_flushes_without_waiting(self):
+        """Reaching max_size flushes immediately instead of at the deadline."""
+        flush = _Recorder()
+        batcher = MicroBatcher(flush, max_size=2, max_wait=60.0)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1.0
+        )
+
+        assert results == [0, 2, 4, 6]
+        assert flush.batches == [[0, 1], [2, 3]]
+
+    async def test_lone_item_flushes_after_max_wait(self):
+        """A single item is not held longer than max_wait."""
+        flush = _Recorder()
+        batcher = MicroBatcher(flush, max_size=10, max_wait=0.01)
+
+        assert await asyncio.wait_for(batcher.submit(5), timeout=1.0) == 10
+        assert batcher.stats.batches == 1
+
+    async def test_flush_error_reaches_every_caller(self):
+        """A failed batch call raises in all callers of that batch."""
+        batcher = MicroBatcher(
+            _Recorder(RuntimeError("api down")), max_size=10, max_wait=0.01
+        )
+
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_bad_item_only_fails_its_own_caller(self):
+        """A failed batch is split so the other items still get results."""
+
+        async def reject_three(items: list[int]) -> list[int]:
+            if 3 in items:
+                raise ValueError("too long")
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(reject_three, max_size=10, max_wait=0.01)
+
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(6)), return_exceptions=True
+        )
+
+        assert isinstance(results[3], ValueError)
+        assert [r for i, r in enumerate(results) if i != 3] == [0, 2, 4, 8, 10]
+        assert batcher.stats.splits > 0
+
+    async def test_transient_error_fails_batch_without_splitting(self):
+        """Errors outside split_on reach every caller after a single flush call."""
+        flush = _Recorder(TimeoutError("timed out"))
+        batcher = MicroBatcher(flush, max_size=10, max_wait=0.01)
+
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(4)), return_exceptions=True
+        )
+
+        assert all(isinstance(r, TimeoutError) for r in results)
+        assert flush.batches == [[0, 1, 2, 3]]
+        assert batcher.stats.splits == 0
+
+    async def test_split_on_selects_item_errors(self):
+        """Only the configured error types split a failed batch."""
+
+        async def reject_one(items: list[int]) -> list[int]:
+            if 1 in items:
+                raise KeyError(1)
+            return items
+
+        batcher = MicroBatcher(
+            reject_one, max_size=10, max_wait=0.01, split_on=(KeyError,)
+        )
+
+        results = await asyncio.gather(
+            batcher.submit(0), batcher.submit(1), return_exceptions=True
+        )
+
+        assert results[0] == 0
+        assert isinstance(results[1], KeyError)
+
+    async def test_result_count_mismatch_is_an_error(self):
+        """flush must return exactly one result per item."""
+
+        async def short(items: list[int]) -> list[int]:
+            return items[:1]
+
+        batcher = MicroBatcher(short, max_size=2, max_wait=0.01)
+
+        with pytest.raises(ValueError, match="1 results for 2 items"):
+            await asyncio.gather(batcher.submit(1), batcher.submit(2))
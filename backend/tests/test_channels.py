@@ -0,0 +1,229 @@
+"""Unit tests for bounded channels and admission control."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from src.domain import ClientMessage
+from src.processes.interview.interfaces import BUSY_RESPONSE, ChannelRequest
+from src.processes.transport import cli
+from src.runtime import BoundedChannel, ChannelFull, Channels, KeyedChannel
+from src.shared.ids import new_id
+
+
+def _request() -> ChannelRequest:
+    future = asyncio.get_running_loop().create_future()
+    return ChannelRequest(new_id(), new_id(), ClientMessage(data="hi"), future)
+
+
+class TestBoundedChannel:
+    """Test admission, shedding and gauges of BoundedChannel."""
+
+    async def test_rejects_when_full(self):
+        """A full channel raises ChannelFull and keeps its items."""
+        channel = BoundedChannel(2)
+        channel.admit("a")
+        channel.admit("b")
+
+        with pytest.raises(ChannelFull):
+            channel.admit("c")
+
+        assert [channel.get_nowait(), channel.get_nowait()] == ["a", "b"]
+        assert channel.stats().rejected == 1
+
+    async def test_shed_drops_oldest(self):
+        """With shed=True the oldest item makes room and is returned."""
+        channel = BoundedChannel(2)
+        channel.admit("a")
+        channel.admit("b")
+
+        assert channel.admit("c", shed=True) == "a"
+        assert [channel.get_nowait(), channel.get_nowait()] == ["b", "c"]
+        assert channel.stats().shed == 1
+
+    async def test_shed_item_does_not_block_join(self):
+        """Dropped items count as done, so join() still returns."""
+        channel = BoundedChannel(1)
+        channel.admit("a")
+        channel.admit("b", shed=True)
+        channel.get_nowait()
+        channel.task_done()
+
+        await asyncio.wait_for(channel.join(), timeout=1.0)
+
+    async def test_unbounded_by_default(self):
+        """maxsize=0 never rejects."""
+        channel = BoundedChannel()
+        for i in range(1000):
+            channel.admit(i)
+
+        assert channel.stats().depth == 1000
+
+    async def test_gauges_report_depth_and_oldest_age(self):
+        """stats() reports queue depth and how long the head has waited."""
+        channel = BoundedChannel(10)
+        with patch("src.runtime.queues.time.monotonic", return_value=100.0):
+            channel.admit("a")
+        with patch("src.runtime.queues.time.monotonic", return_value=101.0):
+            channel.admit("b")
+
+        with patch("src.runtime.queues.time.monotonic", return_value=105.0):
+            stats = channel.stats()
+
+        assert (stats.depth, stats.maxsize, stats.admitted) == (2, 10, 2)
+        assert stats.oldest_age == pytest.approx(5.0)
+        channel.get_nowait()
+        assert channel.stats().depth == 1
+
+
+class TestAdmissionPolicy:
+    """Test Channels.submit_request under both admission policies."""
+
+    async def test_reject_policy_raises(self):
+        """The new request is turned away."""
+        channels = Channels(requests=KeyedChannel(lambda r: r.user_id, 1))
+        channels.submit_request(_request())
+
+        with pytest.raises(ChannelFull):
+            channels.submit_request(_request())
+
+    async def test_shed_policy_answers_oldest_with_busy(self):
+        """The oldest request is dropped and answered with BUSY_RESPONSE."""
+        channels = Channels(requests=KeyedChannel(lambda r: r.user_id, 1))
+        oldest, newest = _request(), _request()
+        channels.submit_request(oldest)
+
+        with patch("src.runtime.channels.CHANNEL_ADMISSION_POLICY", "shed"):
+            channels.submit_request(newest)
+
+        assert oldest.response_future.result() == BUSY_RESPONSE
+        assert not newest.response_future.done()
+        assert channels.requests.get_nowait() is newest
+
+    async def test_cli_replies_busy_when_full(self):
+        """The CLI answers immediately instead of waiting on a full channel."""
+        channels = Channels(requests=KeyedChannel(lambda r: r.user_id, 1))
+        channels.submit_request(_request())
+
+        reply = await cli._send_request("hello", new_id(), channels)
+
+        assert reply == BUSY_RESPONSE
+
+
+def _keyed() -> KeyedChannel:
+    return KeyedChannel(lambda item: item[0])
+
+
+class _OrderRecorder:
+    """Worker body recording per-key processing order and overlaps."""
+
+    def __init__(self, channel: KeyedChannel) -> None:
+        self.channel = channel
+        self.running: set[str] = set()
+        self.processed: dict[str, list[int]] = {}
+        self.overlap: list[bool] = []
+
+    async def worker(self, delay: float) -> None:
+        while True:
+            item = await self.channel.get()
+            key, seq = item
+            self.overlap.append(key in self.running)
+            self.running.add(key)
+            await asyncio.sleep(delay)
+            self.processed.setdefault(key, []).append(seq)
+            self.running.discard(key)
+            self.channel.task_done(item)
+
+
+class TestKeyedChannel:
+    """Test per-key ordering and fairness of KeyedChannel."""
+
+    async def test_key_is_not_served_while_in_flight(self):
+        """A key's next item waits until its previous item is done."""
+        channel = _keyed()
+        channel.admit(("alice", 1))
+        channel.admit(("alice", 2))
+
+        first = await channel.get()
+        with pytest.raises(asyncio.QueueEmpty):
+            channel.get_nowait()
+        channel.task_done(first)
+
+        assert await channel.get() == ("alice", 2)
+
+    async def test_keys_are_served_round_robin(self):
+        """A chatty key takes turns with the others instead of draining first."""
+        channel = _keyed()
+        for i in range(3):
+            channel.admit(("alice", i))
+        channel.admit(("bob", 0))
+        channel.admit(("carol", 0))
+
+        served = []
+        while channel.qsize():
+            item = await channel.get()
+            served.append(item)
+            channel.task_done(item)
+
+        assert served == [
+            ("alice", 0),
+            ("bob", 0),
+            ("carol", 0),
+            ("alice", 1),
+            ("alice", 2),
+        ]
+
+    async def test_concurrent_workers_keep_per_key_order(self):
+        """Many workers run keys in parallel but each key strictly in order."""
+        channel = _keyed()
+        recorder = _OrderRecorder(channel)
+        for seq in range(10):
+            for key in ("alice", "bob", "carol"):
+                channel.admit((key, seq))
+
+        workers = [
+            asyncio.create_task(recorder.worker(0.001 * (i % 3))) for i in range(4)
+        ]
+        await asyncio.wait_for(channel.join(), timeout=5.0)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+        assert not any(recorder.overlap)
+        assert recorder.processed == {
+            key: list(range(10)) for key in ("alice", "bob", "carol")
+        }
+
+    async def test_cancelled_getter_does_not_lose_items(self):
+        """Cancelling a waiting get() leaves items for the next getter."""
+        channel = _keyed()
+        waiting = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+        channel.admit(("alice", 1))
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+        assert await asyncio.wait_for(channel.get(), timeout=1.0) == ("alice", 1)
+
+    async def test_shed_drops_oldest_across_keys(self):
+        """Shedding drops the globally oldest queued item."""
+        channel = KeyedChannel(lambda item: item[0], maxsize=2)
+        channel.admit(("alice", 1))
+        channel.admit(("bob", 1))
+
+        assert channel.admit(("carol", 1), shed=True) == ("alice", 1)
+        assert channel.stats().depth == 2
+        assert channel.get_nowait() == ("bob", 1)
+
+
+class TestReplyFuture:
+    """Test replies routed through ChannelRequest.response_future."""
+
+    async def test_reply_after_transport_gave_up_is_ignored(self):
+        """A worker replying to a cancelled request does not raise."""
+        request = _request()
+        request.response_future.cancel()
+
+        request.reply("late")
+
+        assert request.response_future.cancelled()
@@ -1,16 +1,25 @@
 """Unit tests for database connection and transaction handling."""
 
+import asyncio
+import fcntl
 import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
 from src.infrastructure.db import managers as db
 from src.infrastructure.db.connection import (
     _is_sqlite_busy_error,
+    _pools,
     execute_with_retry,
     get_connection,
+    get_lock_stats,
+    get_pool_stats,
     transaction,
 )
+from src.infrastructure.db.file_lock import file_lock
 from src.shared.ids import new_id
 
 
@@ -127,6 +136,202 @@ class TestGetConnection:
             assert row[0] == 30000
 
 
+class TestConnectionPool:
+    """Test pooled connection reuse, isolation and stats."""
+
+    async def test_writer_connection_is_reused(self, temp_db):
+        """Consecutive checkouts should reuse the same physical connection."""
+        async with get_connection() as first:
+            pass
+        async with get_connection() as second:
+            pass
+        assert first is second
+
+    async def test_stats_count_checkouts_without_reopening(self, temp_db):
+        """Repeated ORM reads should check out connections, not open new ones."""
+        before = get_pool_stats()
+        opened = before.opened
+        checkouts = before.checkouts
+        for _ in range(5):
+            await db.UsersManager.get_by_id(new_id())
+        stats = get_pool_stats()
+        assert stats.checkouts == checkouts + 5
+        assert stats.opened <= opened + 1
+        assert stats.in_use == 0
+
+    async def test_reader_connection_rejects_writes(self, temp_db):
+        """Reader connections are query_only."""
+        async with get_connection(read_only=True) as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute(
+                    "INSERT INTO users (id, name, mode) VALUES ('x', 'x', 'auto')"
+                )
+
+    async def test_uncommitted_writes_rolled_back_on_release(self, temp_db):
+        """Writes left uncommitted must not leak into the next checkout."""
+        user_id = new_id()
+        user = db.User(id=user_id, name="leak", mode="auto", current_area_id=None)
+        async with get_connection() as conn:
+            await db.UsersManager.create(user_id, user, conn=conn, auto_commit=False)
+        assert await db.UsersManager.get_by_id(user_id) is None
+
+    async def test_readers_see_committed_writes(self, temp_db):
+        """A reader checked out after a commit should see the new row."""
+        await db.UsersManager.get_by_id(new_id())  # warm a reader connection
+        user_id = new_id()
+        user = db.User(id=user_id, name="fresh", mode="auto", current_area_id=None)
+        await db.UsersManager.create(user_id, user)
+        assert await db.UsersManager.get_by_id(user_id) is not None
+
+    async def test_broken_writer_is_replaced(self, temp_db):
+        """A writer failing its health check should be closed and reopened."""
+        _pools[temp_db]._health_check_interval = 0.0
+        async with get_connection() as first:
+            pass
+        await first.close()
+        async with get_connection() as second:
+            cursor = await second.execute("SELECT 1")
+            assert (await cursor.fetchone())[0] == 1
+        assert second is not first
+        assert get_pool_stats().health_check_failures == 1
+
+
+class TestFileLockModes:
+    """Test reader file-lock behaviour selected by DB_LOCK_MODE."""
+
+    async def test_shared_mode_allows_concurrent_readers(self, temp_db, monkeypatch):
+        """Two readers should hold LOCK_SH at the same time."""
+        monkeypatch.setattr("src.infrastructure.db.connection.DB_LOCK_MODE", "shared")
+
+        async def nested_reads() -> None:
+            async with get_connection(read_only=True):
+                async with get_connection(read_only=True):
+                    pass
+
+        await asyncio.wait_for(nested_reads(), timeout=2.0)
+
+    async def test_shared_mode_writer_waits_for_readers(self, temp_db, monkeypatch):
+        """A writer must wait until the shared reader lock is released."""
+        monkeypatch.setattr("src.infrastructure.db.connection.DB_LOCK_MODE", "shared")
+        release = asyncio.Event()
+
+        async def hold_reader() -> None:
+            async with get_connection(read_only=True):
+                await release.wait()
+
+        async def write() -> None:
+            async with get_connection():
+                pass
+
+        reader = asyncio.create_task(hold_reader())
+        await asyncio.sleep(0.05)
+        writer = asyncio.create_task(write())
+        await asyncio.sleep(0.1)
+        assert not writer.done()
+        release.set()
+        await asyncio.wait_for(asyncio.gather(reader, writer), timeout=2.0)
+
+    async def test_none_mode_readers_skip_file_lock(self, temp_db, monkeypatch):
+        """Readers in 'none' mode should proceed while a writer holds LOCK_EX."""
+        monkeypatch.setattr("src.infrastructure.db.connection.DB_LOCK_MODE", "none")
+        async with get_connection():
+            read = db.UsersManager.get_by_id(new_id())
+            assert await asyncio.wait_for(read, timeout=2.0) is None
+
+    async def test_writer_not_starved_by_overlapping_readers(self, tmp_path):
+        """New readers must queue behind a waiting writer."""
+        lock_path = str(tmp_path / "db.lock")
+        stop = asyncio.Event()
+
+        async def read_forever(offset: float) -> None:
+            await asyncio.sleep(offset)
+            while not stop.is_set():
+                async with file_lock(lock_path, fcntl.LOCK_SH):
+                    await asyncio.sleep(0.02)
+
+        # Staggered readers keep LOCK_SH held continuously
+        readers = [asyncio.create_task(read_forever(i * 0.005)) for i in range(4)]
+        await asyncio.sleep(0.05)
+        start = time.monotonic()
+        try:
+            async with asyncio.timeout(2.0), file_lock(lock_path):
+                waited = time.monotonic() - start
+        finally:
+            stop.set()
+            await asyncio.gather(*readers)
+
+        assert waited < 0.5
+
+    async def test_nested_reader_does_not_wait_for_writer(self, tmp_path):
+        """A task already holding LOCK_SH must not queue behind a writer."""
+        lock_path = str(tmp_path / "db.lock")
+
+        async def write() -> None:
+            async with file_lock(lock_path):
+                pass
+
+        async with file_lock(lock_path, fcntl.LOCK_SH):
+            writer = asyncio.create_task(write())
+            await asyncio.sleep(0.05)
+            nested = file_lock(lock_path, fcntl.LOCK_SH)
+            await asyncio.wait_for(nested.__aenter__(), timeout=1.0)
+            await nested.__aexit__(None, None, None)
+            assert not writer.done()
+        await asyncio.wait_for(writer, timeout=2.0)
+
+    async def test_lock_file_is_kept_after_release(self, temp_db):
+        """Lock file must persist so all processes lock the same inode."""
+        async with get_connection():
+            pass
+        assert Path(f"{temp_db}.lock").exists()
+
+
+class TestFileLockWait:
+    """Test non-blocking file-lock acquisition and wait metrics."""
+
+    async def test_waiters_do_not_occupy_default_executor(self, temp_db):
+        """Blocked lock waiters must leave the default executor free."""
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+
+        async def write() -> None:
+            async with get_connection():
+                pass
+
+        async with get_connection():
+            waiters = [asyncio.create_task(write()) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            result = loop.run_in_executor(None, lambda: "free")
+            assert await asyncio.wait_for(result, timeout=1.0) == "free"
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=2.0)
+
+    async def test_uncontended_acquisition_records_no_wait(self, temp_db):
+        """An uncontended lock should be counted without polls."""
+        async with get_connection():
+            pass
+        stats = get_lock_stats()
+        assert stats.acquisitions >= 1
+        assert stats.contended == 0
+        assert stats.polls == 0
+
+    async def test_contended_acquisition_records_wait(self, temp_db):
+        """A waiter should record its polls and wait time once it acquires."""
+
+        async def write() -> None:
+            async with get_connection():
+                pass
+
+        async with get_connection():
+            waiter = asyncio.create_task(write())
+            await asyncio.sleep(0.05)
+        await asyncio.wait_for(waiter, timeout=2.0)
+        stats = get_lock_stats()
+        assert stats.contended == 1
+        assert stats.polls > 0
+        assert stats.max_wait >= 0.04
+        assert stats.mean_wait <= stats.max_wait
+
+
 class TestIsSqliteBusyError:
     """Test the _is_sqlite_busy_error helper function."""
 
@@ -0,0 +1,185 @@
+"""Unit tests for the content-hash keyed embedding cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from src.infrastructure import embedding_cache
+from src.infrastructure.db import managers as db
+from src.infrastructure.embedding_cache import EmbeddingCache, cache_key
+from src.infrastructure.embeddings import embed_text
+
+
+def _embedder(vector: list[float]) -> AsyncMock:
+    return AsyncMock(return_value=vector)
+
+
+class TestCacheKey:
+    """Test that keys separate model, dimensions and text."""
+
+    def test_key_depends_on_every_part(self):
+        """Changing model, dimensions or text yields a different key."""
+        base = cache_key("model", 1536, "text")
+        assert cache_key("model", 1536, "text") == base
+        assert cache_key("other", 1536, "text") != base
+        assert cache_key("model", 512, "text") != base
+        assert cache_key("model", 1536, "text!") != base
+
+
+class TestEmbeddingCache:
+    """Test the in-memory LRU and the optional SQLite layer."""
+
+    async def test_repeated_text_skips_embedding(self):
+        """A second lookup of the same key is served from memory."""
+        cache = EmbeddingCache(max_entries=4)
+        embed = _embedder([1.0, 2.0])
+
+        first = await cache.get_or_embed("k", embed)
+        second = await cache.get_or_embed("k", embed)
+
+        assert first == second == [1.0, 2.0]
+        embed.assert_awaited_once()
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    async def test_returned_vectors_are_copies(self):
+        """Mutating a returned vector must not corrupt the cached entry."""
+        cache = EmbeddingCache(max_entries=4)
+        vector = await cache.get_or_embed("k", _embedder([1.0]))
+        vector.append(2.0)
+
+        assert await cache.get_or_embed("k", _embedder([9.0])) == [1.0]
+
+    async def test_evicts_least_recently_used(self):
+        """Beyond max_entries the least recently used key is dropped."""
+        cache = EmbeddingCache(max_entries=2)
+        for key in ("a", "b"):
+            await cache.get_or_embed(key, _embedder([1.0]))
+        await cache.get_or_embed("a", _embedder([1.0]))  # refresh "a"
+        await cache.get_or_embed("c", _embedder([1.0]))
+
+        embed = _embedder([2.0])
+        await cache.get_or_embed("a", embed)
+        await cache.get_or_embed("b", embed)
+
+        assert embed.await_count == 1  # only "b" was evicted
+        assert cache.stats.evictions == 2
+        assert cache.stats.entries == 2
+
+    async def test_zero_size_disables_memory_layer(self):
+        """EMBEDDING_CACHE_SIZE=0 embeds every time."""
+        cache = EmbeddingCache(max_entries=0)
+        embed = _embedder([1.0])
+
+        await cache.get_or_embed("k", embed)
+        await cache.get_or_embed("k", embed)
+
+        assert embed.await_count == 2
+        assert cache.stats.entries == 0
+
+    async def test_sqlite_layer_survives_restart(self, temp_db):
+        """A fresh process with the SQLite backend reuses persisted vectors."""
+        await EmbeddingCache(max_entries=4, persistent=True).get_or_embed(
+            "k", _embedder([0.5, -1.0])
+        )
+        restarted = EmbeddingCache(max_entries=4, persistent=True)
+        embed = _embedder([9.0])
+
+        vector = await restarted.get_or_embed("k", embed)
+
+        assert vector == [0.5, -1.0]
+        embed.assert_not_awaited()
+        assert restarted.stats.persistent_hits == 1
+        assert await db.EmbeddingCacheManager.get_vector("missing") is None
+
+    async def test_concurrent_misses_embed_once(self):
+        """Concurrent lookups of one missing key share a single embed() call."""
+        cache = EmbeddingCache(max_entries=4)
+        release = asyncio.Event()
+
+        async def slow_embed():
+            await release.wait()
+            return [1.0]
+
+        embed = AsyncMock(side_effect=slow_embed)
+        lookups = [
+            asyncio.create_task(cache.get_or_embed("k", embed)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*lookups) == [[1.0]] * 5
+        embed.assert_awaited_once()
+        assert (cache.stats.misses, cache.stats.coalesced) == (1, 4)
+
+    async def test_failed_embed_is_not_cached(self):
+        """Waiters see the failure and the next lookup embeds again."""
+        cache = EmbeddingCache(max_entries=4)
+        failing = AsyncMock(side_effect=RuntimeError("rate limited"))
+
+        results = await asyncio.gather(
+            cache.get_or_embed("k", failing),
+            cache.get_or_embed("k", failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        failing.assert_awaited_once()
+        assert await cache.get_or_embed("k", _embedder([2.0])) == [2.0]
+
+
+class TestSqlitePrune:
+    """Test the TTL and row cap of the persistent layer."""
+
+    async def test_prune_drops_expired_then_oldest_rows(self, temp_db):
+        """Rows past the TTL go first, then the oldest beyond max_rows."""
+        for i, created_at in enumerate((10.0, 20.0, 30.0, 40.0)):
+            await db.EmbeddingCacheManager.put_vector(f"k{i}", [1.0], created_at)
+
+        deleted = await db.EmbeddingCacheManager.prune(2, min_created_at=15.0)
+
+        assert deleted == 2
+        assert await db.EmbeddingCacheManager.get_vector("k1") is None
+        assert await db.EmbeddingCacheManager.get_vector("k2") == [1.0]
+        assert await db.EmbeddingCacheManager.get_vector("k3") == [1.0]
+
+    async def test_first_insert_prunes_to_max_rows(self, temp_db):
+        """A process prunes on its first insert and every _PRUNE_EVERY after."""
+        for i in range(3):
+            await db.EmbeddingCacheManager.put_vector(f"old{i}", [1.0], 1.0 + i)
+        cache = EmbeddingCache(max_entries=4, persistent=True, max_rows=2)
+
+        await cache.get_or_embed("new", _embedder([0.5]))
+
+        assert cache.stats.pruned == 2
+        assert await db.EmbeddingCacheManager.get_vector("old2") == [1.0]
+        assert await db.EmbeddingCacheManager.get_vector("old0") is None
+
+    async def test_ttl_expires_rows_on_insert(self, temp_db):
+        """Rows older than ttl_seconds are dropped by the insert-time prune."""
+        await db.EmbeddingCacheManager.put_vector("stale", [1.0], 1.0)
+        cache = EmbeddingCache(max_entries=4, persistent=True, ttl_seconds=60.0)
+
+        await cache.get_or_embed("fresh", _embedder([0.5]))
+
+        assert await db.EmbeddingCacheManager.get_vector("stale") is None
+        assert await db.EmbeddingCacheManager.get_vector("fresh") == [0.5]
+
+
+class TestEmbedText:
+    """Test the embed_text entry point used by search and vectorization."""
+
+    async def test_identical_queries_call_api_once(self):
+        """Repeated identical texts reuse the cached vector."""
+        client = AsyncMock()
+        client.aembed_query.return_value = [0.1, 0.2]
+        with patch(
+            "src.infrastructure.embeddings.get_embedding_client", return_value=client
+        ):
+            await embed_text("what do I know about Python?")
+            vector = await embed_text("what do I know about Python?")
+            await embed_text("something else")
+
+        assert vector == [0.1, 0.2]
+        assert client.aembed_query.await_count == 2
+        stats = embedding_cache.get_embedding_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
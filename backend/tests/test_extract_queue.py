@@ -0,0 +1,179 @@
+"""Unit tests for the durable extract queue (extract_queue table)."""
+
+from unittest.mock import patch
+
+from src.infrastructure.db import managers as db
+from src.infrastructure.db.connection import close_pools
+from src.processes.extract import ExtractTask
+from src.processes.extract.queue import ExtractQueue
+from src.shared.ids import new_id
+from src.shared.timestamp import get_timestamp
+from src.workflows.subgraphs.knowledge_extraction.nodes import persist_extraction
+from src.workflows.subgraphs.knowledge_extraction.state import (
+    KnowledgeExtractionState,
+)
+
+
+async def _create_summary(text: str = "Knows Go") -> tuple:
+    area_id = new_id()
+    await db.LifeAreasManager.create(
+        area_id,
+        db.LifeArea(id=area_id, title="Skills", parent_id=None, user_id=new_id()),
+    )
+    summary_id = await db.SummariesManager.create_summary(
+        area_id=area_id, summary_text=text, created_at=get_timestamp()
+    )
+    return area_id, summary_id
+
+
+class TestClaimAck:
+    """Test claiming, leasing and acknowledging tasks."""
+
+    async def test_claim_returns_oldest_first_up_to_limit(self, temp_db):
+        """Claims are FIFO and respect the limit."""
+        queue = ExtractQueue()
+        ids = [new_id() for _ in range(3)]
+        for summary_id in ids:
+            await queue.put(ExtractTask(summary_id=summary_id))
+
+        tasks = await queue.claim("w1", 2)
+
+        assert [t.summary_id for t in tasks] == ids[:2]
+        assert all(t.attempts == 1 for t in tasks)
+
+    async def test_leased_task_is_not_claimed_twice(self, temp_db):
+        """A leased task is invisible to other workers until acked or expired."""
+        queue = ExtractQueue()
+        await queue.put(ExtractTask(summary_id=new_id()))
+
+        assert len(await queue.claim("w1", 5)) == 1
+        assert await queue.claim("w2", 5) == []
+
+    async def test_ack_removes_task(self, temp_db):
+        """Acked tasks leave the queue."""
+        queue = ExtractQueue()
+        await queue.put(ExtractTask(summary_id=new_id()))
+        tasks = await queue.claim("w1", 5)
+
+        await queue.ack("w1", tasks)
+
+        stats = await queue.stats()
+        assert (stats.pending, stats.leased, stats.dead) == (0, 0, 0)
+
+    async def test_put_is_idempotent(self, temp_db):
+        """Queueing a summary twice keeps one entry."""
+        queue = ExtractQueue()
+        summary_id = new_id()
+        await queue.put(ExtractTask(summary_id=summary_id))
+        await queue.put(ExtractTask(summary_id=summary_id))
+
+        assert (await queue.stats()).pending == 1
+
+    async def test_expired_lease_is_redelivered(self, temp_db):
+        """A task whose worker never acked is handed out again after the lease."""
+        queue = ExtractQueue()
+        await queue.put(ExtractTask(summary_id=new_id()))
+        with patch("src.processes.extract.queue.LEAF_EXTRACT_LEASE_TIMEOUT", -1.0):
+            await queue.claim("crashed", 5)
+
+        tasks = await queue.claim("w2", 5)
+
+        assert len(tasks) == 1
+        assert tasks[0].attempts == 2
+        # The stale owner can no longer ack the redelivered task
+        await queue.ack("crashed", tasks)
+        assert (await queue.stats()).leased == 1
+
+
+class TestRetries:
+    """Test retry backoff and dead-lettering."""
+
+    async def test_failed_task_waits_for_backoff(self, temp_db):
+        """A failed task becomes claimable only after its backoff."""
+        queue = ExtractQueue()
+        await queue.put(ExtractTask(summary_id=new_id()))
+        [task] = await queue.claim("w1", 5)
+
+        await queue.fail("w1", task, "boom")
+
+        assert await queue.claim("w1", 5) == []
+        assert (await queue.stats()).pending == 1
+
+    async def test_task_is_dead_lettered_after_max_retries(self, temp_db):
+        """After LEAF_EXTRACT_MAX_RETRIES retries the task moves to 'dead'."""
+        queue = ExtractQueue()
+        await queue.put(ExtractTask(summary_id=new_id()))
+        with (
+            patch("src.processes.extract.queue.LEAF_EXTRACT_RETRY_BACKOFF", 0.0),
+            patch("src.processes.extract.queue.LEAF_EXTRACT_MAX_RETRIES", 1),
+        ):
+            [task] = await queue.claim("w1", 5)
+            await queue.fail("w1", task, "boom")
+            [task] = await queue.claim("w1", 5)
+            await queue.fail("w1", task, "boom")
+
+            assert await queue.claim("w1", 5) == []
+
+        stats = await queue.stats()
+        assert (stats.pending, stats.leased, stats.dead) == (0, 0, 1)
+
+    async def test_repeatedly_expiring_lease_is_dead_lettered(self, temp_db):
+        """A task that keeps crashing its worker is dead-lettered on claim."""
+        queue = ExtractQueue()
+        await queue.put(ExtractTask(summary_id=new_id()))
+        with (
+            patch("src.processes.extract.queue.LEAF_EXTRACT_LEASE_TIMEOUT", -1.0),
+            patch("src.processes.extract.queue.LEAF_EXTRACT_MAX_RETRIES", 0),
+        ):
+            await queue.claim("crashed", 5)
+            assert await queue.claim("w2", 5) == []
+
+        assert (await queue.stats()).dead == 1
+
+
+class TestRecovery:
+    """Test the startup sweep and durability across restarts."""
+
+    async def test_recover_queues_summaries_without_vectors(self, temp_db):
+        """Summaries missing a vector are queued; embedded ones are not."""
+        _, pending_id = await _create_summary("Knows Go")
+        _, done_id = await _create_summary("Lives in Oslo")
+        await db.SummariesManager.update_vector(done_id, [0.1, 0.2])
+
+        queue = ExtractQueue()
+        assert await queue.recover() == 1
+
+        [task] = await queue.claim("w1", 5)
+        assert task.summary_id == pending_id
+
+    async def test_pending_tasks_survive_restart(self, temp_db):
+        """Tasks persist when the connection pools (the process) go away."""
+        summary_id = new_id()
+        await ExtractQueue().put(ExtractTask(summary_id=summary_id))
+        await close_pools()
+
+        [task] = await ExtractQueue().claim("w1", 5)
+
+        assert task.summary_id == summary_id
+
+
+class TestIdempotentPersist:
+    """Test that redelivered tasks do not duplicate knowledge."""
+
+    async def test_persisting_twice_replaces_knowledge(self, temp_db):
+        """A second persist of the same summary replaces its knowledge items."""
+        area_id, summary_id = await _create_summary()
+        state = KnowledgeExtractionState(
+            summary_id=summary_id,
+            area_id=area_id,
+            summary_vector=[0.1, 0.2],
+            extracted_knowledge=[
+                {"content": "Knows Go", "kind": "skill", "confidence": 0.9}
+            ],
+        )
+
+        await persist_extraction(state)
+        await persist_extraction(state)
+
+        knowledge = await db.UserKnowledgeManager.list()
+        assert [k.description for k in knowledge] == ["Knows Go"]
@@ -3,6 +3,7 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from src.infrastructure.db import managers as db
 from src.processes.extract import ExtractTask, run_extract_pool
 from src.runtime import Channels, run_worker_pool
@@ -17,7 +18,7 @@ from src.workflows.subgraphs.knowledge_extraction.knowledge_nodes import (
 class TestExtractWorker:
     """Test the extract worker functionality."""
 
-    async def test_worker_processes_task(self):
+    async def test_worker_processes_task(self, temp_db):
         """Should process a task from the extract queue."""
         channels = Channels()
         task = ExtractTask(summary_id=new_id())
@@ -45,8 +46,8 @@ class TestExtractWorker:
 
             mock_graph.ainvoke.assert_called_once()
 
-    async def test_worker_handles_exception(self):
-        """Should continue processing after an exception."""
+    async def test_worker_handles_exception(self, temp_db):
+        """Should continue processing after an exception and retry the task."""
         channels = Channels()
         task1 = ExtractTask(summary_id=new_id())
         task2 = ExtractTask(summary_id=new_id())
@@ -54,6 +55,8 @@ class TestExtractWorker:
         await channels.extract.put(task2)
 
         with (
+            patch("src.processes.extract.queue.LEAF_EXTRACT_RETRY_BACKOFF", 0.0),
+            patch("src.processes.extract.worker.LEAF_EXTRACT_POLL_INTERVAL", 0.01),
             patch("src.processes.extract.worker.LLMClientBuilder") as mock_ai,
             patch(
                 "src.processes.extract.worker.build_knowledge_extraction_graph"
@@ -62,7 +65,7 @@ class TestExtractWorker:
             mock_ai.return_value.build.return_value = MagicMock()
             mock_graph = MagicMock()
             mock_graph.ainvoke = AsyncMock(
-                side_effect=[Exception("First failed"), None]
+                side_effect=[Exception("First failed"), None, None]
             )
             mock_build.return_value = mock_graph
 
@@ -73,9 +76,10 @@ class TestExtractWorker:
             channels.shutdown.set()
             await asyncio.wait_for(pool, timeout=2.0)
 
-            assert mock_graph.ainvoke.call_count == 2
+            # Two tasks plus one retry of the failed task
+            assert mock_graph.ainvoke.call_count == 3
 
-    async def test_worker_invokes_with_correct_state(self):
+    async def test_worker_invokes_with_correct_state(self, temp_db):
         """Should invoke graph with KnowledgeExtractionState containing summary_id."""
         channels = Channels()
         summary_id = new_id()
@@ -141,7 +145,7 @@ def _create_extraction_mock_llm():
 async def _run_extract_pool_with_mocks(channels, mock_llm):
     """Run extract pool with mocked LLM and embeddings."""
     mock_embed_client = AsyncMock()
-    mock_embed_client.aembed_query.return_value = [0.1, 0.2, 0.3]
+    mock_embed_client.aembed_documents.return_value = [[0.1, 0.2, 0.3]]
 
     with (
         patch("src.processes.extract.worker.LLMClientBuilder") as mock_builder,
@@ -160,7 +164,7 @@ async def _run_extract_pool_with_mocks(channels, mock_llm):
 async def _verify_extraction_results(area_id, user_id, summary_id):
     """Verify extraction wrote vector, created knowledge with summary_id."""
     updated = await db.SummariesManager.get_by_id(summary_id)
-    assert updated.vector == [0.1, 0.2, 0.3]
+    assert updated.vector == pytest.approx([0.1, 0.2, 0.3])
 
     all_knowledge = await db.UserKnowledgeManager.list()
     assert len(all_knowledge) == 2
@@ -205,3 +209,105 @@ class TestWorkerPool:
         await asyncio.wait_for(pool, timeout=2.0)
 
         assert sorted(processed) == [0, 1, 2]
+
+
+class TestBatchedEmbeddings:
+    """Test that queued extract tasks share batched embedding calls."""
+
+    async def test_queued_summaries_share_one_embedding_call(self, temp_db):
+        """A burst of queued summaries is embedded with one aembed_documents call."""
+        user_id, area_id = new_id(), new_id()
+        await _create_summary_for_extraction(user_id, area_id)
+        summary_ids = [
+            await db.SummariesManager.create_summary(
+                area_id=area_id, summary_text=f"Fact {i}", created_at=get_timestamp()
+            )
+            for i in range(3)
+        ]
+        channels = Channels()
+        for summary_id in summary_ids:
+            await channels.extract.put(ExtractTask(summary_id=summary_id))
+
+        mock_embed_client = AsyncMock()
+        mock_embed_client.aembed_documents.side_effect = lambda texts: [
+            [float(len(text)), 1.0] for text in texts
+        ]
+        with (
+            patch("src.processes.extract.worker.WORKER_POOL_EXTRACT", 1),
+            patch("src.processes.extract.worker.LLMClientBuilder") as mock_builder,
+            patch(
+                "src.infrastructure.embeddings.get_embedding_client",
+                return_value=mock_embed_client,
+            ),
+        ):
+            mock_builder.return_value.build.return_value = _create_extraction_mock_llm()
+            pool = asyncio.create_task(run_extract_pool(channels))
+            await channels.extract.join()
+            channels.shutdown.set()
+            await asyncio.wait_for(pool, timeout=5.0)
+
+        mock_embed_client.aembed_documents.assert_awaited_once()
+        for summary_id in summary_ids:
+            summary = await db.SummariesManager.get_by_id(summary_id)
+            assert summary.vector == pytest.approx([float(len("Fact 0")), 1.0])
+
+    async def test_worker_claims_embedding_batch_size(self, temp_db):
+        """Single-mode workers claim EXTRACT_EMBED_BATCH_SIZE tasks at a time."""
+        channels = Channels()
+        for _ in range(3):
+            await channels.extract.put(ExtractTask(summary_id=new_id()))
+        claim = channels.extract.claim
+        limits = []
+
+        async def recording_claim(owner, limit):
+            limits.append(limit)
+            return await claim(owner, limit)
+
+        channels.extract.claim = recording_claim
+        with (
+            patch("src.processes.extract.worker.EXTRACT_EMBED_BATCH_SIZE", 2),
+            patch("src.processes.extract.worker.WORKER_POOL_EXTRACT", 1),
+            patch("src.processes.extract.worker.LLMClientBuilder"),
+            patch(
+                "src.processes.extract.worker.build_knowledge_extraction_graph"
+            ) as mock_build,
+        ):
+            mock_build.return_value.ainvoke = AsyncMock(return_value={})
+            pool = asyncio.create_task(run_extract_pool(channels))
+            await channels.extract.join()
+            channels.shutdown.set()
+            await asyncio.wait_for(pool, timeout=5.0)
+
+        assert limits[:2] == [2, 2]
+
+
+class TestBatchedExtractionMode:
+    """Test the worker loop in KNOWLEDGE_EXTRACTION_MODE=batched."""
+
+    async def test_queued_tasks_form_one_batch(self, temp_db):
+        """Tasks queued within the wait window reach the batch graph together."""
+        channels = Channels()
+        summary_ids = [new_id() for _ in range(3)]
+        for summary_id in summary_ids:
+            await channels.extract.put(ExtractTask(summary_id=summary_id))
+
+        with (
+            patch("src.processes.extract.worker.KNOWLEDGE_EXTRACTION_MODE", "batched"),
+            patch("src.processes.extract.worker.KNOWLEDGE_BATCH_MAX_WAIT", 0.01),
+            patch("src.processes.extract.worker.WORKER_POOL_EXTRACT", 1),
+            patch("src.processes.extract.worker.LLMClientBuilder"),
+            patch(
+                "src.processes.extract.worker.build_knowledge_batch_extraction_graph"
+            ) as mock_build,
+        ):
+            mock_graph = MagicMock()
+            mock_graph.ainvoke = AsyncMock()
+            mock_build.return_value = mock_graph
+
+            pool = asyncio.create_task(run_extract_pool(channels))
+            await channels.extract.join()
+            channels.shutdown.set()
+            await asyncio.wait_for(pool, timeout=2.0)
+
+        mock_graph.ainvoke.assert_awaited_once()
+        assert mock_graph.ainvoke.await_args.args[0].summary_ids == summary_ids
@@ -0,0 +1,192 @@
+"""Tests for multi-process graph workers (WORKER_PROCESSES_GRAPH > 0)."""
+
+import asyncio
+import logging
+import os
+import signal
+import uuid
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+from src.domain import ClientMessage
+from src.infrastructure.db import managers as db
+from src.processes.interview import ChannelRequest
+from src.processes.interview.processes import GraphProcess, run_graph_process_pool
+from src.runtime import Channels
+from src.shared.streaming import invoke_streaming
+
+
+class _EchoGraph:
+    """Replies with the child's pid and the message; "crash" kills the child."""
+
+    async def ainvoke(self, state):
+        if state.text == "crash":
+            os._exit(1)
+        if state.text == "sleep":
+            await asyncio.sleep(60)
+        reply = f"{os.getpid()}:{state.text}"
+        return {"messages": [SimpleNamespace(content=reply)]}
+
+
+def _echo_graph() -> _EchoGraph:
+    return _EchoGraph()
+
+
+class _WordsLLM:
+    async def astream(self, messages):
+        for word in ("one ", "two"):
+            yield AIMessageChunk(content=word)
+
+
+class _StreamingGraph:
+    """Streams its reply through invoke_streaming like the reply nodes do."""
+
+    async def ainvoke(self, state):
+        message = await invoke_streaming(_WordsLLM(), [])
+        return {"messages": [message]}
+
+
+def _streaming_graph() -> _StreamingGraph:
+    return _StreamingGraph()
+
+
+async def _create_user() -> uuid.UUID:
+    user_id = uuid.uuid4()
+    await db.UsersManager.create(
+        user_id, db.User(id=user_id, name="test", mode="auto", current_area_id=None)
+    )
+    return user_id
+
+
+def _request(user_id: uuid.UUID, text: str) -> ChannelRequest:
+    future = asyncio.get_running_loop().create_future()
+    return ChannelRequest(uuid.uuid4(), user_id, ClientMessage(data=text), future)
+
+
+def _submit(
+    channels: Channels, user_id: uuid.UUID, text: str, on_chunk=None
+) -> asyncio.Future:
+    future = asyncio.get_running_loop().create_future()
+    channels.submit_request(
+        ChannelRequest(
+            uuid.uuid4(), user_id, ClientMessage(data=text), future, on_chunk
+        )
+    )
+    return future
+
+
+async def _stop(channels: Channels, pool: asyncio.Task) -> None:
+    channels.shutdown.set()
+    await asyncio.wait_for(pool, timeout=15.0)
+
+
+class TestGraphProcesses:
+    """Test request routing to graph worker processes."""
+
+    async def test_users_stick_to_one_child_process(self, temp_db):
+        """Replies come from child processes, each user always from the same one."""
+        users = [await _create_user() for _ in range(4)]
+        channels = Channels()
+        with patch("src.processes.interview.processes.WORKER_PROCESSES_GRAPH", 2):
+            pool = asyncio.create_task(run_graph_process_pool(channels, _echo_graph))
+            futures = [
+                (user_id, _submit(channels, user_id, f"m{i}"))
+                for i in range(2)
+                for user_id in users
+            ]
+            replies = await asyncio.wait_for(
+                asyncio.gather(*(future for _, future in futures)), timeout=30.0
+            )
+            await _stop(channels, pool)
+
+        pids: dict[uuid.UUID, set[str]] = {}
+        for (user_id, _), reply in zip(futures, replies, strict=True):
+            pid, _, text = reply.partition(":")
+            assert text in {"m0", "m1"}
+            pids.setdefault(user_id, set()).add(pid)
+        assert all(len(user_pids) == 1 for user_pids in pids.values())
+        assert str(os.getpid()) not in set().union(*pids.values())
+
+    async def test_dead_child_fails_its_request_and_restarts(self, temp_db):
+        """A crashed child answers with an error and is replaced."""
+        user_id = await _create_user()
+        channels = Channels()
+        with patch("src.processes.interview.processes.WORKER_PROCESSES_GRAPH", 1):
+            pool = asyncio.create_task(run_graph_process_pool(channels, _echo_graph))
+            crashed = _submit(channels, user_id, "crash")
+            after = _submit(channels, user_id, "hello")
+            results = await asyncio.wait_for(
+                asyncio.gather(crashed, after), timeout=30.0
+            )
+            await _stop(channels, pool)
+
+        assert results[0] == "An error occurred"
+        assert results[1].endswith(":hello")
+
+    async def test_streamed_chunks_reach_the_parent(self, temp_db):
+        """Reply deltas from the child arrive at on_chunk before the reply."""
+        user_id = await _create_user()
+        channels = Channels()
+        chunks: list[str] = []
+        with patch("src.processes.interview.processes.WORKER_PROCESSES_GRAPH", 1):
+            pool = asyncio.create_task(
+                run_graph_process_pool(channels, _streaming_graph)
+            )
+            reply = await asyncio.wait_for(
+                _submit(channels, user_id, "hi", chunks.append), timeout=30.0
+            )
+            await _stop(channels, pool)
+
+        assert chunks == ["one ", "two"]
+        assert reply == "one two"
+
+    async def test_large_concurrent_messages_do_not_block(self, temp_db):
+        """Multi-megabyte requests and replies cross in both directions at once."""
+        users = [await _create_user() for _ in range(8)]
+        channels = Channels()
+        texts = [str(i) * (4 << 20) for i in range(len(users))]
+        with (
+            patch("src.processes.interview.processes.WORKER_PROCESSES_GRAPH", 1),
+            patch("src.processes.interview.processes.WORKER_POOL_GRAPH", 8),
+        ):
+            pool = asyncio.create_task(run_graph_process_pool(channels, _echo_graph))
+            futures = [
+                _submit(channels, user_id, text)
+                for user_id, text in zip(users, texts, strict=True)
+            ]
+            replies = await asyncio.wait_for(asyncio.gather(*futures), timeout=60.0)
+            await _stop(channels, pool)
+
+        assert [reply.partition(":")[2] for reply in replies] == texts
+
+
+class TestGraphProcess:
+    """Test the lifecycle of a single graph worker process."""
+
+    async def test_killed_child_is_reaped_and_restarted(self, temp_db, caplog):
+        """Killing a child mid-request fails that call, reaps it, and restarts."""
+        user_id = await _create_user()
+        process = GraphProcess(0, _echo_graph)
+        try:
+            await asyncio.wait_for(process.call(_request(user_id, "warm")), 30.0)
+            old = process._process
+            slow = asyncio.create_task(process.call(_request(user_id, "sleep")))
+            await asyncio.sleep(0.2)
+            with caplog.at_level(logging.ERROR):
+                os.kill(old.pid, signal.SIGKILL)
+                with pytest.raises(RuntimeError, match="exited"):
+                    await asyncio.wait_for(slow, timeout=15.0)
+                reply = await asyncio.wait_for(
+                    process.call(_request(user_id, "hello")), timeout=30.0
+                )
+        finally:
+            await process.stop()
+
+        assert old.exitcode == -signal.SIGKILL
+        assert process._process is not old
+        assert reply == f"{process._process.pid}:hello"
+        assert [r.exitcode for r in caplog.records if hasattr(r, "exitcode")] == [
+            -signal.SIGKILL
+        ]
@@ -10,6 +10,11 @@ from src.processes.interview import ChannelRequest, run_graph_pool
 from src.runtime import Channels
 
 
+def _request(user_id: uuid.UUID, text: str) -> ChannelRequest:
+    future = asyncio.get_running_loop().create_future()
+    return ChannelRequest(uuid.uuid4(), user_id, ClientMessage(data=text), future)
+
+
 async def _create_test_user(temp_db) -> uuid.UUID:
     """Create a test user in the database."""
     user_id = uuid.uuid4()
@@ -35,36 +40,29 @@ def _mock_graph_response(content: str):
 class TestGraphWorker:
     """Test the graph worker functionality."""
 
-    async def test_worker_processes_request_and_sends_response(self, temp_db):
-        """Should process a request and send response with matching correlation_id."""
+    async def test_worker_processes_request_and_replies(self, temp_db):
+        """Should process a request and set the reply on its future."""
         user_id = await _create_test_user(temp_db)
         channels = Channels()
-        corr_id = uuid.uuid4()
-        await channels.requests.put(
-            ChannelRequest(corr_id, user_id, ClientMessage(data="Hello"))
-        )
+        request = _request(user_id, "Hello")
+        await channels.requests.put(request)
 
         with patch("src.processes.interview.worker.get_graph") as mock_get:
             mock_get.return_value = _mock_graph_response("Response text")
             pool = asyncio.create_task(run_graph_pool(channels))
-            await channels.requests.join()
-            response = await asyncio.wait_for(channels.responses.get(), timeout=1.0)
+            response = await asyncio.wait_for(request.response_future, timeout=1.0)
             channels.shutdown.set()
             await asyncio.wait_for(pool, timeout=2.0)
 
-            assert response.correlation_id == corr_id
-            assert response.response_text == "Response text"
+            assert response == "Response text"
 
     async def test_worker_handles_multiple_requests(self, temp_db):
-        """Should process multiple requests and match responses by correlation_id."""
+        """Should process multiple requests and reply to each on its own future."""
         user_id = await _create_test_user(temp_db)
         channels = Channels()
-        corr_ids = [uuid.uuid4(), uuid.uuid4()]
-
-        for i, corr_id in enumerate(corr_ids):
-            await channels.requests.put(
-                ChannelRequest(corr_id, user_id, ClientMessage(data=f"Message {i}"))
-            )
+        requests = [_request(user_id, f"Message {i}") for i in range(2)]
+        for request in requests:
+            await channels.requests.put(request)
 
         with patch("src.processes.interview.worker.get_graph") as mock_get:
             counter = [0]
@@ -80,32 +78,73 @@ class TestGraphWorker:
             mock_get.return_value = MagicMock(ainvoke=mock_invoke)
             pool = asyncio.create_task(run_graph_pool(channels))
             await channels.requests.join()
-            responses = [await channels.responses.get() for _ in range(2)]
             channels.shutdown.set()
             await asyncio.wait_for(pool, timeout=2.0)
 
-            resp_by_id = {r.correlation_id: r for r in responses}
-            assert corr_ids[0] in resp_by_id
-            assert corr_ids[1] in resp_by_id
+            # One user's messages run in order
+            assert [r.response_future.result() for r in requests] == [
+                "Reply 0",
+                "Reply 1",
+            ]
 
     async def test_worker_handles_error_gracefully(self, temp_db):
         """Should send error response when processing fails."""
         user_id = await _create_test_user(temp_db)
         channels = Channels()
-        corr_id = uuid.uuid4()
-        await channels.requests.put(
-            ChannelRequest(corr_id, user_id, ClientMessage(data="fail"))
-        )
+        request = _request(user_id, "fail")
+        await channels.requests.put(request)
 
         with patch("src.processes.interview.worker.get_graph") as mock_get:
             mock_get.return_value = MagicMock(
                 ainvoke=AsyncMock(side_effect=Exception("Graph failed"))
             )
             pool = asyncio.create_task(run_graph_pool(channels))
+            response = await asyncio.wait_for(request.response_future, timeout=1.0)
+            channels.shutdown.set()
+            await asyncio.wait_for(pool, timeout=2.0)
+
+            assert response == "An error occurred"
+
+
+class TestPerUserOrdering:
+    """Test that graph workers serialize each user's messages."""
+
+    async def test_same_user_messages_run_in_order(self, temp_db):
+        """Two workers never process one user's messages concurrently."""
+        user_id = await _create_test_user(temp_db)
+        other_id = await _create_test_user(temp_db)
+        channels = Channels()
+        events = []
+
+        async def mock_invoke(state):
+            events.append(("start", state.user.id, state.text))
+            await asyncio.sleep(0.02)
+            events.append(("end", state.user.id, state.text))
+            return {"messages": [MagicMock(content="ok")]}
+
+        for text in ("first", "second"):
+            await channels.requests.put(_request(user_id, text))
+        await channels.requests.put(_request(other_id, "other"))
+
+        with (
+            patch("src.processes.interview.worker.WORKER_POOL_GRAPH", 2),
+            patch("src.processes.interview.worker.get_graph") as mock_get,
+        ):
+            mock_get.return_value = MagicMock(ainvoke=mock_invoke)
+            pool = asyncio.create_task(run_graph_pool(channels))
             await channels.requests.join()
-            response = await asyncio.wait_for(channels.responses.get(), timeout=1.0)
             channels.shutdown.set()
             await asyncio.wait_for(pool, timeout=2.0)
 
-            assert response.correlation_id == corr_id
-            assert response.response_text == "An error occurred"
+        user_events = [(kind, text) for kind, uid, text in events if uid == user_id]
+        assert user_events == [
+            ("start", "first"),
+            ("end", "first"),
+            ("start", "second"),
+            ("end", "second"),
+        ]
+        # The other user ran alongside the first user's first message
+        assert set(events[:2]) == {
+            ("start", user_id, "first"),
+            ("start", other_id, "other"),
+        }
@@ -0,0 +1,79 @@
+"""Unit tests for the shared HTTP connection pool."""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from src.infrastructure import embeddings, http_clients
+from src.infrastructure.ai import LLMClientBuilder
+
+_RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+
+
+@pytest_asyncio.fixture
+async def fresh_pool(monkeypatch):
+    """Start each test without a shared client and close it afterwards."""
+    monkeypatch.setattr(http_clients, "_client", None)
+    monkeypatch.setattr(http_clients, "_transport", None)
+    monkeypatch.setattr(http_clients, "_stats", http_clients.HttpPoolStats())
+    yield
+    await http_clients.close_http_clients()
+
+
+@pytest_asyncio.fixture
+async def keepalive_server():
+    """Minimal HTTP/1.1 server that keeps connections open; yields its URL."""
+    connections = []
+
+    async def handle(reader, writer):
+        connections.append(writer)
+        while await reader.readuntil(b"\r\n\r\n"):
+            writer.write(_RESPONSE)
+            await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}/", connections
+    server.close()
+
+
+@pytest.mark.usefixtures("fresh_pool")
+class TestSharedHttpClient:
+    """Test that all clients share one pool and that stats reflect its use."""
+
+    def test_llm_and_embedding_clients_share_pool(self, monkeypatch):
+        """Chat and embedding clients are built on the same httpx client."""
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-v1-" + "x" * 40)
+        embeddings.get_embedding_client.cache_clear()
+        try:
+            shared = http_clients.get_async_http_client()
+            llm = LLMClientBuilder("model", api_key="sk-or-v1-test").build()
+            embedder = embeddings.get_embedding_client()
+
+            assert llm.http_async_client is shared
+            assert embedder.http_async_client is shared
+            assert embeddings.get_embedding_client() is embedder
+        finally:
+            embeddings.get_embedding_client.cache_clear()
+
+    async def test_connections_are_reused(self, keepalive_server):
+        """Sequential requests reuse one keep-alive connection."""
+        url, server_connections = keepalive_server
+        client = http_clients.get_async_http_client()
+
+        for _ in range(3):
+            assert (await client.get(url)).text == "ok"
+
+        stats = http_clients.get_http_pool_stats()
+        assert stats.requests == 3
+        assert (stats.connections, stats.idle_connections) == (1, 1)
+        assert len(server_connections) == 1
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        """HTTP_HTTP2=on without the h2 package degrades to HTTP/1.1."""
+        monkeypatch.setattr(http_clients, "HTTP_HTTP2", "on")
+        monkeypatch.setattr(http_clients.importlib.util, "find_spec", lambda _: None)
+
+        http_clients.get_async_http_client()
+
+        assert http_clients.get_http_pool_stats().http2 is False
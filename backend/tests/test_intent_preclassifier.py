@@ -0,0 +1,181 @@
+"""Tests for the local intent pre-classifier in front of extract_target."""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import HumanMessage
+from src.domain import InputMode, User
+from src.processes.interview import Target
+from src.shared.ids import new_id
+from src.workflows.nodes.input import intent_preclassifier
+from src.workflows.nodes.input.extract_target import (
+    ExtractTargetState,
+    extract_target,
+)
+from src.workflows.nodes.input.intent_preclassifier import (
+    IntentRouterStats,
+    match_examples,
+    match_rules,
+)
+
+# The package re-exports the extract_target node under the module's name
+extract_module = sys.modules["src.workflows.nodes.input.extract_target"]
+
+
+class _ClassifierLLM:
+    """Structured-output LLM that always answers target."""
+
+    def __init__(self, target: Target) -> None:
+        self.target = target
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        async def ainvoke(messages):
+            self.calls += 1
+            return schema(target=self.target)
+
+        return SimpleNamespace(ainvoke=ainvoke)
+
+
+@pytest.fixture
+def stats(monkeypatch) -> IntentRouterStats:
+    fresh = IntentRouterStats()
+    monkeypatch.setattr(intent_preclassifier, "_stats", fresh)
+    return fresh
+
+
+async def _route(text: str, llm: _ClassifierLLM) -> Target:
+    state = ExtractTargetState(
+        user=User(id=new_id(), mode=InputMode.auto),
+        messages=[HumanMessage(content=text)],
+        target=None,
+    )
+    return (await extract_target(state, llm))["target"]
+
+
+class TestMatchRules:
+    """Test rule-based pre-classification."""
+
+    @pytest.mark.parametrize(
+        ("text", "target"),
+        [
+            ("Hello!", Target.small_talk),
+            ("What can you do?", Target.small_talk),
+            ("Привет", Target.small_talk),
+            ("Create area for Career", Target.manage_areas),
+            ("Add sub-area Python under Skills", Target.manage_areas),
+            ("what are my areas", Target.manage_areas),
+            ("Создай область Карьера", Target.manage_areas),
+            ("Delete the travel area", Target.manage_areas),
+            ("Покажи мои темы", Target.manage_areas),
+            ("I have 5 years experience in Python", Target.conduct_interview),
+            ("My goal is to become a tech lead", Target.conduct_interview),
+        ],
+    )
+    def test_unambiguous_messages(self, text, target):
+        assert match_rules(text) == target
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "I want to create an area for fitness",
+            "I don't understand what you do",
+            "Which topics can we create?",
+            "I like it",
+            "Tell me about it",
+        ],
+    )
+    def test_ambiguous_messages_left_to_llm(self, text):
+        assert match_rules(text) is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Make sure to note that my main area of expertise is backend",
+            "Add to that: the topic I care about most is distributed systems",
+            "Добавлю, что я работал над тем проектом два года",
+        ],
+    )
+    def test_answers_starting_with_a_command_verb_are_not_area_commands(self, text):
+        assert match_rules(text) != Target.manage_areas
+
+
+class TestMatchExamples:
+    """Test embedding similarity against labelled examples."""
+
+    @pytest.fixture(autouse=True)
+    def fake_embeddings(self, monkeypatch):
+        """Embed area examples along x, the rest along y; queries by keyword."""
+        area_examples = set(intent_preclassifier.LABELLED_EXAMPLES[Target.manage_areas])
+
+        async def embed_text(text: str) -> list[float]:
+            if text in area_examples or "area" in text:
+                return [1.0, 0.0]
+            if "between" in text:
+                return [1.0, 1.0]
+            return [0.0, 1.0]
+
+        monkeypatch.setattr(intent_preclassifier, "_example_vectors", None)
+        monkeypatch.setattr("src.infrastructure.embeddings.embed_text", embed_text)
+
+    async def test_confident_match(self):
+        assert await match_examples("set up an area") == Target.manage_areas
+
+    async def test_tied_targets_return_none(self):
+        assert await match_examples("somewhere in between") is None
+
+
+class TestExtractTargetRouting:
+    """Test extract_target with the pre-classifier in front of the LLM."""
+
+    async def test_rule_hit_skips_llm(self, stats):
+        llm = _ClassifierLLM(Target.conduct_interview)
+
+        assert await _route("Hello!", llm) == Target.small_talk
+        assert llm.calls == 0
+        assert stats.rule_hits == {"small_talk": 1}
+
+    async def test_ambiguous_message_falls_back_to_llm(self, stats):
+        llm = _ClassifierLLM(Target.manage_areas)
+
+        assert await _route("Tell me about it", llm) == Target.manage_areas
+        assert llm.calls == 1
+        assert stats.llm_routes == {"manage_areas": 1}
+        assert stats.llm_seconds > 0
+
+    async def test_off_mode_always_calls_llm(self, stats, monkeypatch):
+        monkeypatch.setattr(extract_module, "INTENT_PRECLASSIFIER", "off")
+        llm = _ClassifierLLM(Target.conduct_interview)
+
+        assert await _route("Hello!", llm) == Target.conduct_interview
+        assert llm.calls == 1
+        assert not stats.rule_hits
+
+    async def test_similarity_failure_falls_back_to_llm(self, stats, monkeypatch):
+        async def failing(text):
+            raise RuntimeError("embeddings unavailable")
+
+        monkeypatch.setattr(extract_module, "INTENT_PRECLASSIFIER", "embeddings")
+        monkeypatch.setattr(extract_module, "match_examples", failing)
+        llm = _ClassifierLLM(Target.small_talk)
+
+        assert await _route("Tell me about it", llm) == Target.small_talk
+        assert llm.calls == 1
+
+
+class TestIntentRouterStats:
+    """Test hit rates and saved time estimates."""
+
+    def test_hit_rates_and_saved_seconds(self):
+        stats = IntentRouterStats()
+        stats.record_local(Target.small_talk, "rules")
+        stats.record_local(Target.small_talk, "embeddings")
+        stats.record_llm(Target.small_talk, 0.4)
+        stats.record_llm(Target.manage_areas, 0.2)
+
+        rates = stats.hit_rates()
+        assert rates["small_talk"] == pytest.approx(2 / 3)
+        assert rates["manage_areas"] == 0.0
+        assert rates["conduct_interview"] == 0.0
+        assert stats.saved_seconds == pytest.approx(0.6)
@@ -2,7 +2,9 @@
 
 import uuid
 
+import pytest
 from src.infrastructure.db import managers as db
+from src.infrastructure.db.connection import get_connection
 from src.shared.ids import new_id
 from src.shared.timestamp import get_timestamp
 
@@ -85,7 +87,25 @@ class TestSummariesManager:
         await db.SummariesManager.update_vector(summary_id, vector)
 
         result = await db.SummariesManager.get_by_id(summary_id)
-        assert result.vector == vector
+        assert result.vector == pytest.approx(vector)
+
+    async def test_update_vector_stores_packed_blob(self, temp_db):
+        """Vector should be stored as float32 bytes with dim and norm metadata."""
+        summary_id = await db.SummariesManager.create_summary(
+            area_id=new_id(), summary_text="Summary text.", created_at=get_timestamp()
+        )
+        await db.SummariesManager.update_vector(summary_id, [3.0, 4.0])
+
+        async with get_connection(read_only=True) as conn:
+            cursor = await conn.execute(
+                "SELECT vector, vector_dim, vector_norm FROM summaries WHERE id = ?",
+                (str(summary_id),),
+            )
+            row = await cursor.fetchone()
+        assert isinstance(row["vector"], bytes)
+        assert len(row["vector"]) == 8
+        assert row["vector_dim"] == 2
+        assert row["vector_norm"] == pytest.approx(5.0)
 
     async def test_delete_by_area(self, temp_db):
         """Should delete all summaries for an area."""
@@ -196,7 +216,7 @@ class TestSummariesManager:
         assert len(results) == 1
         result_id, result_vec = results[0]
         assert result_id == str(id1)
-        assert result_vec == vec
+        assert list(result_vec) == pytest.approx(vec)
 
 
 class TestLeafHistoryManager:
@@ -0,0 +1,43 @@
+"""Unit tests for the IVF-flat approximate nearest-neighbour index."""
+
+import numpy as np
+from src.shared.ivf import IvfFlatIndex, default_nlist, train_centroids
+from src.shared.similarity import normalize_rows
+
+
+def _clustered(count: int, clusters: int, dims: int = 16) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    centres = rng.normal(size=(clusters, dims)) * 5
+    labels = np.arange(count) % clusters
+    return normalize_rows(centres[labels] + rng.normal(size=(count, dims)))
+
+
+class TestIvfFlatIndex:
+    """Tests for centroid training and list probing."""
+
+    def test_default_nlist_is_sqrt(self):
+        """nlist should grow with the square root of the corpus size."""
+        assert default_nlist(10_000) == 100
+        assert default_nlist(0) == 1
+
+    def test_centroids_are_unit_length(self):
+        """Trained centroids should be normalized float32 rows."""
+        centroids = train_centroids(_clustered(200, 4), nlist=4)
+        assert centroids.dtype == np.float32
+        assert np.allclose(np.linalg.norm(centroids, axis=1), 1.0, atol=1e-5)
+
+    def test_candidates_contain_nearest_row(self):
+        """Probing one list should find the query's own row on clustered data."""
+        rows = _clustered(400, 8)
+        ann = IvfFlatIndex(train_centroids(rows, nlist=8), trained_on=400)
+        ann.add(rows)
+        for row_index in (0, 57, 399):
+            assert row_index in ann.candidates(rows[row_index], nprobe=1)
+
+    def test_probing_all_lists_returns_every_row(self):
+        """nprobe >= nlist degrades to exhaustive search."""
+        rows = _clustered(50, 3)
+        ann = IvfFlatIndex(train_centroids(rows, nlist=3), trained_on=50)
+        ann.add(rows[:30])
+        ann.add(rows[30:])
+        assert ann.candidates(rows[0], nprobe=10).tolist() == list(range(50))
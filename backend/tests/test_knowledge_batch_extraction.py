@@ -0,0 +1,152 @@
+"""Unit tests for batched knowledge extraction (KNOWLEDGE_EXTRACTION_MODE=batched)."""
+
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from src.infrastructure.db import managers as db
+from src.shared.ids import new_id
+from src.shared.timestamp import get_timestamp
+from src.workflows.subgraphs.knowledge_extraction.graph import (
+    build_knowledge_batch_extraction_graph,
+)
+from src.workflows.subgraphs.knowledge_extraction.knowledge_nodes import (
+    BatchKnowledgeExtractionResult,
+    KnowledgeItem,
+    SummaryKnowledge,
+    extract_knowledge_batch,
+)
+from src.workflows.subgraphs.knowledge_extraction.state import (
+    BatchSummary,
+    KnowledgeBatchState,
+)
+
+
+def _item(content: str) -> KnowledgeItem:
+    return KnowledgeItem(content=content, kind="fact", confidence=0.9)
+
+
+def _echo_llm() -> MagicMock:
+    """LLM mock returning one item per input summary, named after its text."""
+
+    async def respond(messages):
+        payload = json.loads(messages[1]["content"])
+        return BatchKnowledgeExtractionResult(
+            summaries=[
+                SummaryKnowledge(summary_id=s["id"], items=[_item(s["summary"])])
+                for s in payload["summaries"]
+            ]
+            + [SummaryKnowledge(summary_id="unknown", items=[_item("ignored")])]
+        )
+
+    structured = AsyncMock()
+    structured.ainvoke.side_effect = respond
+    llm = MagicMock()
+    llm.with_structured_output.return_value = structured
+    return llm
+
+
+def _summary(user_id: uuid.UUID | None, text: str) -> BatchSummary:
+    return BatchSummary(
+        summary_id=new_id(), area_id=new_id(), user_id=user_id, summary_text=text
+    )
+
+
+class TestExtractKnowledgeBatch:
+    """Test grouping by user and mapping results back to summaries."""
+
+    async def test_one_call_per_user(self):
+        """Summaries of the same user share a call; users are never mixed."""
+        alice, bob = new_id(), new_id()
+        summaries = [_summary(alice, "a1"), _summary(bob, "b1"), _summary(alice, "a2")]
+        llm = _echo_llm()
+
+        result = await extract_knowledge_batch(
+            KnowledgeBatchState(summary_ids=[], summaries=summaries), llm
+        )
+
+        structured = llm.with_structured_output.return_value
+        assert structured.ainvoke.await_count == 2
+        prompts = [
+            json.loads(call.args[0][1]["content"])
+            for call in structured.ainvoke.await_args_list
+        ]
+        assert sorted(len(p["summaries"]) for p in prompts) == [1, 2]
+        contents = [s.extracted_knowledge[0]["content"] for s in result["summaries"]]
+        assert contents == ["a1", "b1", "a2"]
+
+    async def test_failed_group_does_not_affect_others(self):
+        """An LLM error for one user leaves the other user's items intact."""
+        alice, bob = new_id(), new_id()
+        summaries = [_summary(alice, "alice fact"), _summary(bob, "bob fact")]
+        llm = _echo_llm()
+        structured = llm.with_structured_output.return_value
+        respond = structured.ainvoke.side_effect
+
+        async def fail_for_bob(messages):
+            # Not a hex substring, so it cannot match inside a summary id
+            if "bob fact" in messages[1]["content"]:
+                raise RuntimeError("LLM down")
+            return await respond(messages)
+
+        structured.ainvoke.side_effect = fail_for_bob
+
+        result = await extract_knowledge_batch(
+            KnowledgeBatchState(summary_ids=[], summaries=summaries), llm
+        )
+
+        assert len(result["summaries"][0].extracted_knowledge) == 1
+        assert result["summaries"][1].extracted_knowledge == []
+
+    async def test_skips_summaries_without_owner_or_text(self):
+        """Orphaned or empty summaries are not sent to the LLM."""
+        llm = _echo_llm()
+        summaries = [_summary(None, "orphan"), _summary(new_id(), "")]
+
+        result = await extract_knowledge_batch(
+            KnowledgeBatchState(summary_ids=[], summaries=summaries), llm
+        )
+
+        llm.with_structured_output.return_value.ainvoke.assert_not_awaited()
+        assert all(s.extracted_knowledge == [] for s in result["summaries"])
+
+
+class TestBatchGraphIntegration:
+    """Integration test for the batched graph against a real database."""
+
+    async def test_batch_persists_vectors_and_knowledge(self, temp_db):
+        """Two summaries are embedded, extracted with one call and persisted."""
+        user_id, area_id = new_id(), new_id()
+        await db.LifeAreasManager.create(
+            area_id,
+            db.LifeArea(id=area_id, title="Skills", parent_id=None, user_id=user_id),
+        )
+        summary_ids = [
+            await db.SummariesManager.create_summary(
+                area_id=area_id, summary_text=text, created_at=get_timestamp()
+            )
+            for text in ("Knows Go", "Lives in Oslo")
+        ]
+        embed_client = AsyncMock()
+        embed_client.aembed_documents.side_effect = lambda texts: [
+            [float(len(t)), 1.0] for t in texts
+        ]
+        llm = _echo_llm()
+
+        with patch(
+            "src.infrastructure.embeddings.get_embedding_client",
+            return_value=embed_client,
+        ):
+            graph = build_knowledge_batch_extraction_graph(llm)
+            await graph.ainvoke(
+                KnowledgeBatchState(summary_ids=summary_ids + [new_id()])
+            )
+
+        assert llm.with_structured_output.return_value.ainvoke.await_count == 1
+        embed_client.aembed_documents.assert_awaited_once()
+        for summary_id, text in zip(summary_ids, ("Knows Go", "Lives in Oslo")):
+            summary = await db.SummariesManager.get_by_id(summary_id)
+            assert summary.vector == pytest.approx([float(len(text)), 1.0])
+        knowledge = await db.UserKnowledgeManager.list()
+        assert sorted(k.description for k in knowledge) == ["Knows Go", "Lives in Oslo"]
@@ -1,5 +1,6 @@
 """Unit tests for knowledge_extraction workflow."""
 
+import asyncio
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -70,7 +71,7 @@ class TestVectorizeSummary:
         )
 
         mock_embed_client = AsyncMock()
-        mock_embed_client.aembed_query.return_value = [0.1, 0.2, 0.3]
+        mock_embed_client.aembed_documents.return_value = [[0.1, 0.2, 0.3]]
 
         with patch(
             "src.infrastructure.embeddings.get_embedding_client",
@@ -79,7 +80,7 @@ class TestVectorizeSummary:
             result = await vectorize_summary(state)
 
         assert result == {"summary_vector": [0.1, 0.2, 0.3]}
-        mock_embed_client.aembed_query.assert_called_once_with("I know Python.")
+        mock_embed_client.aembed_documents.assert_called_once_with(["I know Python."])
 
     async def test_vectorize_summary_embedding_failure(self):
         """Should return empty dict when embedding fails."""
@@ -90,7 +91,7 @@ class TestVectorizeSummary:
         )
 
         mock_embed_client = AsyncMock()
-        mock_embed_client.aembed_query.side_effect = Exception("Embedding error")
+        mock_embed_client.aembed_documents.side_effect = Exception("Embedding error")
 
         with patch(
             "src.infrastructure.embeddings.get_embedding_client",
@@ -197,7 +198,7 @@ class TestPersistExtraction:
         assert result == {}
 
         updated = await db.SummariesManager.get_by_id(summary_id)
-        assert updated.vector == [0.1, 0.2, 0.3]
+        assert updated.vector == pytest.approx([0.1, 0.2, 0.3])
 
         all_knowledge = await db.UserKnowledgeManager.list()
         assert len(all_knowledge) == 2
@@ -294,6 +295,24 @@ def _create_knowledge_mock_llm():
     return mock_llm
 
 
+class _OverlapRecorder:
+    """Fake async calls recording which calls had started while each ran."""
+
+    def __init__(self) -> None:
+        self.started: set[str] = set()
+        self.seen: dict[str, set[str]] = {}
+
+    def fake(self, name: str, result):
+        async def call(*args, **kwargs):
+            self.started.add(name)
+            # Longer than the embedding micro-batch wait
+            await asyncio.sleep(0.2)
+            self.seen[name] = set(self.started)
+            return result
+
+        return call
+
+
 class TestKnowledgeExtractionGraphIntegration:
     """Integration tests for the full knowledge_extraction graph."""
 
@@ -318,7 +337,7 @@ class TestKnowledgeExtractionGraphIntegration:
         )
 
         mock_embed_client = AsyncMock()
-        mock_embed_client.aembed_query.return_value = [0.1, 0.2, 0.3]
+        mock_embed_client.aembed_documents.return_value = [[0.1, 0.2, 0.3]]
 
         with patch(
             "src.infrastructure.embeddings.get_embedding_client",
@@ -328,7 +347,7 @@ class TestKnowledgeExtractionGraphIntegration:
             await graph.ainvoke(KnowledgeExtractionState(summary_id=summary_id))
 
         updated = await db.SummariesManager.get_by_id(summary_id)
-        assert updated.vector == [0.1, 0.2, 0.3]
+        assert updated.vector == pytest.approx([0.1, 0.2, 0.3])
 
         all_knowledge = await db.UserKnowledgeManager.list()
         assert len(all_knowledge) == 3
@@ -353,7 +372,9 @@ class TestKnowledgeExtractionGraphIntegration:
         )
 
         mock_embed_client = AsyncMock()
-        mock_embed_client.aembed_query.side_effect = Exception("Embedding service down")
+        mock_embed_client.aembed_documents.side_effect = Exception(
+            "Embedding service down"
+        )
 
         with patch(
             "src.infrastructure.embeddings.get_embedding_client",
@@ -369,6 +390,44 @@ class TestKnowledgeExtractionGraphIntegration:
         all_knowledge = await db.UserKnowledgeManager.list()
         assert len(all_knowledge) == 3
 
+    async def test_graph_embeds_and_extracts_concurrently(self, temp_db):
+        """vectorize_summary and extract_knowledge overlap; persist sees both."""
+        from src.workflows.subgraphs.knowledge_extraction.graph import (
+            build_knowledge_extraction_graph,
+        )
+
+        area_id = uuid.uuid4()
+        await db.LifeAreasManager.create(
+            area_id,
+            db.LifeArea(id=area_id, title="Skills", parent_id=None, user_id=new_id()),
+        )
+        summary_id = await db.SummariesManager.create_summary(
+            area_id=area_id, summary_text="Knows Python", created_at=get_timestamp()
+        )
+        calls = _OverlapRecorder()
+        llm = _create_knowledge_mock_llm()
+        structured = llm.with_structured_output.return_value
+        structured.ainvoke.side_effect = calls.fake(
+            "extract", structured.ainvoke.return_value
+        )
+        embed_client = AsyncMock()
+        embed_client.aembed_documents.side_effect = calls.fake("embed", [[0.1, 0.2]])
+
+        with patch(
+            "src.infrastructure.embeddings.get_embedding_client",
+            return_value=embed_client,
+        ):
+            graph = build_knowledge_extraction_graph(llm=llm)
+            await graph.ainvoke(KnowledgeExtractionState(summary_id=summary_id))
+
+        assert calls.seen == {
+            "embed": {"embed", "extract"},
+            "extract": {"embed", "extract"},
+        }
+        updated = await db.SummariesManager.get_by_id(summary_id)
+        assert updated.vector == pytest.approx([0.1, 0.2])
+        assert len(await db.UserKnowledgeManager.list()) == 3
+
     async def test_graph_skips_when_summary_not_found(self, temp_db):
         """Test that graph exits early when summary_id is not in DB."""
         from src.workflows.subgraphs.knowledge_extraction.graph import (
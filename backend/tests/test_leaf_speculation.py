@@ -0,0 +1,122 @@
+"""Tests for speculative leaf turns (LEAF_SPECULATIVE_RESPONSE=on)."""
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from src.infrastructure.db import managers as db
+from src.shared.interview_models import LeafEvaluation
+from src.shared.streaming import streaming_to
+from src.workflows.subgraphs.leaf_interview.graph import build_leaf_interview_graph
+from src.workflows.subgraphs.leaf_interview.speculative import (
+    SPECULATIVE_FOLLOWUP_REASON,
+)
+from src.workflows.subgraphs.leaf_interview.state import LeafInterviewState
+
+
+class _FakeLLM:
+    """Answers every call after a delay; evaluations return status."""
+
+    def __init__(self, status: str, delay: float = 0.05) -> None:
+        self.status = status
+        self.delay = delay
+        self.prompts: dict[str, str] = {}
+        self.active = 0
+        self.max_active = 0
+
+    async def _call(self, result):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return result
+
+    async def ainvoke(self, messages):
+        content = f"reply {len(self.prompts)}"
+        self.prompts[content] = messages[0].content
+        return await self._call(AIMessage(content=content))
+
+    def with_structured_output(self, schema):
+        evaluation = LeafEvaluation(status=self.status, reason="Needs detail")
+        return SimpleNamespace(ainvoke=lambda messages: self._call(evaluation))
+
+
+async def _setup_leaves(user_id: uuid.UUID) -> tuple[uuid.UUID, uuid.UUID, uuid.UUID]:
+    area_id, leaf1_id, leaf2_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    for area, parent, title in (
+        (area_id, None, "Career"),
+        (leaf1_id, area_id, "Skills"),
+        (leaf2_id, area_id, "Goals"),
+    ):
+        await db.LifeAreasManager.create(
+            area, db.LifeArea(id=area, title=title, parent_id=parent, user_id=user_id)
+        )
+    first, second = sorted((leaf1_id, leaf2_id), key=str)
+    return area_id, first, second
+
+
+async def _answer(user, area_id: uuid.UUID, llm: _FakeLLM) -> dict:
+    graph = build_leaf_interview_graph(llm, llm, speculative=True)
+    state = LeafInterviewState(
+        user=user,
+        area_id=area_id,
+        messages=[HumanMessage(content="I write Python daily")],
+        messages_to_save={},
+    )
+    return await graph.ainvoke(state)
+
+
+class TestSpeculativeTurn:
+    """Test speculative_turn through the leaf interview graph."""
+
+    async def test_partial_keeps_followup_reply(self, temp_db, sample_user):
+        """A partial evaluation keeps the follow-up and stays on the leaf."""
+        area_id, first, _ = await _setup_leaves(sample_user.id)
+        llm = _FakeLLM("partial")
+
+        result = await _answer(sample_user, area_id, llm)
+
+        reply = result["messages"][-1].content
+        assert SPECULATIVE_FOLLOWUP_REASON in llm.prompts[reply]
+        assert result["active_leaf_id"] == first
+        assert result["leaf_evaluation"].status == "partial"
+        assert result["turn_summary_text"]
+
+    async def test_complete_keeps_next_leaf_reply(self, temp_db, sample_user):
+        """A complete evaluation moves on with the pre-generated next question."""
+        area_id, first, second = await _setup_leaves(sample_user.id)
+        llm = _FakeLLM("complete")
+
+        result = await _answer(sample_user, area_id, llm)
+
+        reply = result["messages"][-1].content
+        next_title = (await db.LifeAreasManager.get_by_id(second)).title
+        assert f"**New topic to ask about:** {next_title}" in llm.prompts[reply]
+        assert result["active_leaf_id"] == second
+        assert result["completed_leaf_id"] == first
+        assert result["set_covered_at"] is True
+        assert result["question_text"] == reply
+
+    async def test_replies_overlap_with_evaluation(self, temp_db, sample_user):
+        """Summary, follow-up and advance calls are in flight together."""
+        area_id, _, _ = await _setup_leaves(sample_user.id)
+        llm = _FakeLLM("partial")
+
+        await _answer(sample_user, area_id, llm)
+
+        assert llm.max_active == 3
+
+    @pytest.mark.parametrize("status", ["partial", "complete"])
+    async def test_kept_reply_is_streamed_once(self, temp_db, sample_user, status):
+        """Only the kept reply reaches the stream sink."""
+        area_id, _, _ = await _setup_leaves(sample_user.id)
+        received: list[str] = []
+
+        with streaming_to(received.append):
+            result = await _answer(sample_user, area_id, _FakeLLM(status))
+
+        assert received == [result["messages"][-1].content]
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, patch
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from src.domain.models import InputMode, User
 from src.infrastructure.db import managers as db
+from src.infrastructure.db.connection import get_connection
 from src.workflows.nodes.processing.load_history import (
     LoadHistoryState,
     get_formatted_history,
@@ -36,7 +37,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -74,7 +75,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -105,7 +106,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -131,7 +132,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -161,7 +162,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -192,7 +193,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -219,7 +220,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act - should skip the unknown role and return empty list
@@ -229,98 +230,28 @@ class TestGetFormattedHistory:
         assert messages == []
 
     async def test_limit_parameter_default(self):
-        """Should respect default limit of 15 messages (HISTORY_LIMIT_GLOBAL)."""
-        # Arrange
+        """Should request HISTORY_LIMIT_GLOBAL (15) messages by default."""
         user = User(id=uuid.uuid4(), mode=InputMode.auto)
-        # Create 20 messages
-        mock_history = [
-            db.History(
-                id=uuid.uuid4(),
-                message_data={"role": "user", "content": f"Message {i}"},
-                user_id=user.id,
-                created_ts=time.time() + i,  # Different timestamps
-            )
-            for i in range(20)
-        ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
-            mock_list.return_value = mock_history
-            # Act
-            messages = await get_formatted_history(user)
+            mock_list.return_value = []
+            await get_formatted_history(user)
 
-        # Assert
-        assert len(messages) == 15
-        # Should get the last 15 messages (5-19)
-        assert messages[0].content == "Message 5"
-        assert messages[-1].content == "Message 19"
+        mock_list.assert_awaited_once_with(user.id, 15)
 
     async def test_limit_parameter_custom(self):
-        """Should respect custom limit parameter."""
-        # Arrange
+        """Should pass a custom limit through to the query."""
         user = User(id=uuid.uuid4(), mode=InputMode.auto)
-        mock_history = [
-            db.History(
-                id=uuid.uuid4(),
-                message_data={"role": "user", "content": f"Message {i}"},
-                user_id=user.id,
-                created_ts=time.time() + i,
-            )
-            for i in range(10)
-        ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
-            mock_list.return_value = mock_history
-            # Act
-            messages = await get_formatted_history(user, limit=3)
-
-        # Assert
-        assert len(messages) == 3
-        assert messages[0].content == "Message 7"
-        assert messages[-1].content == "Message 9"
-
-    async def test_message_ordering(self):
-        """Messages should be sorted by created_ts."""
-        # Arrange
-        user = User(id=uuid.uuid4(), mode=InputMode.auto)
-        base_time = time.time()
-        # Create messages with out-of-order timestamps
-        mock_history = [
-            db.History(
-                id=uuid.uuid4(),
-                message_data={"role": "user", "content": "Third"},
-                user_id=user.id,
-                created_ts=base_time + 3,
-            ),
-            db.History(
-                id=uuid.uuid4(),
-                message_data={"role": "user", "content": "First"},
-                user_id=user.id,
-                created_ts=base_time + 1,
-            ),
-            db.History(
-                id=uuid.uuid4(),
-                message_data={"role": "user", "content": "Second"},
-                user_id=user.id,
-                created_ts=base_time + 2,
-            ),
-        ]
-
-        with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
-        ) as mock_list:
-            mock_list.return_value = mock_history
-            # Act
-            messages = await get_formatted_history(user)
+            mock_list.return_value = []
+            await get_formatted_history(user, limit=3)
 
-        # Assert
-        assert len(messages) == 3
-        assert messages[0].content == "First"
-        assert messages[1].content == "Second"
-        assert messages[2].content == "Third"
+        mock_list.assert_awaited_once_with(user.id, 3)
 
     async def test_mixed_message_types(self):
         """Should handle a mix of different message types correctly."""
@@ -366,7 +297,7 @@ class TestGetFormattedHistory:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -401,7 +332,7 @@ class TestLoadHistoryAsync:
         ]
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = mock_history
             # Act
@@ -420,7 +351,7 @@ class TestLoadHistoryAsync:
         state = LoadHistoryState(user=user, messages=[])
 
         with patch.object(
-            db.HistoriesManager, "list_by_user", new_callable=AsyncMock
+            db.HistoriesManager, "list_recent_by_user", new_callable=AsyncMock
         ) as mock_list:
             mock_list.return_value = []
             # Act
@@ -429,3 +360,58 @@ class TestLoadHistoryAsync:
         # Assert
         assert "messages" in result
         assert len(result["messages"]) == 0
+
+
+class TestListRecentByUser:
+    """Test HistoriesManager.list_recent_by_user against a real database."""
+
+    async def _seed(self, user_id: uuid.UUID, timestamps: list[float]) -> None:
+        for ts in timestamps:
+            history = db.History(
+                id=uuid.uuid4(),
+                message_data={"role": "user", "content": f"at {ts}"},
+                user_id=user_id,
+                created_ts=ts,
+            )
+            await db.HistoriesManager.create(history.id, history)
+
+    async def test_returns_tail_oldest_first(self, temp_db):
+        """Should return the newest rows, in chronological order."""
+        user_id = uuid.uuid4()
+        await self._seed(user_id, [3.0, 1.0, 5.0, 2.0, 4.0])
+
+        recent = await db.HistoriesManager.list_recent_by_user(user_id, 3)
+
+        assert [h.created_ts for h in recent] == [3.0, 4.0, 5.0]
+
+    async def test_ignores_other_users(self, temp_db):
+        """Rows of other users must not leak into the tail."""
+        user_id, other_id = uuid.uuid4(), uuid.uuid4()
+        await self._seed(user_id, [1.0])
+        await self._seed(other_id, [2.0, 3.0])
+
+        recent = await db.HistoriesManager.list_recent_by_user(user_id, 10)
+
+        assert [h.created_ts for h in recent] == [1.0]
+
+    async def test_formatted_history_reads_tail(self, temp_db):
+        """get_formatted_history should yield the last messages in order."""
+        user = User(id=uuid.uuid4(), mode=InputMode.auto)
+        await self._seed(user.id, [float(i) for i in range(20)])
+
+        messages = await get_formatted_history(user, limit=2)
+
+        assert [m.content for m in messages] == ["at 18.0", "at 19.0"]
+
+    async def test_query_uses_composite_index(self, temp_db):
+        """The tail query should be served by the (user_id, created_ts) index."""
+        await db.HistoriesManager.list_recent_by_user(uuid.uuid4(), 1)
+        async with get_connection(read_only=True) as conn:
+            cursor = await conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM histories"
+                " WHERE user_id = ? ORDER BY created_ts DESC LIMIT 1",
+                ("x",),
+            )
+            plan = " ".join(row["detail"] for row in await cursor.fetchall())
+        assert "histories_user_created_ts_idx" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,116 @@
+"""Tests for PreparedLLM and per-turn CPU of the LLM call sites."""
+
+import importlib
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_openai import ChatOpenAI
+from src.domain import InputMode, User
+from src.infrastructure.llms import PreparedLLM
+from src.shared.ids import new_id
+from src.shared.interview_models import LeafEvaluation
+from src.workflows.subgraphs.area_loop import nodes as area_nodes
+from src.workflows.subgraphs.area_loop.state import AreaState
+from src.workflows.subgraphs.area_loop.tools import AREA_TOOLS
+from src.workflows.subgraphs.leaf_interview import nodes as leaf_nodes
+
+# The input package re-exports the node under the module's name
+extract_module = importlib.import_module("src.workflows.nodes.input.extract_target")
+
+TURNS = 50
+
+
+class TestPreparedLLM:
+    """Test runnable reuse and delegation."""
+
+    def test_structured_output_built_once(self):
+        llm = MagicMock()
+        prepared = PreparedLLM(llm, schemas=[LeafEvaluation])
+
+        runnables = {id(prepared.with_structured_output(LeafEvaluation)) for _ in "abc"}
+
+        assert len(runnables) == 1
+        llm.with_structured_output.assert_called_once_with(LeafEvaluation)
+
+    def test_tools_bound_once(self):
+        llm = MagicMock()
+        prepared = PreparedLLM(llm, tools=AREA_TOOLS)
+
+        prepared.bind_tools(AREA_TOOLS)
+        prepared.bind_tools(AREA_TOOLS)
+
+        llm.bind_tools.assert_called_once_with(AREA_TOOLS)
+
+    def test_unprepared_calls_are_delegated(self):
+        llm = MagicMock()
+        prepared = PreparedLLM(llm, schemas=[LeafEvaluation])
+
+        prepared.with_structured_output(LeafEvaluation, method="json_mode")
+        prepared.bind_tools(AREA_TOOLS[:1])
+
+        assert llm.with_structured_output.call_count == 2
+        llm.bind_tools.assert_called_once_with(AREA_TOOLS[:1])
+        assert prepared.ainvoke is llm.ainvoke
+
+
+def _canned(result):
+    async def invoke(call):
+        return result
+
+    return invoke
+
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Replace the LLM round trip of each call site with a canned result."""
+    target = extract_module.IntentClassification(target="conduct_interview")
+    evaluation = LeafEvaluation(status="partial", reason="More detail")
+    monkeypatch.setattr(extract_module, "invoke_with_retry", _canned(target))
+    monkeypatch.setattr(leaf_nodes, "invoke_with_retry", _canned(evaluation))
+    monkeypatch.setattr(area_nodes, "invoke_with_retry", _canned(AIMessage("Done")))
+
+
+def _turn(site: str):
+    messages = [HumanMessage(content="I write Python every day")]
+    if site == "extract_target":
+        return lambda llm: extract_module.extract_target_from_messages(messages, llm)
+    if site == "quick_evaluate":
+        return lambda llm: leaf_nodes._llm_evaluate(llm, "Career > Skills", ["Py"])
+    state = AreaState(
+        user=User(id=new_id(), mode=InputMode.auto),
+        messages=messages,
+        messages_to_save={},
+    )
+    return lambda llm: area_nodes.area_chat(state, llm)
+
+
+async def _cpu_per_turn(turn, llm) -> float:
+    await turn(llm)  # warm up lazy imports and caches
+    start = time.process_time()
+    for _ in range(TURNS):
+        await turn(llm)
+    return (time.process_time() - start) / TURNS
+
+
+class TestPerTurnCpu:
+    """Profile request preparation per turn, derived per call vs prepared."""
+
+    @pytest.mark.parametrize(
+        ("site", "prepare"),
+        [
+            ("extract_target", {"schemas": [extract_module.IntentClassification]}),
+            ("quick_evaluate", {"schemas": [LeafEvaluation]}),
+            ("area_chat", {"tools": AREA_TOOLS}),
+        ],
+    )
+    async def test_prepared_llm_cuts_cpu(self, offline, site, prepare):
+        llm = ChatOpenAI(model="gpt-4o-mini", api_key="sk-test")
+        turn = _turn(site)
+
+        per_call = await _cpu_per_turn(turn, llm)
+        prepared = await _cpu_per_turn(turn, PreparedLLM(llm, **prepare))
+
+        # Deriving the runnable costs ~0.4-1 ms; the prepared path is ~10-20 us
+        assert prepared * 4 < per_call
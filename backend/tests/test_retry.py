@@ -1,5 +1,6 @@
 """Tests for retry utilities."""
 
+import openai
 import pytest
 from httpx import HTTPStatusError, Request, Response
 from src.shared.retry import (
@@ -62,6 +63,20 @@ class TestIsRetryableException:
         exc = HTTPStatusError("Unauthorized", request=request, response=response)
         assert not _is_retryable_exception(exc)
 
+    def test_openai_rate_limit_and_timeout_are_retryable(self):
+        request = Request("POST", "https://api.example.com")
+        response = Response(429, request=request)
+        assert _is_retryable_exception(
+            openai.RateLimitError("Rate limited", response=response, body=None)
+        )
+        assert _is_retryable_exception(openai.APITimeoutError(request=request))
+
+    def test_openai_bad_request_not_retryable(self):
+        request = Request("POST", "https://api.example.com")
+        response = Response(400, request=request)
+        exc = openai.BadRequestError("Too many tokens", response=response, body=None)
+        assert not _is_retryable_exception(exc)
+
     def test_value_error_not_retryable(self):
         assert not _is_retryable_exception(ValueError("some generic error"))
 
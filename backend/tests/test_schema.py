@@ -9,6 +9,7 @@ from src.infrastructure.db.schema import (
     _db_initialized_paths,
     init_schema_async,
 )
+from src.shared.vectors import unpack_vector
 
 
 async def _open_conn(db_path: str) -> aiosqlite.Connection:
@@ -122,3 +123,35 @@ class TestMigrationRunner:
             assert versions == [1, 2]
         finally:
             await conn.close()
+
+
+class TestVectorBlobMigration:
+    """Test migration 8: JSON-text summary vectors to packed float32 blobs."""
+
+    async def test_converts_json_vectors(self, fresh_db):
+        """Legacy JSON vectors should become blobs with dim and norm set."""
+        conn = await _open_conn(fresh_db)
+        try:
+            with patch(
+                "src.infrastructure.db.schema._MIGRATIONS",
+                [m for m in _MIGRATIONS if m.version < 8],
+            ):
+                await init_schema_async(conn, fresh_db)
+            await conn.execute(
+                "INSERT INTO summaries (id, area_id, summary_text, vector, created_at)"
+                " VALUES ('s1', 'a1', 'text', '[3.0, 4.0]', 0.0)"
+            )
+            await conn.commit()
+
+            _db_initialized_paths.discard(fresh_db)
+            await init_schema_async(conn, fresh_db)
+
+            cursor = await conn.execute(
+                "SELECT vector, vector_dim, vector_norm FROM summaries"
+            )
+            row = await cursor.fetchone()
+            assert list(unpack_vector(row["vector"])) == [3.0, 4.0]
+            assert row["vector_dim"] == 2
+            assert row["vector_norm"] == pytest.approx(5.0)
+        finally:
+            await conn.close()
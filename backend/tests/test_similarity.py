@@ -1,7 +1,9 @@
 """Unit tests for similarity utilities."""
 
 import pytest
-from src.shared.similarity import cosine_similarity, find_top_k
+from src.shared import similarity
+from src.shared.similarity import cosine_similarity, find_top_k, normalize_rows
+from src.shared.vectors import pack_vector, unpack_vector
 
 
 class TestCosineSimilarity:
@@ -30,6 +32,15 @@ class TestCosineSimilarity:
             cosine_similarity([1.0, 2.0], [1.0, 2.0, 3.0])
 
 
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run find_top_k tests against both the NumPy and pure-Python paths."""
+    if request.param == "python":
+        monkeypatch.setattr(similarity, "np", None)
+    return request.param
+
+
+@pytest.mark.usefixtures("backend")
 class TestFindTopK:
     """Tests for find_top_k."""
 
@@ -62,3 +73,40 @@ class TestFindTopK:
         """Empty candidates should return empty result."""
         results = find_top_k([1.0, 0.0], [], k=5)
         assert results == []
+
+    def test_scores_match_cosine_similarity(self):
+        """Scores should equal cosine_similarity at float32 precision."""
+        query = [0.3, -1.2, 2.0]
+        candidates = [("a", [1.0, 2.0, 3.0]), ("b", [-1.0, 0.5, 0.0])]
+        results = dict(find_top_k(query, candidates, k=2))
+        for cid, vec in candidates:
+            expected = cosine_similarity(query, vec)
+            assert results[cid] == pytest.approx(expected, abs=1e-6)
+
+    def test_accepts_packed_vectors(self):
+        """Zero-copy decoded blobs should be scored like lists."""
+        candidates = [
+            ("a", unpack_vector(pack_vector([0.0, 1.0]))),
+            ("b", unpack_vector(pack_vector([1.0, 0.0]))),
+        ]
+        assert find_top_k([1.0, 0.0], candidates, k=1)[0][0] == "b"
+
+    def test_zero_query_scores_zero(self):
+        """A zero query vector should score every candidate 0.0."""
+        results = find_top_k([0.0, 0.0], [("a", [1.0, 0.0])], k=1)
+        assert results == [("a", 0.0)]
+
+    def test_mismatched_dims_raise(self):
+        """Candidates with a different dimension should raise ValueError."""
+        with pytest.raises(ValueError):
+            find_top_k([1.0, 0.0], [("a", [1.0, 0.0, 0.0])], k=1)
+
+
+class TestNormalizeRows:
+    """Tests for normalize_rows."""
+
+    def test_rows_have_unit_length(self):
+        """Non-zero rows should be scaled to length 1, zero rows left as zero."""
+        matrix = normalize_rows([[3.0, 4.0], [0.0, 0.0]])
+        assert matrix[0].tolist() == pytest.approx([0.6, 0.8])
+        assert matrix[1].tolist() == [0.0, 0.0]
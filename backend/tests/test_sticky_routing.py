@@ -0,0 +1,146 @@
+"""Tests for sticky routing of follow-up turns in extract_target."""
+
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import HumanMessage
+from src.domain import InputMode, User
+from src.processes.interview import Target
+from src.shared.ids import new_id
+from src.workflows.nodes.input import sticky_routing
+from src.workflows.nodes.input.extract_target import (
+    ExtractTargetState,
+    extract_target,
+)
+from src.workflows.nodes.input.sticky_routing import StickyRouter
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class _ClassifierLLM:
+    """Structured-output LLM that always answers target."""
+
+    def __init__(self, target: Target) -> None:
+        self.target = target
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        async def ainvoke(messages):
+            self.calls += 1
+            return schema(target=self.target)
+
+        return SimpleNamespace(ainvoke=ainvoke)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(sticky_routing, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def router(monkeypatch) -> StickyRouter:
+    router = StickyRouter(max_turns=2, ttl=60.0)
+    monkeypatch.setattr(sticky_routing, "_router", router)
+    return router
+
+
+class TestStickyRouter:
+    """Test the per-user session policy."""
+
+    def test_reuses_target_within_turn_budget(self, clock):
+        router, user_id = StickyRouter(max_turns=2, ttl=60.0), new_id()
+        router.record(user_id, Target.conduct_interview)
+
+        guesses = [router.guess(user_id) for _ in range(3)]
+
+        assert guesses == [Target.conduct_interview, Target.conduct_interview, None]
+        assert router.stats.hits == 2
+
+    def test_idle_session_expires(self, clock):
+        router, user_id = StickyRouter(max_turns=5, ttl=60.0), new_id()
+        router.record(user_id, Target.conduct_interview)
+        clock.now = 30.0
+        assert router.guess(user_id) == Target.conduct_interview
+
+        clock.now = 91.0
+
+        assert router.guess(user_id) is None
+        assert router.stats.expired == 1
+
+    @pytest.mark.parametrize("target", [Target.manage_areas, Target.small_talk])
+    def test_other_targets_are_not_sticky(self, clock, target):
+        router, user_id = StickyRouter(max_turns=2, ttl=60.0), new_id()
+        router.record(user_id, target)
+
+        assert router.guess(user_id) is None
+
+    def test_zero_turns_disables(self, clock):
+        router, user_id = StickyRouter(max_turns=0, ttl=60.0), new_id()
+        router.record(user_id, Target.conduct_interview)
+
+        assert router.guess(user_id) is None
+
+    def test_classified_turn_scores_previous_guesses(self, clock):
+        router, user_id = StickyRouter(max_turns=2, ttl=60.0), new_id()
+        router.record(user_id, Target.conduct_interview)
+        router.guess(user_id)
+        router.record(user_id, Target.conduct_interview)
+        router.guess(user_id)
+        router.record(user_id, Target.manage_areas)
+
+        assert router.stats.confirmed == 1
+        assert router.stats.corrected == 1
+        assert router.stats.correction_rate == 0.5
+
+    def test_forget_drops_session(self, clock):
+        router, user_id = StickyRouter(max_turns=2, ttl=60.0), new_id()
+        router.record(user_id, Target.conduct_interview)
+
+        router.forget(user_id)
+
+        assert router.guess(user_id) is None
+
+
+class TestExtractTargetSticky:
+    """Test sticky guesses inside the extract_target node."""
+
+    async def test_follow_ups_skip_classifier_until_budget_runs_out(self, router):
+        user = User(id=new_id(), mode=InputMode.auto)
+        llm = _ClassifierLLM(Target.conduct_interview)
+        targets = []
+        for text in ("Tell me more", "Sure", "Not really", "Maybe later"):
+            state = ExtractTargetState(
+                user=user, messages=[HumanMessage(content=text)], target=None
+            )
+            targets.append((await extract_target(state, llm))["target"])
+
+        assert targets == [Target.conduct_interview] * 4
+        # First turn classifies, two sticky turns, then a verification call
+        assert llm.calls == 2
+        assert router.stats.hits == 2
+        assert router.stats.confirmed == 1
+
+    async def test_rules_override_sticky_guess(self, router):
+        user = User(id=new_id(), mode=InputMode.auto)
+        llm = _ClassifierLLM(Target.conduct_interview)
+        router.record(user.id, Target.conduct_interview)
+        router.guess(user.id)
+        state = ExtractTargetState(
+            user=user,
+            messages=[HumanMessage(content="Create area for Fitness")],
+            target=None,
+        )
+
+        result = await extract_target(state, llm)
+
+        assert result["target"] == Target.manage_areas
+        assert llm.calls == 0
+        assert router.stats.corrected == 1
@@ -0,0 +1,129 @@
+"""Tests for streaming reply text from LLM nodes to the transport."""
+
+from typing import TypedDict
+
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+from langgraph.graph import END, START, StateGraph
+from src.processes.transport import cli
+from src.shared.streaming import (
+    StreamInterruptedError,
+    invoke_streaming,
+    streaming_to,
+)
+
+MESSAGES = [HumanMessage(content="hi")]
+
+
+class _FakeLLM:
+    """Streams the given deltas, then raises fail_with if set."""
+
+    def __init__(self, deltas: list[str], fail_with: Exception | None = None):
+        self.deltas = deltas
+        self.fail_with = fail_with
+        self.stream_calls = 0
+
+    async def ainvoke(self, messages):
+        return AIMessage(content="".join(self.deltas))
+
+    async def astream(self, messages):
+        self.stream_calls += 1
+        for delta in self.deltas:
+            yield AIMessageChunk(content=delta)
+        if self.fail_with is not None:
+            raise self.fail_with
+
+
+class TestInvokeStreaming:
+    """Test invoke_streaming with and without a sink."""
+
+    async def test_sink_receives_deltas_and_message_is_complete(self):
+        """Each delta reaches the sink; the returned message has the full text."""
+        received: list[str] = []
+        with streaming_to(received.append):
+            message = await invoke_streaming(_FakeLLM(["Hel", "", "lo"]), MESSAGES)
+
+        assert received == ["Hel", "lo"]
+        assert message.content == "Hello"
+
+    async def test_without_sink_uses_ainvoke(self):
+        """No sink means a plain ainvoke call."""
+        llm = _FakeLLM(["Hello"])
+
+        message = await invoke_streaming(llm, MESSAGES)
+
+        assert message.content == "Hello"
+        assert llm.stream_calls == 0
+
+    async def test_failure_before_first_delta_is_retried(self):
+        """A stream that fails before emitting anything is retried."""
+        llm = _FakeLLM([], fail_with=ConnectionError("reset"))
+
+        with streaming_to(lambda text: None), pytest.raises(ConnectionError):
+            await invoke_streaming(llm, MESSAGES)
+
+        assert llm.stream_calls > 1
+
+    async def test_failure_after_delta_is_not_retried(self):
+        """Text already shown is never streamed twice."""
+        received: list[str] = []
+        llm = _FakeLLM(["Hel"], fail_with=ConnectionError("reset"))
+
+        with streaming_to(received.append), pytest.raises(StreamInterruptedError):
+            await invoke_streaming(llm, MESSAGES)
+
+        assert llm.stream_calls == 1
+        assert received == ["Hel"]
+
+    async def test_sink_reaches_graph_nodes(self):
+        """The sink set around ainvoke is visible inside LangGraph nodes."""
+
+        class _State(TypedDict):
+            reply: str
+
+        async def respond(state: _State) -> _State:
+            message = await invoke_streaming(_FakeLLM(["a", "b"]), MESSAGES)
+            return {"reply": message.content}
+
+        builder = StateGraph(_State)
+        builder.add_node("respond", respond)
+        builder.add_edge(START, "respond")
+        builder.add_edge("respond", END)
+        received: list[str] = []
+
+        with streaming_to(received.append):
+            result = await builder.compile().ainvoke({"reply": ""})
+
+        assert received == ["a", "b"]
+        assert result["reply"] == "ab"
+
+
+class TestCliStreaming:
+    """Test how the CLI prints streamed replies."""
+
+    @staticmethod
+    def _fake_send(chunks: list[str], reply: str):
+        async def send(text, user_id, channels, on_chunk=None):
+            for chunk in chunks:
+                on_chunk(chunk)
+            return reply
+
+        return send
+
+    async def test_streamed_reply_is_printed_once(self, monkeypatch, capsys):
+        """Deltas are printed as they arrive and the reply is not repeated."""
+        monkeypatch.setattr(
+            cli, "_send_request", self._fake_send(["Hel", "lo"], "Hello")
+        )
+
+        await cli._send_and_print("hi", None, None)
+
+        assert capsys.readouterr().out == "Hello\n"
+
+    async def test_unstreamed_reply_is_printed(self, monkeypatch, capsys):
+        """Replies that did not stream (commands, errors) print normally."""
+        monkeypatch.setattr(cli, "_send_request", self._fake_send([], "Done"))
+
+        await cli._send_and_print("/clear", None, None)
+
+        assert capsys.readouterr().out == "Done\n"
@@ -1,15 +1,18 @@
 """Tests for Telegram transport utilities."""
 
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from aiogram.exceptions import TelegramNetworkError
+from aiogram.exceptions import TelegramBadRequest, TelegramNetworkError
 from src.processes.transport.telegram import (
     SEND_RETRY_ATTEMPTS,
     _retry_send,
     _safe_reply,
     _split_message,
 )
+from src.processes.transport.telegram_stream import ReplyStream
 
 
 def _make_network_error(msg: str = "network error") -> TelegramNetworkError:
@@ -115,3 +118,71 @@ class TestSplitMessage:
         result = _split_message("Hello", 5)
 
         assert result == ["Hello"]
+
+
+def _stream_bot() -> MagicMock:
+    bot = MagicMock()
+    bot.send_message = AsyncMock(return_value=SimpleNamespace(message_id=7))
+    bot.edit_message_text = AsyncMock()
+    return bot
+
+
+class TestReplyStream:
+    """Tests for progressive display of streamed replies."""
+
+    @pytest.fixture(autouse=True)
+    def _slow_edits(self, monkeypatch):
+        monkeypatch.setattr(
+            "src.processes.transport.telegram_stream.get_stream_edit_interval",
+            lambda: 60.0,
+        )
+
+    async def test_first_delta_sends_placeholder_and_finish_edits_it(self):
+        """The preview is one message, edited to the final reply."""
+        bot = _stream_bot()
+        stream = ReplyStream(bot, chat_id=1)
+
+        stream.push("Hel")
+        await asyncio.sleep(0)
+        stream.push("lo")
+        finished = await stream.finish("Hello!")
+
+        assert finished
+        bot.send_message.assert_awaited_once_with(1, "Hel")
+        bot.edit_message_text.assert_awaited_once_with(
+            "Hello!", chat_id=1, message_id=7
+        )
+
+    async def test_edits_are_throttled(self):
+        """Deltas within the edit interval do not trigger extra edits."""
+        bot = _stream_bot()
+        stream = ReplyStream(bot, chat_id=1)
+
+        stream.push("a")
+        await asyncio.sleep(0)
+        for delta in "bcdef":
+            stream.push(delta)
+            await asyncio.sleep(0)
+
+        assert bot.send_message.await_count == 1
+        assert bot.edit_message_text.await_count == 0
+
+    async def test_finish_without_deltas_sends_nothing(self):
+        """Nothing streamed: the caller sends the reply itself."""
+        bot = _stream_bot()
+
+        assert not await ReplyStream(bot, chat_id=1).finish("Hello")
+        bot.send_message.assert_not_awaited()
+
+    async def test_not_modified_error_is_ignored(self):
+        """Telegram rejects edits that do not change the text; that is fine."""
+        bot = _stream_bot()
+        bot.edit_message_text.side_effect = TelegramBadRequest(
+            method=MagicMock(), message="Bad Request: message is not modified"
+        )
+        stream = ReplyStream(bot, chat_id=1)
+
+        stream.push("Hi")
+        await asyncio.sleep(0)
+
+        assert await stream.finish("Hi there")
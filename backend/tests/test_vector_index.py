@@ -0,0 +1,244 @@
+"""Unit tests for the per-user in-memory vector index cache."""
+
+import asyncio
+import uuid
+
+import pytest
+from src.infrastructure import vector_ann
+from src.infrastructure.db import managers as db
+from src.infrastructure.vector_index import VectorIndexCache
+from src.shared import similarity
+from src.shared.ids import new_id
+from src.shared.timestamp import get_timestamp
+from src.workflows.nodes.commands import handlers
+
+
+async def _create_area(user_id: uuid.UUID) -> uuid.UUID:
+    area_id = new_id()
+    await db.LifeAreasManager.create(
+        area_id, db.LifeArea(id=area_id, title="Area", parent_id=None, user_id=user_id)
+    )
+    return area_id
+
+
+async def _add_vector(area_id: uuid.UUID, vector: list[float]) -> str:
+    summary_id = await db.SummariesManager.create_summary(
+        area_id=area_id, summary_text="Summary.", created_at=get_timestamp()
+    )
+    await db.SummariesManager.update_vector(summary_id, vector)
+    return str(summary_id)
+
+
+class TestVectorIndexCache:
+    """Test lazy build, incremental updates and invalidation via DB triggers."""
+
+    async def test_builds_lazily_then_hits(self, temp_db):
+        """First lookup builds the index; an unchanged user is a cache hit."""
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        sid = await _add_vector(await _create_area(user_id), [1.0, 0.0])
+
+        first = await cache.get(user_id)
+        second = await cache.get(user_id)
+
+        assert second is first
+        assert first.search([1.0, 0.0], k=1)[0][0] == sid
+        assert (cache.stats.builds, cache.stats.hits) == (1, 1)
+
+    async def test_new_vector_is_appended_incrementally(self, temp_db):
+        """A vector written after the build is fetched without a rebuild."""
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        area_id = await _create_area(user_id)
+        await _add_vector(area_id, [1.0, 0.0])
+        await cache.get(user_id)
+
+        new_sid = await _add_vector(area_id, [0.0, 1.0])
+        index = await cache.get(user_id)
+
+        assert len(index) == 2
+        assert index.search([0.0, 1.0], k=1)[0][0] == new_sid
+        assert cache.stats.builds == 1
+        assert cache.stats.incremental_updates == 1
+
+    @pytest.mark.parametrize(
+        ("saved_vector", "expected"), [([1.0, 0.0], 1), ([0.0, 1.0], 1), (None, 0)]
+    )
+    async def test_resaved_summary_stays_in_sync(self, temp_db, saved_vector, expected):
+        """Re-saving a summary row must update, not orphan, its indexed vector."""
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        sid = await _add_vector(await _create_area(user_id), [1.0, 0.0])
+        await cache.get(user_id)
+        summary = await db.SummariesManager.get_by_id(uuid.UUID(sid))
+
+        summary.vector = saved_vector
+        await db.SummariesManager.update(summary.id, summary)
+        index = await cache.get(user_id)
+
+        assert len(index) == expected
+        if saved_vector is not None:
+            assert index.search(saved_vector, k=1) == [(sid, pytest.approx(1.0))]
+
+    async def test_concurrent_lookups_append_once(self, temp_db):
+        """Concurrent lookups after a new vector must not append it twice."""
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        area_id = await _create_area(user_id)
+        await _add_vector(area_id, [1.0, 0.0])
+        await cache.get(user_id)
+        new_sid = await _add_vector(area_id, [0.0, 1.0])
+
+        indexes = await asyncio.gather(*(cache.get(user_id) for _ in range(20)))
+
+        assert all(index is indexes[0] for index in indexes)
+        assert len(indexes[0]) == 2
+        assert indexes[0].ids.count(new_sid) == 1
+        assert cache.stats.incremental_updates == 1
+
+    async def test_reset_area_forces_rebuild(self, temp_db):
+        """Deleting an area's summaries (/reset_area) must drop their vectors."""
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        area_id = await _create_area(user_id)
+        await _add_vector(area_id, [1.0, 0.0])
+        await cache.get(user_id)
+
+        await db.SummariesManager.delete_by_area(area_id)
+        index = await cache.get(user_id)
+
+        assert len(index) == 0
+        assert cache.stats.builds == 2
+
+    async def test_delete_user_empties_index(self, temp_db):
+        """/delete removes every vector from the user's index."""
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        await db.UsersManager.create(
+            user_id, db.User(id=user_id, name="u", mode="auto", current_area_id=None)
+        )
+        await _add_vector(await _create_area(user_id), [1.0, 0.0])
+        await cache.get(user_id)
+
+        await handlers._delete_user_data(user_id)
+
+        assert len(await cache.get(user_id)) == 0
+
+    async def test_evicts_least_recently_used(self, temp_db):
+        """Exceeding the byte budget evicts the least recently used user."""
+        cache = VectorIndexCache(max_bytes=12)  # room for one 2-dim float32 row
+        users = [new_id(), new_id()]
+        for user_id in users:
+            await _add_vector(await _create_area(user_id), [1.0, 0.0])
+
+        await cache.get(users[0])
+        await cache.get(users[1])
+
+        assert cache.stats.evictions == 1
+        assert cache.stats.cached_users == 1
+        await cache.get(users[0])
+        assert cache.stats.builds == 3
+
+    async def test_pure_python_fallback(self, temp_db, monkeypatch):
+        """Without NumPy the index keeps raw vectors and still ranks correctly."""
+        monkeypatch.setattr(similarity, "np", None)
+        cache = VectorIndexCache(max_bytes=1 << 20)
+        user_id = new_id()
+        area_id = await _create_area(user_id)
+        await _add_vector(area_id, [1.0, 0.0])
+        await cache.get(user_id)
+        sid = await _add_vector(area_id, [0.0, 1.0])
+
+        index = await cache.get(user_id)
+
+        top = index.search([0.0, 1.0], k=2)
+        assert top[0] == (sid, pytest.approx(1.0))
+        assert index.nbytes == 16
+
+
+@pytest.fixture
+def ivf_mode(monkeypatch):
+    """Enable the IVF layer for users with at least 4 vectors."""
+    monkeypatch.setattr(vector_ann, "VECTOR_INDEX_MODE", "ivf")
+    monkeypatch.setattr(vector_ann, "VECTOR_INDEX_ANN_MIN_VECTORS", 4)
+    monkeypatch.setattr(vector_ann, "VECTOR_INDEX_ANN_NPROBE", 2)
+
+
+@pytest.mark.usefixtures("ivf_mode")
+class TestAnnMode:
+    """Test the optional IVF-flat layer and its sidecar file."""
+
+    async def _seed(self, user_id: uuid.UUID, count: int) -> list[str]:
+        area_id = await _create_area(user_id)
+        return [
+            await _add_vector(area_id, [1.0, i / count, 0.0, 0.0]) for i in range(count)
+        ]
+
+    async def test_small_users_stay_exact(self, temp_db):
+        """Below the threshold no ANN layer or sidecar is created."""
+        user_id = new_id()
+        await self._seed(user_id, 3)
+
+        index = await VectorIndexCache(max_bytes=1 << 20).get(user_id)
+
+        assert index.ann is None
+        assert not vector_ann.sidecar_path(user_id).exists()
+
+    async def test_builds_and_persists_sidecar(self, temp_db):
+        """Crossing the threshold trains the index and writes the sidecar."""
+        user_id = new_id()
+        sids = await self._seed(user_id, 6)
+
+        index = await VectorIndexCache(max_bytes=1 << 20).get(user_id)
+
+        assert index.ann is not None
+        assert vector_ann.sidecar_path(user_id).exists()
+        assert index.search([1.0, 1.0, 0.0, 0.0], k=1)[0][0] == sids[-1]
+
+    async def test_concurrent_lookups_train_once(self, temp_db, monkeypatch):
+        """Concurrent first lookups build and train the index only once."""
+        user_id = new_id()
+        await self._seed(user_id, 6)
+        calls = []
+        train = vector_ann._train
+
+        def counting_train(*args):
+            calls.append(args)
+            return train(*args)
+
+        monkeypatch.setattr(vector_ann, "_train", counting_train)
+        cache = VectorIndexCache(max_bytes=1 << 20)
+
+        indexes = await asyncio.gather(*(cache.get(user_id) for _ in range(10)))
+
+        assert len(calls) == 1
+        assert len(indexes[0]) == 6
+        assert all(index is indexes[0] for index in indexes)
+
+    async def test_restores_from_sidecar_without_training(self, temp_db, monkeypatch):
+        """A fresh process restores rows and centroids, fetching only new vectors."""
+        user_id = new_id()
+        sids = await self._seed(user_id, 6)
+        await VectorIndexCache(max_bytes=1 << 20).get(user_id)
+        area_id = await _create_area(user_id)
+        new_sid = await _add_vector(area_id, [0.0, 0.0, 1.0, 0.0])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("should not retrain")
+
+        monkeypatch.setattr("src.shared.ivf.train_centroids", fail)
+        monkeypatch.setattr(vector_ann, "_reusable_centroids", fail)
+        index = await VectorIndexCache(max_bytes=1 << 20).get(user_id)
+
+        assert index.ids == sids + [new_sid]
+        assert index.ann is not None
+
+    async def test_delete_user_removes_sidecar(self, temp_db):
+        """/delete must not leave the user's vectors behind on disk."""
+        user_id = new_id()
+        await self._seed(user_id, 6)
+        await VectorIndexCache(max_bytes=1 << 20).get(user_id)
+
+        await handlers._delete_user_data(user_id)
+
+        assert not vector_ann.sidecar_path(user_id).exists()
@@ -0,0 +1,33 @@
+"""Unit tests for packed float32 vector encoding."""
+
+import pytest
+from src.shared.vectors import pack_vector, unpack_vector, vector_norm
+
+
+class TestPackedVectors:
+    """Tests for pack_vector / unpack_vector."""
+
+    def test_round_trip_preserves_float32_values(self):
+        """Unpacked values should match the input at float32 precision."""
+        vec = [0.1, -2.5, 3.0e-5]
+        assert list(unpack_vector(pack_vector(vec))) == pytest.approx(vec, rel=1e-6)
+
+    def test_packs_four_bytes_per_dimension(self):
+        """Encoded size should be 4 bytes per dimension."""
+        assert len(pack_vector([0.0] * 1536)) == 1536 * 4
+
+    def test_unpack_does_not_copy(self):
+        """Decoded vector should be a view over the original blob."""
+        blob = pack_vector([1.0, 2.0])
+        view = unpack_vector(blob)
+        assert isinstance(view, memoryview)
+        assert view.obj is blob
+
+    def test_unpack_rejects_truncated_blob(self):
+        """Blob length must be a multiple of 4."""
+        with pytest.raises(ValueError):
+            unpack_vector(b"\x00\x00\x00")
+
+    def test_vector_norm(self):
+        """L2 norm of (3, 4) is 5."""
+        assert vector_norm([3.0, 4.0]) == pytest.approx(5.0)
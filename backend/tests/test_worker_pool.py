@@ -0,0 +1,163 @@
+"""Unit tests for autoscaling worker pools."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from src.runtime import get_worker_pool_stats, run_worker_pool, worker_busy
+
+
+@pytest.fixture(autouse=True)
+def _fast_pool(monkeypatch):
+    """Tick, scale down and restart quickly."""
+    monkeypatch.setattr("src.runtime.pool.WORKER_POOL_SCALE_INTERVAL", 0.01)
+    monkeypatch.setattr("src.runtime.pool.WORKER_POOL_SCALE_DOWN_DELAY", 0.05)
+    monkeypatch.setattr("src.runtime.pool.WORKER_RESTART_BACKOFF", 0.01)
+
+
+async def _wait_until(condition, timeout: float = 2.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def _blocking_worker(queue: asyncio.Queue[asyncio.Event]):
+    """Worker that takes an event from queue and stays busy until it is set."""
+
+    async def worker(worker_id: int) -> None:
+        while True:
+            release = await queue.get()
+            with worker_busy("scale"):
+                await release.wait()
+
+    return worker
+
+
+class TestAutoscaling:
+    """Test scaling between min and max size."""
+
+    async def test_scales_up_with_queue_and_back_down_when_idle(self):
+        """Queued work adds workers up to max_size; idle workers are retired."""
+        queue: asyncio.Queue[asyncio.Event] = asyncio.Queue()
+        shutdown = asyncio.Event()
+        pool = asyncio.create_task(
+            run_worker_pool(
+                "scale",
+                _blocking_worker(queue),
+                1,
+                shutdown,
+                max_size=4,
+                depth=queue.qsize,
+            )
+        )
+        await asyncio.sleep(0)
+        release = asyncio.Event()
+        for _ in range(6):
+            queue.put_nowait(release)
+
+        await _wait_until(lambda: get_worker_pool_stats()["scale"].busy == 4)
+        assert get_worker_pool_stats()["scale"].size == 4
+
+        release.set()
+        await _wait_until(lambda: get_worker_pool_stats()["scale"].size == 1)
+        stats = get_worker_pool_stats()["scale"]
+        assert (stats.completed, stats.scale_downs) == (6, 3)
+        assert queue.empty()
+
+        shutdown.set()
+        await asyncio.wait_for(pool, timeout=2.0)
+        assert "scale" not in get_worker_pool_stats()
+
+    async def test_fixed_size_without_depth(self):
+        """Without a depth callable the pool keeps pool_size workers."""
+        started = []
+        shutdown = asyncio.Event()
+
+        async def worker(worker_id: int) -> None:
+            started.append(worker_id)
+            await shutdown.wait()
+
+        pool = asyncio.create_task(
+            run_worker_pool("fixed", worker, 2, shutdown, max_size=8)
+        )
+        await asyncio.sleep(0.05)
+
+        assert get_worker_pool_stats()["fixed"].size == 2
+        shutdown.set()
+        await asyncio.wait_for(pool, timeout=2.0)
+        assert sorted(started) == [0, 1]
+
+
+class TestWorkerRestarts:
+    """Test that crashed workers are restarted individually."""
+
+    async def test_crashed_worker_restarts_without_stopping_others(self):
+        """One crashing worker is restarted; its peers keep running."""
+        runs: dict[int, int] = {}
+        shutdown = asyncio.Event()
+
+        async def worker(worker_id: int) -> None:
+            runs[worker_id] = runs.get(worker_id, 0) + 1
+            if worker_id == 0 and runs[0] < 3:
+                raise RuntimeError("boom")
+            await shutdown.wait()
+
+        pool = asyncio.create_task(run_worker_pool("crashy", worker, 2, shutdown))
+        await _wait_until(lambda: runs.get(0) == 3)
+
+        assert runs[1] == 1
+        assert get_worker_pool_stats()["crashy"].restarts == 2
+        shutdown.set()
+        await asyncio.wait_for(pool, timeout=2.0)
+
+    async def test_restart_backoff_doubles(self):
+        """Consecutive crashes wait WORKER_RESTART_BACKOFF * 2**(n-1)."""
+        delays = []
+
+        async def worker(worker_id: int) -> None:
+            raise RuntimeError("boom")
+
+        real_sleep = asyncio.sleep
+
+        async def record_sleep(delay, *args):
+            if delay >= 1:
+                delays.append(delay)
+            await real_sleep(0)
+
+        shutdown = asyncio.Event()
+        with (
+            patch("src.runtime.pool.WORKER_RESTART_BACKOFF", 1.0),
+            patch("src.runtime.pool.WORKER_RESTART_BACKOFF_MAX", 4.0),
+            patch("src.runtime.pool.asyncio.sleep", record_sleep),
+        ):
+            pool = asyncio.create_task(run_worker_pool("backoff", worker, 1, shutdown))
+            await _wait_until(lambda: len(delays) >= 4)
+            shutdown.set()
+            await asyncio.wait_for(pool, timeout=2.0)
+
+        assert delays[:4] == [1.0, 2.0, 4.0, 4.0]
+
+
+class TestShutdown:
+    """Test event-driven shutdown."""
+
+    async def test_shutdown_cancels_idle_workers_immediately(self, monkeypatch):
+        """Workers blocked in get() stop without waiting for a poll interval."""
+        monkeypatch.setattr("src.runtime.pool.WORKER_POOL_SCALE_INTERVAL", 60.0)
+        queue: asyncio.Queue[asyncio.Event] = asyncio.Queue()
+        shutdown = asyncio.Event()
+        pool = asyncio.create_task(
+            run_worker_pool(
+                "idle",
+                _blocking_worker(queue),
+                2,
+                shutdown,
+                max_size=4,
+                depth=queue.qsize,
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        shutdown.set()
+        await asyncio.wait_for(pool, timeout=0.1)
+        assert "idle" not in get_worker_pool_stats()